@@ -0,0 +1,7 @@
+"""Performance benchmarks for agent-skills.
+
+Run from ``packages/agent-skills``::
+
+    python -m benchmarks --output results.json
+    python -m benchmarks --baseline results.json --threshold 0.2
+"""
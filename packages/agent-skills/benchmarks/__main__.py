@@ -0,0 +1,78 @@
+"""Command-line entry point: ``python -m benchmarks``."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+
+from .harness import BenchmarkRun, compare, measure
+from .suite import BENCHMARKS, Context
+from .synthetic import TreeSpec
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("--skills", type=int, default=TreeSpec().skill_count)
+    parser.add_argument("--body-size", type=int, default=TreeSpec().body_size)
+    parser.add_argument("--depth", type=int, default=TreeSpec().resource_depth)
+    parser.add_argument("--files", type=int, default=TreeSpec().files_per_dir)
+    parser.add_argument("--file-size", type=int, default=TreeSpec().file_size)
+    parser.add_argument("--min-time", type=float, default=0.5)
+    parser.add_argument(
+        "-k", "--filter", default="", help="Run benchmarks whose name contains this"
+    )
+    parser.add_argument("--output", help="Write results as JSON")
+    parser.add_argument(
+        "--baseline", help="Compare against a previous JSON result file"
+    )
+    parser.add_argument(
+        "--threshold", type=float, default=0.2, help="Allowed relative slowdown"
+    )
+    args = parser.parse_args(argv)
+
+    spec = TreeSpec(
+        skill_count=args.skills,
+        body_size=args.body_size,
+        resource_depth=args.depth,
+        files_per_dir=args.files,
+        file_size=args.file_size,
+    )
+    run = BenchmarkRun(params=spec.model_dump())
+    ctx = Context(spec)
+    try:
+        print(f"{'benchmark':<34}{'iters':>8}{'median us':>12}{'p95 us':>12}")
+        for name, factory in BENCHMARKS.items():
+            if args.filter not in name:
+                continue
+            try:
+                func, setup = factory(ctx)
+            except ImportError as e:
+                print(f"{name:<34}skipped ({e})")
+                continue
+            result = measure(name, func, setup, min_time=args.min_time)
+            run.results[name] = result
+            print(
+                f"{name:<34}{result.iterations:>8}"
+                f"{result.median * 1e6:>12.1f}{result.p95 * 1e6:>12.1f}"
+            )
+    finally:
+        ctx.cleanup()
+
+    if args.output:
+        run.save(args.output)
+
+    if args.baseline:
+        regressions = compare(run, BenchmarkRun.load(args.baseline), args.threshold)
+        for r in regressions:
+            print(
+                f"REGRESSION {r.name}: {r.baseline * 1e6:.1f}us -> "
+                f"{r.current * 1e6:.1f}us ({r.ratio:.2f}x)"
+            )
+        if regressions:
+            return 1
+        print(f"No regressions beyond {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
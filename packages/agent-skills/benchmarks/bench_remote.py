@@ -0,0 +1,96 @@
+"""Compare FileSystemSkillRegistry with RemoteSkillRegistry.
+
+Measures per-call latency and multi-threaded throughput of activate_skill
+and read_resource against a filesystem registry and against a remote
+registry talking to an in-process SkillServer, with and without a trusted
+client cache.
+
+Usage::
+
+    python benchmarks/bench_remote.py [SKILLS_DIR] [--iterations N] [--threads N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from agent_skills import FileSystemSkillRegistry
+from agent_skills.registry import SkillRegistry
+from agent_skills.remote import RemoteSkillRegistry
+from agent_skills.server import SkillServer
+
+DEFAULT_SKILLS_DIR = Path(__file__).resolve().parents[3] / "skills"
+
+
+def _workload(registry: SkillRegistry) -> list[tuple]:
+    calls = []
+    for name in registry.skill_names:
+        calls.append((registry.activate_skill, (name,)))
+        for rtype, files in registry.list_resources(name).items():
+            calls.extend((registry.read_resource, (name, rtype, f)) for f in files)
+    return calls
+
+
+def measure_latency(registry: SkillRegistry, iterations: int) -> dict[str, float]:
+    calls = _workload(registry)
+    samples = []
+    for _ in range(iterations):
+        for func, args in calls:
+            start = time.perf_counter()
+            func(*args)
+            samples.append(time.perf_counter() - start)
+    samples.sort()
+    return {
+        "mean_us": statistics.fmean(samples) * 1e6,
+        "p50_us": samples[len(samples) // 2] * 1e6,
+        "p99_us": samples[int(len(samples) * 0.99)] * 1e6,
+    }
+
+
+def measure_throughput(registry: SkillRegistry, threads: int, iterations: int) -> float:
+    calls = _workload(registry)
+
+    def run() -> int:
+        for _ in range(iterations):
+            for func, args in calls:
+                func(*args)
+        return iterations * len(calls)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(threads) as pool:
+        total = sum(pool.map(lambda _: run(), range(threads)))
+    return total / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("skills_dir", nargs="?", default=DEFAULT_SKILLS_DIR)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--threads", type=int, default=8)
+    args = parser.parse_args()
+
+    fs_registry = FileSystemSkillRegistry()
+    fs_registry.load_skills_from_directory(args.skills_dir)
+
+    with SkillServer(fs_registry) as server:
+        registries = {
+            "filesystem": fs_registry,
+            "remote (revalidate)": RemoteSkillRegistry(server.url),
+            "remote (cached)": RemoteSkillRegistry(server.url, cache_ttl=3600),
+        }
+        print(f"{'registry':<22}{'mean us':>10}{'p50 us':>10}{'p99 us':>10}{'ops/s':>12}")
+        for label, registry in registries.items():
+            latency = measure_latency(registry, args.iterations)
+            ops = measure_throughput(registry, args.threads, args.iterations // 4 or 1)
+            print(
+                f"{label:<22}{latency['mean_us']:>10.1f}{latency['p50_us']:>10.1f}"
+                f"{latency['p99_us']:>10.1f}{ops:>12.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Memory versus latency of compressed in-memory storage.
+
+Loads a synthetic library into registries with different ``compresslevel``
+and ``hot_size`` settings, reads every body and resource once to fill the
+caches, then reports the memory held and the median latency of activating
+skills and reading resources in round-robin order (so a hot tier smaller
+than the working set keeps missing).
+
+Usage::
+
+    python -m benchmarks.compression [--skills N] [--levels 0 1 6 9]
+        [--hot-sizes 0 64 1024]
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import sys
+
+from agent_skills import FileSystemSkillRegistry
+
+from .harness import measure
+from .suite import Context
+from .synthetic import TreeSpec
+
+
+def _registry(ctx: Context, level: int, hot_size: int) -> FileSystemSkillRegistry:
+    registry = FileSystemSkillRegistry(
+        cache_resources=True, compresslevel=level, hot_size=hot_size
+    )
+    registry.load_skills_from_directory(ctx.skills_dir)
+    return registry
+
+
+def _round_robin(registry: FileSystemSkillRegistry) -> tuple:
+    names = registry.skill_names
+    resources = [
+        (name, rtype, path)
+        for name in names
+        for rtype, files in registry.list_resources(name).items()
+        for path in files
+    ]
+    activations = itertools.cycle(names)
+    reads = itertools.cycle(resources)
+    for name in names:
+        registry.activate_skill(name)
+    for request in resources:
+        registry.read_resource(*request)
+    return (
+        lambda: registry.activate_skill(next(activations)),
+        lambda: registry.read_resource(*next(reads)),
+    )
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.compression")
+    parser.add_argument("--skills", type=int, default=200)
+    parser.add_argument("--body-size", type=int, default=TreeSpec().body_size)
+    parser.add_argument("--file-size", type=int, default=TreeSpec().file_size)
+    parser.add_argument("--levels", type=int, nargs="+", default=[0, 1, 6, 9])
+    parser.add_argument("--hot-sizes", type=int, nargs="+", default=[0, 64, 1024])
+    parser.add_argument("--min-time", type=float, default=0.3)
+    args = parser.parse_args(argv)
+
+    spec = TreeSpec(
+        skill_count=args.skills, body_size=args.body_size, file_size=args.file_size
+    )
+    ctx = Context(spec)
+    try:
+        print(
+            f"{'level':>5}{'hot':>6}{'stored KiB':>12}{'hot KiB':>10}"
+            f"{'activate us':>13}{'read us':>10}"
+        )
+        for level in args.levels:
+            for hot_size in args.hot_sizes if level else [0]:
+                registry = _registry(ctx, level, hot_size)
+                activate, read = _round_robin(registry)
+                stored = registry.bodies.nbytes + registry.blobs.nbytes
+                hot = registry.bodies.hot_nbytes + registry.blobs.hot_nbytes
+                if not level:
+                    # Uncompressed bodies live on the Skill objects themselves.
+                    stored += sum(
+                        sys.getsizeof(registry.get_skill(n).instructions)
+                        for n in registry.skill_names
+                    )
+                a = measure("activate", activate, min_time=args.min_time)
+                r = measure("read", read, min_time=args.min_time)
+                print(
+                    f"{level:>5}{hot_size:>6}{stored / 1024:>12.0f}{hot / 1024:>10.0f}"
+                    f"{a.median * 1e6:>13.2f}{r.median * 1e6:>10.2f}"
+                )
+    finally:
+        ctx.cleanup()
+
+
+if __name__ == "__main__":
+    main()
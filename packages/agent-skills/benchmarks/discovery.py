@@ -0,0 +1,201 @@
+"""Filesystem calls made by skill discovery, on a simulated slow filesystem.
+
+Counts the filesystem calls Python makes (``stat``, ``lstat``, ``open``,
+``scandir``, ``listdir`` and ``DirEntry.stat``) while loading a synthetic
+library, and adds a fixed latency to each call to mimic a network
+filesystem, where every round trip dominates. Calls made internally by
+``open`` (``fstat``, ``ioctl``, ``lseek``) are not counted separately.
+
+Compares the previous per-skill ``iterdir``/``is_dir``/``is_file`` walk
+(``load_skill`` on each child) against ``load_skills_from_directory``, on
+a flat tree and on the same skills grouped into category folders.
+
+Usage::
+
+    python -m benchmarks.discovery [--skills N] [--latency-us 200]
+        [--per-category 10]
+"""
+
+from __future__ import annotations
+
+import argparse
+import builtins
+import io
+import os
+import time
+from collections import Counter
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+from agent_skills import FileSystemSkillRegistry
+
+from .suite import Context
+from .synthetic import TreeSpec
+
+
+class _Entry:
+    """``os.DirEntry`` proxy that counts the calls it makes."""
+
+    def __init__(self, entry: os.DirEntry, record: Callable[[str], None]) -> None:
+        self._entry = entry
+        self._record = record
+        self.name = entry.name
+        self.path = entry.path
+
+    def is_dir(self, *, follow_symlinks: bool = True) -> bool:
+        if follow_symlinks and self._entry.is_symlink():
+            self._record("stat")
+        return self._entry.is_dir(follow_symlinks=follow_symlinks)
+
+    def is_file(self, *, follow_symlinks: bool = True) -> bool:
+        if follow_symlinks and self._entry.is_symlink():
+            self._record("stat")
+        return self._entry.is_file(follow_symlinks=follow_symlinks)
+
+    def is_symlink(self) -> bool:
+        return self._entry.is_symlink()
+
+    def stat(self, *, follow_symlinks: bool = True) -> os.stat_result:
+        self._record("stat")
+        return self._entry.stat(follow_symlinks=follow_symlinks)
+
+    def inode(self) -> int:
+        return self._entry.inode()
+
+    def __fspath__(self) -> str:
+        return self.path
+
+
+class _Scandir:
+    def __init__(self, it, record: Callable[[str], None]) -> None:
+        self._it = it
+        self._record = record
+
+    def __iter__(self) -> Iterator[_Entry]:
+        return (_Entry(entry, self._record) for entry in self._it)
+
+    def __enter__(self) -> _Scandir:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._it.close()
+
+    def close(self) -> None:
+        self._it.close()
+
+
+@contextmanager
+def slow_filesystem(latency: float) -> Iterator[Counter]:
+    """Count filesystem calls by kind, sleeping ``latency`` seconds in each."""
+    counts: Counter = Counter()
+
+    def record(kind: str) -> None:
+        counts[kind] += 1
+        if latency:
+            time.sleep(latency)
+
+    def counting(kind: str, func: Callable) -> Callable:
+        def wrapper(*args, **kwargs):
+            record(kind)
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    originals = {
+        (os, "stat"): os.stat,
+        (os, "lstat"): os.lstat,
+        (os, "listdir"): os.listdir,
+        (os, "scandir"): os.scandir,
+        (os, "open"): os.open,
+        (io, "open"): io.open,
+        (builtins, "open"): builtins.open,
+    }
+    patched = {
+        (os, "stat"): counting("stat", os.stat),
+        (os, "lstat"): counting("lstat", os.lstat),
+        (os, "listdir"): counting("listdir", os.listdir),
+        (os, "scandir"): counting(
+            "scandir",
+            lambda *a, **kw: _Scandir(originals[os, "scandir"](*a, **kw), record),
+        ),
+        (os, "open"): counting("open", os.open),
+        (io, "open"): counting("open", io.open),
+        (builtins, "open"): counting("open", builtins.open),
+    }
+    for (module, name), func in patched.items():
+        setattr(module, name, func)
+    try:
+        yield counts
+    finally:
+        for (module, name), func in originals.items():
+            setattr(module, name, func)
+
+
+def _legacy_load(root: Path) -> list:
+    """The walk ``load_skills_from_directory`` did before discovery."""
+    registry = FileSystemSkillRegistry()
+    parent = root.resolve()
+    return [
+        registry.load_skill(child)
+        for child in sorted(parent.iterdir())
+        if child.is_dir() and (child / "SKILL.md").is_file()
+    ]
+
+
+def _categorize(flat: Path, nested: Path, per_category: int) -> Path:
+    nested.mkdir()
+    for i, skill_dir in enumerate(sorted(flat.iterdir())):
+        category = nested / f"category-{i // per_category:03d}"
+        category.mkdir(exist_ok=True)
+        skill_dir.rename(category / skill_dir.name)
+    return nested
+
+
+def _run(label: str, load: Callable[[], list], latency: float) -> None:
+    with slow_filesystem(latency) as counts:
+        start = time.perf_counter()
+        skills = load()
+        elapsed = time.perf_counter() - start
+    total = sum(counts.values())
+    detail = ", ".join(f"{k}={v}" for k, v in sorted(counts.items()))
+    print(
+        f"{label:<28}{len(skills):>7}{total:>8}{total / len(skills):>10.1f}"
+        f"{elapsed * 1e3:>10.0f}   {detail}"
+    )
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.discovery")
+    parser.add_argument("--skills", type=int, default=200)
+    parser.add_argument(
+        "--latency-us", type=float, default=200, help="Added to every call"
+    )
+    parser.add_argument("--per-category", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    ctx = Context(TreeSpec(skill_count=args.skills, body_size=500, file_size=100))
+    latency = args.latency_us / 1e6
+    try:
+        print(f"{'walk':<28}{'skills':>7}{'calls':>8}{'per skill':>10}{'ms':>10}")
+        flat = ctx.skills_dir
+        _run("legacy flat", lambda: _legacy_load(flat), latency)
+        _run(
+            "scandir flat",
+            lambda: FileSystemSkillRegistry().load_skills_from_directory(flat),
+            latency,
+        )
+        nested = _categorize(flat, ctx.workdir / "nested", args.per_category)
+        _run(
+            "scandir nested (depth 2)",
+            lambda: FileSystemSkillRegistry().load_skills_from_directory(
+                nested, max_depth=2
+            ),
+            latency,
+        )
+    finally:
+        ctx.cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Timing, result files and baseline comparison."""
+
+from __future__ import annotations
+
+import platform
+import statistics
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from pydantic import BaseModel
+
+
+class BenchmarkResult(BaseModel):
+    """Timing statistics for one benchmark, in seconds per call."""
+
+    name: str
+    iterations: int
+    mean: float
+    median: float
+    p95: float
+    minimum: float
+
+
+class BenchmarkRun(BaseModel):
+    """A complete, machine-readable benchmark run."""
+
+    version: int = 1
+    python: str = platform.python_version()
+    params: dict[str, object] = {}
+    results: dict[str, BenchmarkResult] = {}
+
+    def save(self, path: str | Path) -> None:
+        Path(path).write_text(self.model_dump_json(indent=2), encoding="utf-8")
+
+    @classmethod
+    def load(cls, path: str | Path) -> BenchmarkRun:
+        return cls.model_validate_json(Path(path).read_text(encoding="utf-8"))
+
+
+class Regression(BaseModel):
+    name: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline
+
+
+def measure(
+    name: str,
+    func: Callable[[], object],
+    setup: Callable[[], object] | None = None,
+    min_time: float = 0.5,
+    min_iterations: int = 5,
+    max_iterations: int = 10_000,
+) -> BenchmarkResult:
+    """Time ``func`` repeatedly until ``min_time`` seconds have been spent.
+
+    ``setup`` runs untimed before every call. One untimed warm-up call is
+    made first.
+    """
+    if setup:
+        setup()
+    func()
+
+    samples: list[float] = []
+    spent = 0.0
+    while len(samples) < max_iterations and (
+        spent < min_time or len(samples) < min_iterations
+    ):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        samples.append(elapsed)
+        spent += elapsed
+
+    samples.sort()
+    return BenchmarkResult(
+        name=name,
+        iterations=len(samples),
+        mean=statistics.fmean(samples),
+        median=statistics.median(samples),
+        p95=samples[min(len(samples) - 1, int(len(samples) * 0.95))],
+        minimum=samples[0],
+    )
+
+
+def compare(
+    current: BenchmarkRun, baseline: BenchmarkRun, threshold: float
+) -> list[Regression]:
+    """Return benchmarks whose median got slower than baseline by more than ``threshold``.
+
+    ``threshold`` is relative: 0.2 flags anything over 20% slower. Benchmarks
+    missing from either run are ignored.
+    """
+    regressions = []
+    for name, result in current.results.items():
+        base = baseline.results.get(name)
+        if base is None or base.median <= 0:
+            continue
+        if result.median > base.median * (1 + threshold):
+            regressions.append(
+                Regression(name=name, baseline=base.median, current=result.median)
+            )
+    return regressions
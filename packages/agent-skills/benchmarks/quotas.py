@@ -0,0 +1,121 @@
+"""Read latency of well-behaved sessions next to one that loops on large files.
+
+Runs ``--sessions`` threads that each read a small resource through
+``read_skill_resource`` and then pause briefly, plus one thread that reads a
+large resource back to back, pausing only after a throttled response
+(standing in for the model turn that reads it). Prints the latency percentiles
+of the well-behaved reads and how many of the large reads got through,
+without quotas and with a per-session ``ResourceQuota`` under a shared
+parent.
+
+Usage::
+
+    python -m benchmarks.quotas [--sessions 8] [--seconds 3]
+        [--large-mb 8] [--session-mbps 16]
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import threading
+import time
+
+from agent_skills import FileSystemSkillRegistry, ResourceQuota, SkillTools
+
+from .suite import Context
+from .synthetic import TreeSpec, skill_name
+
+
+def _run(
+    registry: FileSystemSkillRegistry,
+    sessions: int,
+    seconds: float,
+    quota: dict | None,
+    shared: ResourceQuota | None,
+) -> tuple[list[float], int, int]:
+    stop = time.perf_counter() + seconds
+    latencies: list[float] = []
+    counts = {"large": 0, "throttled": 0}
+    lock = threading.Lock()
+
+    def session_tools() -> SkillTools:
+        if quota is None:
+            return SkillTools(registry)
+        return SkillTools(registry, quota=ResourceQuota(**quota, parent=shared))
+
+    def well_behaved(index: int) -> None:
+        tools = session_tools()
+        name = skill_name(index % len(registry))
+        while time.perf_counter() < stop:
+            start = time.perf_counter()
+            tools.read_skill_resource(name, "assets", "asset-0.txt")
+            elapsed = time.perf_counter() - start
+            with lock:
+                latencies.append(elapsed)
+            time.sleep(0.005)
+
+    def abusive() -> None:
+        tools = session_tools()
+        while time.perf_counter() < stop:
+            result = tools.read_skill_resource(skill_name(0), "references", "big.md")
+            if result.startswith("Throttled:"):
+                counts["throttled"] += 1
+                time.sleep(0.005)  # the model's next turn
+            else:
+                counts["large"] += 1
+
+    threads = [
+        threading.Thread(target=well_behaved, args=(i,)) for i in range(sessions)
+    ]
+    threads.append(threading.Thread(target=abusive))
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return latencies, counts["large"], counts["throttled"]
+
+
+def _print(label: str, latencies: list[float], large: int, throttled: int) -> None:
+    q = statistics.quantiles(latencies, n=100)
+    print(
+        f"{label:<12}{len(latencies):>8}{q[49] * 1e3:>9.2f}{q[98] * 1e3:>9.2f}"
+        f"{max(latencies) * 1e3:>9.2f}{large:>8}{throttled:>11}"
+    )
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.quotas")
+    parser.add_argument("--sessions", type=int, default=8)
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--large-mb", type=float, default=8.0)
+    parser.add_argument("--session-mbps", type=float, default=16.0)
+    args = parser.parse_args(argv)
+
+    ctx = Context(TreeSpec(skill_count=max(args.sessions, 1), body_size=500))
+    try:
+        big = ctx.skills_dir / skill_name(0) / "references" / "big.md"
+        big.write_text("x" * int(args.large_mb * 2**20), encoding="utf-8")
+        registry = FileSystemSkillRegistry()
+        registry.load_skills_from_directory(ctx.skills_dir)
+
+        quota = {
+            "calls_per_second": 200,
+            "bytes_per_second": args.session_mbps * 2**20,
+            "max_wait": 0.05,
+        }
+        shared = ResourceQuota(
+            bytes_per_second=4 * args.session_mbps * 2**20, name="global"
+        )
+        print(
+            f"{'quota':<12}{'reads':>8}{'p50 ms':>9}{'p99 ms':>9}{'max ms':>9}"
+            f"{'large':>8}{'throttled':>11}"
+        )
+        _print("none", *_run(registry, args.sessions, args.seconds, None, None))
+        _print("session", *_run(registry, args.sessions, args.seconds, quota, shared))
+    finally:
+        ctx.cleanup()
+
+
+if __name__ == "__main__":
+    main()
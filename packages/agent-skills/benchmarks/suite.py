@@ -0,0 +1,236 @@
+"""Benchmark definitions.
+
+Each benchmark is a factory registered with ``@benchmark(name)``. It receives
+the shared ``Context`` and returns the callable to time, plus an optional
+untimed setup callable.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+import tempfile
+from collections.abc import Callable
+from functools import cached_property
+from pathlib import Path
+
+from agent_skills import FileSystemSkillRegistry, parse_skill, render_system_prompt
+
+from .synthetic import TreeSpec, generate_personas, generate_skill_tree, skill_name
+
+Case = tuple[Callable[[], object], Callable[[], object] | None]
+
+BENCHMARKS: dict[str, Callable[[Context], Case]] = {}
+
+
+def benchmark(
+    name: str,
+) -> Callable[[Callable[[Context], Case]], Callable[[Context], Case]]:
+    def register(factory: Callable[[Context], Case]) -> Callable[[Context], Case]:
+        BENCHMARKS[name] = factory
+        return factory
+
+    return register
+
+
+class Context:
+    """Synthetic data shared by all benchmarks of one run."""
+
+    def __init__(self, spec: TreeSpec, workdir: str | Path | None = None) -> None:
+        self.spec = spec
+        self._tmp = None
+        if workdir is None:
+            self._tmp = tempfile.TemporaryDirectory(prefix="agent-skills-bench-")
+            workdir = self._tmp.name
+        self.workdir = Path(workdir)
+        self.skills_dir = generate_skill_tree(self.workdir / "skills", spec)
+
+    @cached_property
+    def registry(self) -> FileSystemSkillRegistry:
+        registry = FileSystemSkillRegistry()
+        registry.load_skills_from_directory(self.skills_dir)
+        return registry
+
+    @property
+    def first_skill(self) -> str:
+        return skill_name(0)
+
+    def cleanup(self) -> None:
+        if self._tmp is not None:
+            self._tmp.cleanup()
+
+
+@benchmark("load_skills_from_directory")
+def _load(ctx: Context) -> Case:
+    return (
+        lambda: FileSystemSkillRegistry().load_skills_from_directory(ctx.skills_dir),
+        None,
+    )
+
+
+@benchmark("load_snapshot")
+def _load_snapshot(ctx: Context) -> Case:
+    """Startup from a snapshot; compare with load_skills_from_directory."""
+    path = ctx.registry.save_snapshot(ctx.workdir / "registry.snapshot")
+    return lambda: FileSystemSkillRegistry.load_snapshot(path), None
+
+
+@benchmark("parse_skill")
+def _parse(ctx: Context) -> Case:
+    path = ctx.skills_dir / ctx.first_skill
+    return lambda: parse_skill(path), None
+
+
+def _frontmatter_blocks(ctx: Context) -> list[str]:
+    return [
+        path.read_text(encoding="utf-8").split("---", 2)[1]
+        for path in sorted(ctx.skills_dir.glob("*/SKILL.md"))
+    ]
+
+
+@benchmark("load_frontmatter_all")
+def _load_frontmatter(ctx: Context) -> Case:
+    from agent_skills.frontmatter import load_frontmatter
+
+    blocks = _frontmatter_blocks(ctx)
+    return lambda: [load_frontmatter(b) for b in blocks], None
+
+
+@benchmark("yaml_safe_load_all")
+def _yaml_safe_load(ctx: Context) -> Case:
+    """Baseline for ``load_frontmatter_all``: the pure-Python YAML loader."""
+    import yaml
+
+    blocks = _frontmatter_blocks(ctx)
+    return lambda: [yaml.safe_load(b) for b in blocks], None
+
+
+@benchmark("render_system_prompt")
+def _render(ctx: Context) -> Case:
+    metadata = ctx.registry.list_skills()
+    return lambda: render_system_prompt("You are a benchmark.", metadata), None
+
+
+@benchmark("list_files")
+def _list_files(ctx: Context) -> Case:
+    resources = ctx.registry.get_skill(ctx.first_skill).resources
+    return lambda: resources.list_files("references"), None
+
+
+@benchmark("read_resource")
+def _read_resource(ctx: Context) -> Case:
+    name = ctx.first_skill
+    return lambda: ctx.registry.read_resource(name, "references", "ref-0-0.md"), None
+
+
+@benchmark("read_resource_cached")
+def _read_resource_cached(ctx: Context) -> Case:
+    registry = FileSystemSkillRegistry(cache_resources=True)
+    registry.load_skills_from_directory(ctx.skills_dir)
+    name = ctx.first_skill
+    return lambda: registry.read_resource(name, "references", "ref-0-0.md"), None
+
+
+@benchmark("read_resource_cached_compressed")
+def _read_resource_cached_compressed(ctx: Context) -> Case:
+    """Worst case: every read decompresses (no hot tier)."""
+    registry = FileSystemSkillRegistry(
+        cache_resources=True, compresslevel=6, hot_size=0
+    )
+    registry.load_skills_from_directory(ctx.skills_dir)
+    name = ctx.first_skill
+    return lambda: registry.read_resource(name, "references", "ref-0-0.md"), None
+
+
+@benchmark("read_all_references")
+def _read_all_references(ctx: Context) -> Case:
+    """What an agent does without search: read every reference of a skill."""
+    name = ctx.first_skill
+    files = ctx.registry.list_resources(name)["references"]
+    requests = [(name, "references", f) for f in files]
+    return lambda: ctx.registry.read_resources(requests), None
+
+
+@benchmark("search_resources")
+def _search_resources(ctx: Context) -> Case:
+    """One ranked search over the whole library, with the index built."""
+    registry = FileSystemSkillRegistry(index_resources=True)
+    registry.load_skills_from_directory(ctx.skills_dir)
+    name = ctx.first_skill
+    term = registry.read_resource(name, "references", "ref-0-0.md").split()[0]
+    return lambda: registry.search_resources(term, name), None
+
+
+@benchmark("activate_skill")
+def _activate(ctx: Context) -> Case:
+    name = ctx.first_skill
+    return lambda: ctx.registry.activate_skill(name), None
+
+
+@benchmark("activate_skill_compressed")
+def _activate_compressed(ctx: Context) -> Case:
+    """Worst case: every activation decompresses the body (no hot tier)."""
+    registry = FileSystemSkillRegistry(compresslevel=6, hot_size=0)
+    registry.load_skills_from_directory(ctx.skills_dir)
+    name = ctx.first_skill
+    return lambda: registry.activate_skill(name), None
+
+
+@benchmark("get_tools")
+def _get_tools(ctx: Context) -> Case:
+    """Per-session cost of binding the skill tools to a registry."""
+    ctx.registry.get_tools()  # import strands and build the specs
+    return lambda: ctx.registry.get_tools(), None
+
+
+@benchmark("scoped_get_tools")
+def _scoped_get_tools(ctx: Context) -> Case:
+    """Per-session cost of a five-skill view with its own tools."""
+    names = ctx.registry.skill_names[:5]
+    ctx.registry.get_tools()
+    return lambda: ctx.registry.scoped(names).get_tools(), None
+
+
+@benchmark("run_skill_script")
+def _run_skill_script(ctx: Context) -> Case:
+    name = ctx.first_skill
+    ctx.registry.run_skill_script(name, "run.py")  # start the shared pool
+    return lambda: ctx.registry.run_skill_script(name, "run.py"), None
+
+
+@benchmark("run_skill_script_memoized")
+def _run_skill_script_memoized(ctx: Context) -> Case:
+    name = ctx.first_skill
+    ctx.registry.run_skill_script(name, "run.py", memoize=True)
+    return lambda: ctx.registry.run_skill_script(name, "run.py", memoize=True), None
+
+
+@benchmark("spawn_python_script")
+def _spawn_python_script(ctx: Context) -> Case:
+    """Baseline for run_skill_script: a fresh interpreter per run."""
+    script = ctx.skills_dir / ctx.first_skill / "scripts" / "run.py"
+    return lambda: subprocess.run([sys.executable, script], capture_output=True), None
+
+
+def _persona_repository(ctx: Context):
+    from personas import PersonaRepository
+
+    data_dir = generate_personas(
+        ctx.workdir / "personas", ctx.spec, persona_count=50, skills_per_persona=5
+    )
+    return PersonaRepository(ctx.registry, str(data_dir))
+
+
+@benchmark("get_persona")
+def _get_persona(ctx: Context) -> Case:
+    repo = _persona_repository(ctx)
+    name = repo.list_personas()[0]
+    first_skill = repo.store.get(name).skill_names[0]
+    return lambda: repo.get_persona(name), lambda: repo.invalidate_skill(first_skill)
+
+
+@benchmark("get_persona_cached")
+def _get_persona_cached(ctx: Context) -> Case:
+    repo = _persona_repository(ctx)
+    name = repo.list_personas()[0]
+    return lambda: repo.get_persona(name), None
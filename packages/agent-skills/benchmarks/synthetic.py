@@ -0,0 +1,117 @@
+"""Synthetic skill-tree generator for benchmarks."""
+
+from __future__ import annotations
+
+import json
+import random
+from pathlib import Path
+
+from pydantic import BaseModel, Field
+
+_WORDS = (
+    "agent skill spec requirement review clarify template reference asset "
+    "script workflow validate parse render activate resource context token "
+    "prompt instruction metadata description library catalog registry"
+).split()
+
+
+class TreeSpec(BaseModel):
+    """Shape of a generated skill library."""
+
+    skill_count: int = Field(default=100, ge=1)
+    body_size: int = Field(default=4000, ge=0, description="SKILL.md body bytes")
+    resource_depth: int = Field(
+        default=2, ge=0, description="Nesting under references/"
+    )
+    files_per_dir: int = Field(default=3, ge=0)
+    file_size: int = Field(default=2000, ge=0, description="Bytes per resource file")
+    seed: int = 0
+
+
+def _text(rng: random.Random, size: int) -> str:
+    words: list[str] = []
+    length = 0
+    while length < size:
+        word = rng.choice(_WORDS)
+        words.append(word)
+        length += len(word) + 1
+    lines = [" ".join(words[i : i + 12]) for i in range(0, len(words), 12)]
+    return "\n".join(lines)[:size]
+
+
+def skill_name(index: int) -> str:
+    return f"skill-{index:05d}"
+
+
+def generate_skill_tree(root: str | Path, spec: TreeSpec = TreeSpec()) -> Path:
+    """Write ``spec.skill_count`` skills under ``root`` and return ``root``.
+
+    Each skill gets a SKILL.md with full frontmatter, a ``scripts/`` file,
+    an ``assets/`` directory and a ``references/`` tree nested
+    ``resource_depth`` levels deep with ``files_per_dir`` files per level.
+    """
+    root = Path(root)
+    root.mkdir(parents=True, exist_ok=True)
+    rng = random.Random(spec.seed)
+
+    for i in range(spec.skill_count):
+        name = skill_name(i)
+        skill_dir = root / name
+        skill_dir.mkdir()
+        (skill_dir / "SKILL.md").write_text(
+            "---\n"
+            f"name: {name}\n"
+            f"description: Synthetic skill {i} for {' '.join(rng.sample(_WORDS, 6))}.\n"
+            "license: Apache-2.0\n"
+            "metadata:\n"
+            "  author: benchmarks\n"
+            '  version: "1.0"\n'
+            "allowed-tools: Read Bash(git:*)\n"
+            "---\n\n"
+            f"# {name}\n\n{_text(rng, spec.body_size)}\n",
+            encoding="utf-8",
+        )
+
+        scripts = skill_dir / "scripts"
+        scripts.mkdir()
+        (scripts / "run.py").write_text("print('hello')\n", encoding="utf-8")
+
+        level = skill_dir / "references"
+        for depth in range(spec.resource_depth + 1):
+            level.mkdir()
+            for f in range(spec.files_per_dir):
+                (level / f"ref-{depth}-{f}.md").write_text(
+                    _text(rng, spec.file_size), encoding="utf-8"
+                )
+            level = level / f"level-{depth + 1}"
+
+        assets = skill_dir / "assets"
+        assets.mkdir()
+        for f in range(spec.files_per_dir):
+            (assets / f"asset-{f}.txt").write_text(
+                _text(rng, spec.file_size), encoding="utf-8"
+            )
+
+    return root
+
+
+def generate_personas(
+    data_dir: str | Path, spec: TreeSpec, persona_count: int, skills_per_persona: int
+) -> Path:
+    """Write a ``personas.json`` referencing skills from a generated tree."""
+    data_dir = Path(data_dir)
+    data_dir.mkdir(parents=True, exist_ok=True)
+    rng = random.Random(spec.seed)
+    records = {}
+    for i in range(persona_count):
+        name = f"persona-{i:05d}"
+        picks = rng.sample(
+            range(spec.skill_count), min(skills_per_persona, spec.skill_count)
+        )
+        records[name] = {
+            "name": name,
+            "sys_prompt": f"You are synthetic persona {i}.",
+            "skill_names": [skill_name(p) for p in picks],
+        }
+    (data_dir / "personas.json").write_text(json.dumps(records), encoding="utf-8")
+    return data_dir
@@ -1,19 +1,109 @@
-"""Agent Skills specification as Strands Agents tools."""
-
-from .models import Skill, SkillMetadata, SkillResources
-from .parser import parse_skill
-from .prompt import SKILLS_SYSTEM_PROMPT_TEMPLATE, render_system_prompt
-from .registry import FileSystemSkillRegistry, SkillRegistry
-from .validation import validate_skill_directory
-
-__all__ = [
-    "FileSystemSkillRegistry",
-    "Skill",
-    "SkillMetadata",
-    "SkillResources",
-    "SkillRegistry",
-    "parse_skill",
-    "validate_skill_directory",
-    "render_system_prompt",
-    "SKILLS_SYSTEM_PROMPT_TEMPLATE",
-]
+"""Agent Skills specification as Strands Agents tools.
+
+Public names are imported lazily on first access, so importing the package
+does not pull in pydantic, PyYAML or strands until they are actually needed.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .categories import Category, CategoryTree, skill_category
+    from .discovery import SkillLocation, discover_skills
+    from .instrumentation import (
+        InMemoryRecorder,
+        Instrumentation,
+        OpenTelemetryInstrumentation,
+        get_instrumentation,
+        set_instrumentation,
+    )
+    from .ledger import ContextLedger
+    from .models import (
+        ScriptResult,
+        SearchHit,
+        SearchMatch,
+        Skill,
+        SkillMetadata,
+        SkillResources,
+    )
+    from .parser import parse_skill
+    from .prompt import (
+        SKILLS_SYSTEM_PROMPT_TEMPLATE,
+        CacheablePrompt,
+        render_cacheable_prompt,
+        render_system_prompt,
+    )
+    from .quotas import ResourceQuota, ThrottledError
+    from .registry import FileSystemSkillRegistry, SkillRegistry
+    from .remote import RemoteSkillRegistry
+    from .scripts import ScriptPool, get_script_pool
+    from .search import ResourceIndex
+    from .server import SkillServer
+    from .sessions import SkillSession
+    from .shared import SharedSkillRegistry, publish_catalog, write_catalog
+    from .tools import SkillTools, create_skill_tools
+    from .usage import UsageProfile
+    from .views import ScopedSkillRegistry
+    from .validation import validate_skill_directory
+    from .versions import skill_version
+
+_EXPORTS = {
+    "FileSystemSkillRegistry": "registry",
+    "Skill": "models",
+    "SkillMetadata": "models",
+    "SkillResources": "models",
+    "ScriptResult": "models",
+    "SearchHit": "models",
+    "SearchMatch": "models",
+    "ResourceIndex": "search",
+    "SkillRegistry": "registry",
+    "ScopedSkillRegistry": "views",
+    "SkillSession": "sessions",
+    "skill_version": "versions",
+    "UsageProfile": "usage",
+    "ContextLedger": "ledger",
+    "RemoteSkillRegistry": "remote",
+    "ResourceQuota": "quotas",
+    "ThrottledError": "quotas",
+    "ScriptPool": "scripts",
+    "get_script_pool": "scripts",
+    "SkillServer": "server",
+    "SharedSkillRegistry": "shared",
+    "publish_catalog": "shared",
+    "write_catalog": "shared",
+    "SkillTools": "tools",
+    "create_skill_tools": "tools",
+    "parse_skill": "parser",
+    "Category": "categories",
+    "CategoryTree": "categories",
+    "skill_category": "categories",
+    "discover_skills": "discovery",
+    "SkillLocation": "discovery",
+    "validate_skill_directory": "validation",
+    "render_system_prompt": "prompt",
+    "SKILLS_SYSTEM_PROMPT_TEMPLATE": "prompt",
+    "CacheablePrompt": "prompt",
+    "render_cacheable_prompt": "prompt",
+    "Instrumentation": "instrumentation",
+    "InMemoryRecorder": "instrumentation",
+    "OpenTelemetryInstrumentation": "instrumentation",
+    "get_instrumentation": "instrumentation",
+    "set_instrumentation": "instrumentation",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> object:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
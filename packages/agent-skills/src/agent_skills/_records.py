@@ -0,0 +1,52 @@
+"""Plain-dict encoding of skills for catalogs, snapshots and the wire.
+
+Records are produced from already validated skills, so decoding uses
+``model_construct`` and skips pydantic validation.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from .models import RESOURCE_TYPES, Skill, SkillMetadata, SkillResources
+
+
+def dump_skill_record(skill: Skill) -> dict:
+    """Encode a skill's metadata, location and resource directories."""
+    resource_dirs = {
+        rtype: getattr(skill.resources, f"{rtype}_dir") for rtype in RESOURCE_TYPES
+    }
+    return {
+        "metadata": skill.metadata.model_dump(),
+        "path": str(skill.path),
+        "references": list(skill.references),
+        "resources": {
+            rtype: str(d) if d is not None else None
+            for rtype, d in resource_dirs.items()
+        },
+    }
+
+
+def load_skill_metadata(data: dict) -> SkillMetadata:
+    """Decode metadata produced by ``SkillMetadata.model_dump``."""
+    return SkillMetadata.model_construct(**data)
+
+
+def load_skill_record(
+    record: dict, instructions: str, metadata: SkillMetadata | None = None
+) -> Skill:
+    """Decode a record produced by ``dump_skill_record``."""
+    resources = record["resources"]
+    return Skill.model_construct(
+        metadata=metadata or load_skill_metadata(record["metadata"]),
+        instructions=instructions,
+        resources=SkillResources.model_construct(
+            **{
+                f"{rtype}_dir": Path(resources[rtype]) if resources[rtype] else None
+                for rtype in RESOURCE_TYPES
+            }
+        ),
+        path=Path(record["path"]),
+        activated=False,
+        references=record.get("references", []),
+    )
@@ -0,0 +1,199 @@
+"""Worker process for ``ScriptPool``; standard library only.
+
+Reads one JSON request per line on stdin and writes one JSON result per line
+on stdout. Python scripts run in a forked copy of this already started
+interpreter (with any preloaded modules), which skips interpreter startup;
+other scripts are spawned. Every script runs in its own session so that it
+and its children can be killed together when it times out.
+
+Usage: python _script_worker.py [MODULE ...]   # modules to preload
+"""
+
+from __future__ import annotations
+
+import importlib
+import json
+import os
+import runpy
+import selectors
+import signal
+import subprocess
+import sys
+import time
+import traceback
+
+_CAN_FORK = hasattr(os, "fork")
+
+
+def main() -> None:
+    for module in sys.argv[1:]:
+        importlib.import_module(module)
+    protocol = sys.stdout
+    for line in sys.stdin:
+        request = json.loads(line)
+        try:
+            result = run(**request)
+        except OSError as e:
+            result = {"error": f"Cannot run {request['path']}: {e}"}
+        protocol.write(json.dumps(result) + "\n")
+        protocol.flush()
+
+
+def run(path: str, args: list[str], cwd: str, timeout: float, max_output: int) -> dict:
+    start = time.monotonic()
+    if path.endswith(".py") and _CAN_FORK:
+        pid, out_fd, err_fd = _fork_python(path, args, cwd)
+        kill = lambda: _killpg(pid)  # noqa: E731
+
+        def wait(timeout: float | None) -> int | None:
+            return _waitpid(pid, timeout)
+
+    else:
+        proc = subprocess.Popen(
+            _command(path, args),
+            cwd=cwd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            start_new_session=_CAN_FORK,
+        )
+        out_fd, err_fd = proc.stdout.fileno(), proc.stderr.fileno()
+        kill = (lambda: _killpg(proc.pid)) if _CAN_FORK else proc.kill
+
+        def wait(timeout: float | None) -> int | None:
+            try:
+                return proc.wait(timeout)
+            except subprocess.TimeoutExpired:
+                return None
+
+    try:
+        outputs, truncated, timed_out = _collect(
+            (out_fd, err_fd), start + timeout, max_output, kill
+        )
+        exit_code = None
+        if not timed_out:
+            # The script may close its output and keep running.
+            exit_code = wait(max(0.0, start + timeout - time.monotonic()))
+            if exit_code is None:
+                kill()
+                timed_out = True
+        if timed_out:
+            wait(None)
+    finally:
+        if _CAN_FORK and path.endswith(".py"):
+            os.close(out_fd)
+            os.close(err_fd)
+        else:
+            proc.stdout.close()
+            proc.stderr.close()
+    return {
+        "exit_code": None if timed_out else exit_code,
+        "stdout": outputs[0].decode("utf-8", errors="replace"),
+        "stderr": outputs[1].decode("utf-8", errors="replace"),
+        "timed_out": timed_out,
+        "truncated": truncated,
+        "duration": time.monotonic() - start,
+    }
+
+
+def _command(path: str, args: list[str]) -> list[str]:
+    if path.endswith(".py"):
+        return [sys.executable, path, *args]
+    if os.access(path, os.X_OK):
+        return [path, *args]
+    if path.endswith(".sh"):
+        return ["sh", path, *args]
+    return [path, *args]
+
+
+def _fork_python(path: str, args: list[str], cwd: str) -> tuple[int, int, int]:
+    out_r, out_w = os.pipe()
+    err_r, err_w = os.pipe()
+    sys.stdout.flush()
+    sys.stderr.flush()
+    pid = os.fork()
+    if pid:
+        os.close(out_w)
+        os.close(err_w)
+        return pid, out_r, err_r
+
+    code = 1
+    try:
+        os.setsid()
+        devnull = os.open(os.devnull, os.O_RDONLY)
+        os.dup2(devnull, 0)
+        os.dup2(out_w, 1)
+        os.dup2(err_w, 2)
+        for fd in (devnull, out_r, out_w, err_r, err_w):
+            os.close(fd)
+        sys.stdin = open(os.devnull)
+        os.chdir(cwd)
+        sys.argv = [path, *args]
+        sys.path[0] = os.path.dirname(path)
+        try:
+            runpy.run_path(path, run_name="__main__")
+            code = 0
+        except SystemExit as e:
+            if e.code is None or isinstance(e.code, int):
+                code = e.code or 0
+            else:
+                print(e.code, file=sys.stderr)
+        except BaseException:
+            traceback.print_exc()
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(code)
+
+
+def _collect(
+    fds: tuple[int, int], deadline: float, max_output: int, kill
+) -> tuple[list[bytes], bool, bool]:
+    """Read both pipes to EOF, keeping at most ``max_output`` bytes of each."""
+    buffers = {fd: bytearray() for fd in fds}
+    truncated = False
+    with selectors.DefaultSelector() as selector:
+        for fd in fds:
+            selector.register(fd, selectors.EVENT_READ)
+        while selector.get_map():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                kill()
+                return [bytes(buffers[fd]) for fd in fds], truncated, True
+            for key, _ in selector.select(remaining):
+                chunk = os.read(key.fd, 65536)
+                if not chunk:
+                    selector.unregister(key.fd)
+                    continue
+                buffer = buffers[key.fd]
+                room = max_output - len(buffer)
+                if len(chunk) > room:
+                    truncated = True
+                buffer += chunk[: max(room, 0)]
+    return [bytes(buffers[fd]) for fd in fds], truncated, False
+
+
+def _waitpid(pid: int, timeout: float | None) -> int | None:
+    """Exit code of ``pid``, or None if it still runs after ``timeout`` seconds."""
+    if timeout is None:
+        return os.waitstatus_to_exitcode(os.waitpid(pid, 0)[1])
+    deadline = time.monotonic() + timeout
+    while True:
+        done, status = os.waitpid(pid, os.WNOHANG)
+        if done:
+            return os.waitstatus_to_exitcode(status)
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+        time.sleep(min(remaining, 0.005))
+
+
+def _killpg(pid: int) -> None:
+    try:
+        os.killpg(pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+
+
+if __name__ == "__main__":
+    main()
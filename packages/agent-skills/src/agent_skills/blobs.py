@@ -0,0 +1,114 @@
+"""Content-addressed storage for resource contents.
+
+Skills in one library often ship identical files (shared templates,
+licenses, style guides). Caches and catalogs key contents by digest so each
+unique blob is held once no matter how many skills reference it. Blobs can
+also be kept zlib-compressed, with a small tier of decompressed copies for
+the most recently used ones.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import sys
+import threading
+import zlib
+from collections import OrderedDict
+
+
+def content_digest(content: str) -> str:
+    """Return the SHA-256 hex digest of a resource's UTF-8 encoded contents.
+
+    Digests are taken over the text as returned by ``read_resource``, so they
+    agree across registry implementations.
+    """
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+class BlobStore:
+    """Thread-safe, reference-counted map of digest to contents.
+
+    Uncompressed, ``add`` returns the canonical string for a digest, so
+    callers holding the result share one object per unique blob. A blob is
+    dropped when its last reference is released.
+
+    Args:
+        compresslevel: zlib level (1-9) for stored blobs; 0 stores plain
+            strings. Compressed blobs are decompressed on access.
+        hot_size: Number of decompressed blobs kept, most recently used
+            first, so repeated reads skip decompression. Ignored when
+            ``compresslevel`` is 0.
+    """
+
+    def __init__(self, compresslevel: int = 0, hot_size: int = 64) -> None:
+        self.compresslevel = compresslevel
+        self.hot_size = hot_size
+        self._lock = threading.Lock()
+        self._blobs: dict[str, str | bytes] = {}
+        self._refs: dict[str, int] = {}
+        self._hot: OrderedDict[str, str] = OrderedDict()
+        self._nbytes = 0
+
+    def add(self, content: str, digest: str | None = None) -> tuple[str, str]:
+        """Add a reference to ``content`` and return ``(digest, canonical)``."""
+        digest = digest or content_digest(content)
+        with self._lock:
+            stored = self._blobs.get(digest)
+            if stored is None:
+                stored = self._encode(content)
+                self._blobs[digest] = stored
+                self._nbytes += sys.getsizeof(stored)
+            self._refs[digest] = self._refs.get(digest, 0) + 1
+        return digest, stored if isinstance(stored, str) else content
+
+    def get(self, digest: str) -> str | None:
+        """Return the contents for a digest, or None if not stored."""
+        stored = self._blobs.get(digest)
+        if stored is None or isinstance(stored, str):
+            return stored
+        with self._lock:
+            content = self._hot.get(digest)
+            if content is not None:
+                self._hot.move_to_end(digest)
+                return content
+        content = zlib.decompress(stored).decode("utf-8")
+        if self.hot_size > 0:
+            with self._lock:
+                if digest in self._blobs:
+                    self._hot[digest] = content
+                    while len(self._hot) > self.hot_size:
+                        self._hot.popitem(last=False)
+        return content
+
+    def release(self, digest: str) -> None:
+        """Drop one reference; the blob is removed with its last reference."""
+        with self._lock:
+            refs = self._refs.get(digest, 0) - 1
+            if refs > 0:
+                self._refs[digest] = refs
+            elif digest in self._refs:
+                del self._refs[digest]
+                self._hot.pop(digest, None)
+                self._nbytes -= sys.getsizeof(self._blobs.pop(digest))
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory held by the stored blobs, excluding the hot tier."""
+        return self._nbytes
+
+    @property
+    def hot_nbytes(self) -> int:
+        """Approximate memory held by the decompressed hot tier."""
+        with self._lock:
+            return sum(sys.getsizeof(content) for content in self._hot.values())
+
+    def _encode(self, content: str) -> str | bytes:
+        if not self.compresslevel:
+            return content
+        return zlib.compress(content.encode("utf-8"), self.compresslevel)
+
+    def __len__(self) -> int:
+        return len(self._blobs)
+
+    def __contains__(self, digest: str) -> bool:
+        return digest in self._blobs
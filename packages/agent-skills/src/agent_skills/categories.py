@@ -0,0 +1,148 @@
+"""Category hierarchy over a skill library.
+
+A skill's category is the ``/``-separated path in its frontmatter
+``metadata: {category: ...}``; skills discovered in nested category folders
+get the folder path there when they do not declare one. Large libraries are
+presented one level at a time: the root's own skills plus a short summary of
+each top-level category, with one branch expanded on request. An agent
+drilling down to a skill reads a few short lists instead of the whole
+library.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .models import SkillMetadata
+
+# Skill names quoted in a generated category summary.
+SUMMARY_EXAMPLES = 3
+
+
+def skill_category(metadata: SkillMetadata) -> str:
+    """Normalized category path of a skill; empty for uncategorized skills."""
+    return normalize_category((metadata.metadata or {}).get("category", ""))
+
+
+def normalize_category(path: str) -> str:
+    """Strip blanks and empty components: ``" /a/ b/"`` becomes ``"a/b"``."""
+    return "/".join(part for part in map(str.strip, path.split("/")) if part)
+
+
+@dataclass(frozen=True)
+class Category:
+    """One node of a ``CategoryTree``.
+
+    Attributes:
+        path: Full category path, e.g. ``engineering/backend``; empty for
+            the root.
+        summary: One line describing the category's contents.
+        skill_count: Skills in the category and all its subcategories.
+        skills: Names of the skills directly in the category, sorted.
+        children: Paths of the direct subcategories, sorted.
+    """
+
+    path: str
+    summary: str
+    skill_count: int
+    skills: tuple[str, ...]
+    children: tuple[str, ...]
+
+    @property
+    def name(self) -> str:
+        """Last component of the path."""
+        return self.path.rpartition("/")[2]
+
+
+class CategoryTree:
+    """Categories of a set of skills, with summaries computed up front."""
+
+    def __init__(self, skills: Iterable[SkillMetadata]) -> None:
+        self._metadata: dict[str, SkillMetadata] = {}
+        direct: dict[str, list[str]] = {"": []}
+        children: dict[str, set[str]] = {"": set()}
+        for metadata in skills:
+            self._metadata[metadata.name] = metadata
+            path = skill_category(metadata)
+            direct.setdefault(path, []).append(metadata.name)
+            # Register every ancestor so intermediate categories exist.
+            while path:
+                parent = path.rpartition("/")[0]
+                children.setdefault(path, set())
+                direct.setdefault(path, [])
+                children.setdefault(parent, set()).add(path)
+                path = parent
+
+        self._categories: dict[str, Category] = {}
+        self._build("", direct, children)
+
+    def _build(
+        self, path: str, direct: dict[str, list[str]], children: dict[str, set[str]]
+    ) -> Category:
+        subcategories = [
+            self._build(c, direct, children) for c in sorted(children[path])
+        ]
+        skills = tuple(sorted(direct[path]))
+        count = len(skills) + sum(c.skill_count for c in subcategories)
+        examples = list(skills[:SUMMARY_EXAMPLES])
+        for sub in subcategories:
+            if len(examples) >= SUMMARY_EXAMPLES:
+                break
+            examples.extend(self._examples(sub, SUMMARY_EXAMPLES - len(examples)))
+        summary = f"{count} skill{'s' if count != 1 else ''}"
+        if subcategories:
+            summary += " in " + ", ".join(c.name for c in subcategories)
+        if examples:
+            summary += ", e.g. " + ", ".join(examples)
+        category = Category(
+            path=path,
+            summary=summary,
+            skill_count=count,
+            skills=skills,
+            children=tuple(c.path for c in subcategories),
+        )
+        self._categories[path] = category
+        return category
+
+    def _examples(self, category: Category, limit: int) -> list[str]:
+        examples = list(category.skills[:limit])
+        for child in category.children:
+            if len(examples) >= limit:
+                break
+            examples.extend(
+                self._examples(self._categories[child], limit - len(examples))
+            )
+        return examples
+
+    @property
+    def root(self) -> Category:
+        """The root node; its skills are the uncategorized ones."""
+        return self._categories[""]
+
+    def get(self, path: str) -> Category | None:
+        """Return a category by path (surrounding slashes ignored), or None."""
+        return self._categories.get(normalize_category(path))
+
+    def expand(self, path: str = "") -> tuple[list[Category], list[SkillMetadata]]:
+        """Return a category's direct subcategories and direct skills.
+
+        Raises:
+            KeyError: If there is no such category.
+        """
+        category = self.get(path)
+        if category is None:
+            raise KeyError(f"Category '{path}' not found")
+        return (
+            [self._categories[c] for c in category.children],
+            [self._metadata[name] for name in category.skills],
+        )
+
+    def __len__(self) -> int:
+        """Number of categories, excluding the root."""
+        return len(self._categories) - 1
+
+    def __contains__(self, path: str) -> bool:
+        return self.get(path) is not None
@@ -0,0 +1,116 @@
+"""Finding skill directories with as few filesystem calls as possible.
+
+Discovery lists each directory once with ``os.scandir`` and answers every
+"is this a directory / file" question from the entry types the listing
+already returned. A skill directory's own listing tells whether it has a
+SKILL.md and which resource directories exist, so parsing needs no further
+checks; the only other call per skill is one ``stat`` of SKILL.md for its
+modification time.
+
+Skills can be grouped in category folders: a directory without a SKILL.md
+is searched for skills up to ``max_depth`` levels below the root. Hidden
+directories (starting with ``.``) are never searched.
+"""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .models import RESOURCE_TYPES
+
+
+@dataclass(frozen=True)
+class SkillLocation:
+    """A skill directory found by ``discover_skills``.
+
+    Attributes:
+        path: Resolved skill directory.
+        category: Category folders between the root and the skill, joined
+            with ``/``; empty for skills directly under the root.
+        resource_dirs: Resource types ('scripts', 'references', 'assets')
+            present as subdirectories.
+        mtime_ns: Modification time of SKILL.md.
+    """
+
+    path: Path
+    category: str
+    resource_dirs: frozenset[str]
+    mtime_ns: int
+
+
+@dataclass(frozen=True)
+class SkillTree:
+    """Result of ``discover_skills``: skills and searched category folders."""
+
+    skills: list[SkillLocation] = field(default_factory=list)
+    categories: list[Path] = field(default_factory=list)
+
+
+def discover_skills(root: str | Path, max_depth: int = 1) -> SkillTree:
+    """Find skill directories under ``root``, sorted by path.
+
+    Args:
+        root: Directory to search.
+        max_depth: How many directory levels below ``root`` may hold skills.
+            1 only considers immediate subdirectories; 2 also looks one
+            level into category folders, and so on.
+
+    Folders below ``root`` that cannot be read, or that disappear during
+    the scan, are skipped.
+
+    Raises:
+        FileNotFoundError: If ``root`` does not exist.
+        NotADirectoryError: If ``root`` is not a directory.
+    """
+    tree = SkillTree()
+    _scan(os.path.realpath(root), "", max_depth, tree)
+    return tree
+
+
+def _scan(directory: str, category: str, depth: int, tree: SkillTree) -> None:
+    with os.scandir(directory) as it:
+        entries = sorted(
+            (e for e in it if not e.name.startswith(".") and _is_dir(e)),
+            key=lambda e: e.name,
+        )
+    for entry in entries:
+        # Folders that cannot be read, or vanish during the scan, are skipped.
+        try:
+            path = os.path.realpath(entry.path) if entry.is_symlink() else entry.path
+            skill_md = None
+            resource_dirs = []
+            with os.scandir(path) as it:
+                for child in it:
+                    if child.name == "SKILL.md":
+                        if child.is_file():
+                            skill_md = child
+                    elif child.name in RESOURCE_TYPES and child.is_dir():
+                        resource_dirs.append(child.name)
+            mtime_ns = skill_md.stat().st_mtime_ns if skill_md is not None else 0
+        except OSError:
+            continue
+        if skill_md is not None:
+            tree.skills.append(
+                SkillLocation(
+                    path=Path(path),
+                    category=category,
+                    resource_dirs=frozenset(resource_dirs),
+                    mtime_ns=mtime_ns,
+                )
+            )
+        elif depth > 1:
+            tree.categories.append(Path(path))
+            prefix = f"{category}/" if category else ""
+            try:
+                _scan(path, prefix + entry.name, depth - 1, tree)
+            except OSError:
+                continue
+
+
+def _is_dir(entry: os.DirEntry) -> bool:
+    try:
+        return entry.is_dir()
+    except OSError:
+        return False
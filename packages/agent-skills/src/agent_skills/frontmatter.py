@@ -0,0 +1,123 @@
+"""SKILL.md frontmatter loading.
+
+Almost all frontmatter uses a small flat subset of YAML: ``key: value``
+lines with plain or simply quoted string values, plus one level of nested
+``key: value`` lines under a key with no value (the ``metadata`` map). That
+subset is parsed by hand. Anything else, including any value YAML would
+resolve to a non-string, falls back to PyYAML, using the libyaml
+``CSafeLoader`` when it is available, so results always equal
+``yaml.safe_load``.
+"""
+
+from __future__ import annotations
+
+import re
+
+_KEY_LINE = re.compile(r"([A-Za-z_][A-Za-z0-9_-]*):(?: +(.*))?")
+
+# Plain scalars starting with one of these are either YAML indicators or
+# may resolve to a number, null, timestamp or merge key.
+_UNSAFE_START = frozenset("-?:,[]{}#&*!|>%@`~<=+.0123456789")
+
+_IMPLICIT_WORDS = frozenset(
+    "yes Yes YES no No NO true True TRUE false False FALSE "
+    "on On ON off Off OFF null Null NULL".split()
+)
+
+
+def load_frontmatter(text: str) -> object:
+    """Load a frontmatter block; equivalent to ``yaml.safe_load(text)``.
+
+    Raises:
+        yaml.YAMLError: If ``text`` is not valid YAML.
+    """
+    data = _parse_flat(text)
+    if data is not None:
+        return data
+    import yaml
+
+    return yaml.load(text, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+
+
+def _parse_flat(text: str) -> dict[str, str | dict[str, str | None] | None] | None:
+    """Parse the flat frontmatter subset, or return None if ``text`` leaves it."""
+    data: dict[str, str | dict[str, str | None] | None] = {}
+    nested: dict[str, str | None] | None = None
+    indent = 0
+    # YAML also breaks lines at a lone \r, U+0085, U+2028 and U+2029, even
+    # inside comments; leave any of them, and tabs, to the YAML parser.
+    if not text.replace("\r\n", "\n").replace("\n", "").isprintable():
+        return None
+    for line in text.split("\n"):
+        line = line.rstrip(" \r")
+        if not line or line.startswith("#"):
+            continue
+        stripped = line.lstrip(" ")
+        if stripped is not line:
+            # Indented lines are only allowed as entries of a nested map.
+            if nested is None:
+                return None
+            if not indent:
+                indent = len(line) - len(stripped)
+            elif len(line) - len(stripped) != indent:
+                return None
+            if stripped.startswith("#"):
+                continue
+            entry = _parse_entry(stripped)
+            if entry is None:
+                return None
+            nested[entry[0]] = entry[1]
+            continue
+
+        if nested is not None and not nested:
+            data[key] = None
+        nested = None
+        entry = _parse_entry(line)
+        if entry is None:
+            return None
+        key, value = entry
+        if value is None:
+            nested = {}
+            indent = 0
+            data[key] = nested
+        else:
+            data[key] = value
+    if nested is not None and not nested:
+        data[key] = None
+    return data or None
+
+
+def _parse_entry(line: str) -> tuple[str, str | None] | None:
+    match = _KEY_LINE.fullmatch(line)
+    if match is None or match.group(1) in _IMPLICIT_WORDS:
+        return None
+    value = match.group(2)
+    if not value:
+        return match.group(1), None
+    scalar = _parse_scalar(value)
+    if scalar is None:
+        return None
+    return match.group(1), scalar
+
+
+def _parse_scalar(value: str) -> str | None:
+    quote = value[0]
+    if quote == '"':
+        inner = value[1:-1]
+        if len(value) < 2 or value[-1] != '"' or '"' in inner or "\\" in inner:
+            return None
+        return inner
+    if quote == "'":
+        inner = value[1:-1]
+        if len(value) < 2 or value[-1] != "'" or "'" in inner:
+            return None
+        return inner
+    if (
+        quote in _UNSAFE_START
+        or value in _IMPLICIT_WORDS
+        or ": " in value
+        or " #" in value
+        or value.endswith(":")
+    ):
+        return None
+    return value
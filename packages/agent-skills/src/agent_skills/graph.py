@@ -0,0 +1,106 @@
+"""Dependencies between skills.
+
+A skill depends on the skills it declares in its frontmatter
+(``metadata: {requires: other-skill ...}``) and on loaded skills its body
+names as inline code, e.g. ``Use `glossary` for terms``. Names in plain
+prose are not dependencies: skills are often named in passing ("unlike
+data-model"), and hyphenated words such as "user-facing" would be taken for
+names. The parser records both kinds as ``Skill.references``; the registry
+resolves them against the skills actually loaded.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Callable, Iterable
+
+# A skill name written as inline code.
+_MENTION = re.compile(r"`([a-z0-9]+(?:-[a-z0-9]+)*)`")
+
+
+def extract_references(name: str, declared: str, body: str) -> list[str]:
+    """Candidate skill names a skill refers to, sorted and without itself.
+
+    Args:
+        name: The referring skill's name.
+        declared: Space- or comma-separated names from ``metadata.requires``.
+        body: The SKILL.md body.
+    """
+    names = set(declared.replace(",", " ").split())
+    names.update(_MENTION.findall(body))
+    names.discard(name)
+    return sorted(names)
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count of English text (about four characters per token)."""
+    return (len(text) + 3) // 4
+
+
+def dependency_order(
+    names: Iterable[str], dependencies: Callable[[str], list[str]]
+) -> list[str]:
+    """Transitive closure of ``names``, prerequisites before dependents.
+
+    Each skill appears once. Cycles are broken at the edge that closes them.
+    Names ``dependencies`` raises ``KeyError`` for are kept as leaves.
+    """
+    order: list[str] = []
+    done: set[str] = set()
+    visiting: set[str] = set()
+
+    def visit(name: str) -> None:
+        if name in done or name in visiting:
+            return
+        visiting.add(name)
+        try:
+            deps = dependencies(name)
+        except KeyError:
+            deps = []
+        for dep in deps:
+            visit(dep)
+        visiting.discard(name)
+        done.add(name)
+        order.append(name)
+
+    for name in names:
+        visit(name)
+    return order
+
+
+class SkillGraph:
+    """Dependency edges between loaded skills.
+
+    References are recorded per skill as skills are loaded; edges to skills
+    that are not loaded are dropped, and resolved again when the set of
+    loaded skills changes.
+    """
+
+    def __init__(self) -> None:
+        self._references: dict[str, tuple[str, ...]] = {}
+        self._edges: dict[str, tuple[str, ...]] | None = None
+
+    def set(self, name: str, references: Iterable[str]) -> None:
+        """Record or replace the references of a skill."""
+        self._references[name] = tuple(references)
+        self._edges = None
+
+    def dependencies(self, name: str) -> list[str]:
+        """Loaded skills that ``name`` depends on directly.
+
+        Raises:
+            KeyError: If ``name`` is not in the graph.
+        """
+        edges = self._edges
+        if edges is None:
+            known = self._references
+            edges = {
+                skill: tuple(r for r in refs if r in known)
+                for skill, refs in known.items()
+            }
+            self._edges = edges
+        return list(edges[name])
+
+    def dependency_order(self, names: Iterable[str]) -> list[str]:
+        """Transitive closure of ``names``, prerequisites first."""
+        return dependency_order(names, self.dependencies)
@@ -0,0 +1,205 @@
+"""Pluggable timing and counter instrumentation.
+
+Library code reports measurements to the process-wide instrumentation
+returned by ``get_instrumentation()``. The default discards everything;
+install ``InMemoryRecorder`` in tests or ``OpenTelemetryInstrumentation``
+in production with ``set_instrumentation()``.
+
+Metrics emitted (durations in seconds):
+
+========================================  =========  ==========================
+Name                                      Kind       Attributes
+========================================  =========  ==========================
+``skills.parse.duration``                 histogram  ``skill``
+``skills.load_directory.duration``        histogram
+``skills.prompt.render.duration``         histogram
+``skills.activate.duration``              histogram  ``skill``
+``skills.activations``                    counter    ``skill``
+``skills.resource.read.duration``         histogram  ``skill``, ``resource_type``
+``skills.resource.bytes_read``            counter    ``skill``, ``resource_type``
+``skills.script.duration``                histogram  ``skill``
+``skills.script.runs``                    counter    ``skill``, ``outcome``
+``skills.index.duration``                 histogram  ``skill``
+``skills.search.duration``                histogram
+``skills.cache.hits``                     counter    ``cache``
+``skills.cache.misses``                   counter    ``cache``
+``skills.quota.wait.duration``            histogram  ``quota``
+``skills.quota.throttled``                counter    ``quota``
+``skills.versions.retained``              counter    ``skill``
+``skills.versions.collected``             counter    ``skill``
+``skills.context.deduplicated``           counter    ``kind``
+``skills.context.bytes_saved``            counter    ``kind``
+``skills.tool.duration``                  histogram  ``tool``
+``skills.tool.calls``                     counter    ``tool``, ``outcome``
+========================================  =========  ==========================
+"""
+
+from __future__ import annotations
+
+import functools
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import Any
+
+Attributes = dict[str, str]
+
+
+class Instrumentation:
+    """Instrumentation interface. The base implementation discards everything."""
+
+    def record_duration(
+        self, name: str, seconds: float, attributes: Attributes | None = None
+    ) -> None:
+        """Record one sample of a latency histogram."""
+
+    def add(self, name: str, value: int = 1, attributes: Attributes | None = None) -> None:
+        """Increment a monotonic counter."""
+
+
+class InMemoryRecorder(Instrumentation):
+    """Keeps every measurement in memory, for tests and ad-hoc profiling."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._durations: dict[str, list[tuple[float, Attributes]]] = defaultdict(list)
+        self._counters: dict[str, list[tuple[int, Attributes]]] = defaultdict(list)
+
+    def record_duration(
+        self, name: str, seconds: float, attributes: Attributes | None = None
+    ) -> None:
+        with self._lock:
+            self._durations[name].append((seconds, dict(attributes or {})))
+
+    def add(self, name: str, value: int = 1, attributes: Attributes | None = None) -> None:
+        with self._lock:
+            self._counters[name].append((value, dict(attributes or {})))
+
+    def durations(self, name: str, **attributes: str) -> list[float]:
+        """Samples of a histogram, optionally filtered by attribute values."""
+        with self._lock:
+            samples = list(self._durations.get(name, ()))
+        return [s for s, attrs in samples if _matches(attrs, attributes)]
+
+    def count(self, name: str, **attributes: str) -> int:
+        """Total of a counter, optionally filtered by attribute values."""
+        with self._lock:
+            values = list(self._counters.get(name, ()))
+        return sum(v for v, attrs in values if _matches(attrs, attributes))
+
+    def counts_by(self, name: str, attribute: str) -> dict[str, int]:
+        """Totals of a counter grouped by one attribute, e.g. activations per skill."""
+        totals: dict[str, int] = defaultdict(int)
+        with self._lock:
+            for value, attrs in self._counters.get(name, ()):
+                if attribute in attrs:
+                    totals[attrs[attribute]] += value
+        return dict(totals)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._durations.clear()
+            self._counters.clear()
+
+
+class OpenTelemetryInstrumentation(Instrumentation):
+    """Forwards measurements to OpenTelemetry histograms and counters.
+
+    Args:
+        meter: An OpenTelemetry ``Meter``. Defaults to the global meter
+            provider's ``agent_skills`` meter. Requires ``opentelemetry-api``.
+    """
+
+    def __init__(self, meter: Any = None) -> None:
+        if meter is None:
+            from opentelemetry import metrics
+
+            meter = metrics.get_meter("agent_skills")
+        self._meter = meter
+        self._instruments: dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def record_duration(
+        self, name: str, seconds: float, attributes: Attributes | None = None
+    ) -> None:
+        histogram = self._instrument(name, self._meter.create_histogram, unit="s")
+        histogram.record(seconds, attributes=attributes)
+
+    def add(self, name: str, value: int = 1, attributes: Attributes | None = None) -> None:
+        self._instrument(name, self._meter.create_counter).add(value, attributes=attributes)
+
+    def _instrument(self, name: str, factory: Callable[..., Any], **kwargs: Any) -> Any:
+        instrument = self._instruments.get(name)
+        if instrument is None:
+            with self._lock:
+                instrument = self._instruments.get(name)
+                if instrument is None:
+                    instrument = factory(name, **kwargs)
+                    self._instruments[name] = instrument
+        return instrument
+
+
+_instrumentation: Instrumentation = Instrumentation()
+
+
+def get_instrumentation() -> Instrumentation:
+    """Return the process-wide instrumentation."""
+    return _instrumentation
+
+
+def set_instrumentation(instrumentation: Instrumentation | None) -> Instrumentation:
+    """Install process-wide instrumentation; ``None`` restores the no-op default.
+
+    Returns the previously installed instrumentation.
+    """
+    global _instrumentation
+    previous = _instrumentation
+    _instrumentation = instrumentation or Instrumentation()
+    return previous
+
+
+@contextmanager
+def timed(name: str, **attributes: str) -> Iterator[Attributes]:
+    """Record the duration of the enclosed block as a histogram sample.
+
+    Yields the attribute dict so the block can add attributes it only
+    learns while running.
+    """
+    attrs: Attributes = dict(attributes)
+    start = time.perf_counter()
+    try:
+        yield attrs
+    finally:
+        _instrumentation.record_duration(name, time.perf_counter() - start, attrs)
+
+
+def instrument_tool(func: Callable[..., str]) -> Callable[..., str]:
+    """Time a tool function and count its calls by outcome.
+
+    Apply beneath ``@tool`` so the tool spec is still built from ``func``.
+    A result starting with ``"Error:"`` counts as an ``error`` outcome and
+    one starting with ``"Throttled:"`` as ``throttled``.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> str:
+        with timed("skills.tool.duration", tool=func.__name__) as attrs:
+            result = func(*args, **kwargs)
+        if result.startswith("Error:"):
+            outcome = "error"
+        elif result.startswith("Throttled:"):
+            outcome = "throttled"
+        else:
+            outcome = "ok"
+        _instrumentation.add(
+            "skills.tool.calls", attributes={"tool": attrs["tool"], "outcome": outcome}
+        )
+        return result
+
+    return wrapper
+
+
+def _matches(attrs: Attributes, expected: dict[str, str]) -> bool:
+    return all(attrs.get(k) == v for k, v in expected.items())
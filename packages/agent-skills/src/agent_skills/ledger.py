@@ -0,0 +1,53 @@
+"""Tracking what a conversation has already received.
+
+An agent that activates a skill or reads a resource twice in one
+conversation already has the first copy in its context. A ``ContextLedger``
+remembers the digest of each item delivered to one conversation, so the
+skill tools can answer a repeat request with a short reference instead of
+the full text, and send the text again only when it changed.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Hashable
+
+from .blobs import content_digest
+
+
+class ContextLedger:
+    """Digests of the content delivered to one conversation, by item key.
+
+    Use one ledger per conversation. If the conversation history is
+    trimmed or summarized, call ``forget`` so earlier content is sent again.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._delivered: dict[Hashable, str] = {}
+
+    def seen(self, key: Hashable, content: str) -> bool:
+        """Return True if ``content`` was already delivered under ``key``.
+
+        Otherwise record it as delivered and return False.
+        """
+        digest = content_digest(content)
+        with self._lock:
+            if self._delivered.get(key) == digest:
+                return True
+            self._delivered[key] = digest
+        return False
+
+    def forget(self, key: Hashable | None = None) -> None:
+        """Forget one item, or everything when ``key`` is None."""
+        with self._lock:
+            if key is None:
+                self._delivered.clear()
+            else:
+                self._delivered.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._delivered)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._delivered
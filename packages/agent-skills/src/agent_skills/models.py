@@ -7,6 +7,8 @@ from pathlib import Path
 
 from pydantic import BaseModel, Field, field_validator
 
+RESOURCE_TYPES = ("scripts", "references", "assets")
+
 
 class SkillMetadata(BaseModel):
     """Lightweight metadata loaded at startup (~100 tokens per skill).
@@ -71,7 +73,9 @@ class Skill(BaseModel):
     """Complete skill representation with progressive disclosure support.
 
     The instructions field contains the full SKILL.md body but is only
-    exposed to agents when the skill is activated.
+    exposed to agents when the skill is activated. ``references`` lists the
+    skill names declared in ``metadata.requires`` or written as inline code
+    in the body; registries resolve them against the skills actually loaded.
     """
 
     metadata: SkillMetadata
@@ -79,5 +83,68 @@ class Skill(BaseModel):
     resources: SkillResources
     path: Path
     activated: bool = False
+    references: list[str] = []
 
     model_config = {"arbitrary_types_allowed": True}
+
+
+class BatchResult(BaseModel):
+    """Outcome of one item in a batched registry call.
+
+    Exactly one of ``content`` and ``error`` is set.
+    """
+
+    key: str
+    content: str | None = None
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class ScriptResult(BaseModel):
+    """Outcome of running a skill script.
+
+    ``exit_code`` is None when the script was killed for running past its
+    timeout; a negative code means it was killed by that signal.
+    """
+
+    exit_code: int | None = None
+    stdout: str = ""
+    stderr: str = ""
+    timed_out: bool = False
+    truncated: bool = False
+    duration: float = 0.0
+    cached: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.exit_code == 0
+
+
+class SearchMatch(BaseModel):
+    """One place a search query matched in a resource file.
+
+    ``start`` and ``end`` are character offsets of the match in the file;
+    ``snippet`` is the text of the line around it.
+    """
+
+    line: int
+    start: int
+    end: int
+    snippet: str
+
+
+class SearchHit(BaseModel):
+    """A resource file matching a search query, with its best matches."""
+
+    skill_name: str
+    resource_type: str
+    file_path: str
+    score: float
+    matches: list[SearchMatch] = []
+
+    @property
+    def key(self) -> str:
+        return f"{self.skill_name}/{self.resource_type}/{self.file_path}"
@@ -3,18 +3,25 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import yaml
-
+from .frontmatter import load_frontmatter
+from .graph import extract_references
+from .instrumentation import timed
 from .models import Skill, SkillMetadata, SkillResources
 from .validation import validate_name_matches_directory, validate_skill_directory
 
+if TYPE_CHECKING:
+    from .discovery import SkillLocation
+
 
-def parse_skill(skill_path: str | Path) -> Skill:
+def parse_skill(skill_path: str | Path, category: str = "") -> Skill:
     """Parse a skill directory into a Skill model.
 
     Args:
         skill_path: Path to the skill directory containing SKILL.md.
+        category: Category recorded in ``metadata.category`` if the
+            frontmatter declares none (e.g. from the folders it sits in).
 
     Returns:
         A fully populated Skill instance.
@@ -24,10 +31,41 @@ def parse_skill(skill_path: str | Path) -> Skill:
         ValueError: If frontmatter is invalid or missing required fields.
     """
     skill_dir = Path(skill_path).resolve()
-    validate_skill_directory(skill_dir)
+    with timed("skills.parse.duration", skill=skill_dir.name):
+        return _parse_skill_dir(skill_dir, category=category)
+
 
-    skill_md = skill_dir / "SKILL.md"
-    raw = skill_md.read_text(encoding="utf-8")
+def parse_skill_location(location: SkillLocation) -> Skill:
+    """Parse a skill found by ``discover_skills``.
+
+    Like ``parse_skill``, but trusts the location's directory listing
+    instead of checking the directory and its resource folders again. A
+    skill found in category folders without a declared
+    ``metadata.category`` gets the folder path as its category.
+
+    Raises:
+        FileNotFoundError: If SKILL.md was removed since discovery.
+        ValueError: If frontmatter is invalid or missing required fields.
+    """
+    skill_dir = location.path
+    with timed("skills.parse.duration", skill=skill_dir.name):
+        resources = SkillResources(
+            **{
+                f"{rtype}_dir": skill_dir / rtype
+                for rtype in location.resource_dirs
+            }
+        )
+        return _parse_skill_dir(skill_dir, resources, location.category)
+
+
+def _parse_skill_dir(
+    skill_dir: Path, resources: SkillResources | None = None, category: str = ""
+) -> Skill:
+    if resources is None:
+        validate_skill_directory(skill_dir)
+
+    with open(skill_dir / "SKILL.md", encoding="utf-8") as f:
+        raw = f.read()
 
     frontmatter, body = _split_frontmatter(raw)
 
@@ -41,8 +79,12 @@ def parse_skill(skill_path: str | Path) -> Skill:
 
     metadata = SkillMetadata(**frontmatter)
     validate_name_matches_directory(metadata.name, skill_dir.name)
+    if category and "category" not in (metadata.metadata or {}):
+        # Directory nesting stands in for an undeclared category.
+        metadata.metadata = {**(metadata.metadata or {}), "category": category}
 
-    resources = _discover_resources(skill_dir)
+    if resources is None:
+        resources = _discover_resources(skill_dir)
 
     return Skill(
         metadata=metadata,
@@ -50,6 +92,9 @@ def parse_skill(skill_path: str | Path) -> Skill:
         resources=resources,
         path=skill_dir,
         activated=False,
+        references=extract_references(
+            metadata.name, (metadata.metadata or {}).get("requires", ""), body
+        ),
     )
 
 
@@ -66,7 +111,7 @@ def _split_frontmatter(content: str) -> tuple[dict, str]:
     if len(parts) < 3:
         raise ValueError("SKILL.md frontmatter must be delimited by --- on both sides")
 
-    frontmatter = yaml.safe_load(parts[1])
+    frontmatter = load_frontmatter(parts[1])
     if not isinstance(frontmatter, dict):
         raise ValueError("SKILL.md frontmatter must be a YAML mapping")
 
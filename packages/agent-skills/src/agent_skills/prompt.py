@@ -2,16 +2,45 @@
 
 from __future__ import annotations
 
+import re
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
 from xml.sax.saxutils import escape
 
-from jinja2 import Template
+from .instrumentation import timed
 
-from .models import SkillMetadata
+if TYPE_CHECKING:
+    from .categories import Category
+    from .models import SkillMetadata
 
-SKILLS_SYSTEM_PROMPT_TEMPLATE = Template("""
-{{custom_system_prompt}}
 
-## Skills System
+class PromptTemplate:
+    """Minimal ``{{name}}`` placeholder template.
+
+    Covers the subset of Jinja used by the system prompt (plain variable
+    substitution) without importing or compiling Jinja. The text is split
+    into literal and placeholder segments once, up front; values are
+    inserted verbatim, and like Jinja's default a single trailing newline
+    is dropped.
+    """
+
+    _PLACEHOLDER = re.compile(r"\{\{\s*(\w+)\s*\}\}")
+
+    def __init__(self, source: str) -> None:
+        self.source = source
+        if source.endswith("\n"):
+            source = source[:-1]
+        self._segments = self._PLACEHOLDER.split(source)
+
+    def render(self, **values: object) -> str:
+        parts = list(self._segments)
+        for i in range(1, len(parts), 2):
+            value = values.get(parts[i], "")
+            parts[i] = value if isinstance(value, str) else str(value)
+        return "".join(parts)
+
+
+SKILLS_INSTRUCTIONS = """## Skills System
 
 You have access to a skills library that provides specialized capabilities and domain knowledge.
 
@@ -38,15 +67,20 @@ Skills follow a **progressive disclosure** pattern - you know they exist (name +
 - When a skill provides proven patterns for complex tasks
 
 **Remember:** Skills are tools to make you more capable and consistent. When in doubt, check if a skill exists for the task!
-</skills_instructions>
+</skills_instructions>"""
 
-<available_skills>
-{{skills_list}}
-</available_skills>
-""")
+SKILLS_SYSTEM_PROMPT_TEMPLATE = PromptTemplate(
+    "\n{{custom_system_prompt}}\n\n"
+    + SKILLS_INSTRUCTIONS
+    + "\n\n<available_skills>\n{{skills_list}}\n</available_skills>\n"
+)
 
 
-def render_system_prompt(custom_sys_prompt: str, skills: list[SkillMetadata]) -> str:
+def render_system_prompt(
+    custom_sys_prompt: str,
+    skills: list[SkillMetadata],
+    categories: list[Category] | None = None,
+) -> str:
     """Render the <available_skills> XML block for system prompts.
 
     Follows the Agent Skills specification format. Only includes
@@ -54,23 +88,110 @@ def render_system_prompt(custom_sys_prompt: str, skills: list[SkillMetadata]) ->
 
     Args:
         skills: List of SkillMetadata instances to include.
+        categories: Categories listed by name and summary after the skills,
+            for skills the agent can find with ``list_skills(category=...)``.
 
     Returns:
         XML string suitable for inclusion in a system prompt.
-        Returns empty string if no skills are provided.
+        Returns empty string if no skills or categories are provided.
     """
-    if not skills:
+    if not skills and not categories:
         return ""
 
+    with timed("skills.prompt.render.duration"):
+        return SKILLS_SYSTEM_PROMPT_TEMPLATE.render(
+            custom_system_prompt=custom_sys_prompt,
+            skills_list=_skills_list(skills, categories),
+        )
+
+
+@dataclass(frozen=True)
+class CacheablePrompt:
+    """A system prompt laid out for model-side prompt caching.
+
+    The prompt is three consecutive segments, from most to least shared:
+    the fixed skills instructions (identical for every persona), the
+    ``<available_skills>`` block (identical wherever the same skills are
+    loaded), and the custom system prompt.
+    """
+
+    static: str
+    skills: str
+    custom: str
+
+    @property
+    def text(self) -> str:
+        """The full system prompt."""
+        return self.static + self.skills + self.custom
+
+    @property
+    def segments(self) -> tuple[str, str, str]:
+        """The segments in order, for APIs that take system prompt blocks."""
+        return self.static, self.skills, self.custom
+
+    @property
+    def cache_boundaries(self) -> tuple[int, int]:
+        """Character offsets in ``text`` where the cacheable prefixes end.
+
+        Place cache breakpoints here: the first is shared by all personas,
+        the second by every prompt with the same skill set.
+        """
+        return len(self.static), len(self.static) + len(self.skills)
+
+
+def render_cacheable_prompt(
+    custom_sys_prompt: str,
+    skills: list[SkillMetadata],
+    categories: list[Category] | None = None,
+) -> CacheablePrompt:
+    """Render a byte-stable system prompt with the static content first.
+
+    Unlike ``render_system_prompt``, skills are ordered by name rather than
+    by load order, and the custom system prompt goes last, so equal inputs
+    give identical output in every process and the long unchanging parts
+    form a shared prefix. ``categories`` are listed after the skills, by
+    path.
+
+    Returns:
+        The prompt segments. All are empty if no skills or categories are
+        provided.
+    """
+    if not skills and not categories:
+        return CacheablePrompt("", "", "")
+
+    with timed("skills.prompt.render.duration"):
+        skills_list = _skills_list(
+            sorted(skills, key=lambda s: s.name),
+            sorted(categories or (), key=lambda c: c.path),
+        )
+        custom = custom_sys_prompt.strip()
+        return CacheablePrompt(
+            static=SKILLS_INSTRUCTIONS + "\n\n",
+            skills=f"<available_skills>\n{skills_list}\n</available_skills>\n",
+            custom=f"\n{custom}\n" if custom else "",
+        )
+
+
+CATEGORY_HINT = (
+    "  <note>More skills are grouped into the categories above. Call "
+    "list_skills with a category name to see its skills.</note>"
+)
+
+
+def _skills_list(
+    skills: list[SkillMetadata], categories: list[Category] | None = None
+) -> str:
     lines = []
     for s in skills:
         lines.append("  <skill>")
         lines.append(f"    <name>{escape(s.name)}</name>")
         lines.append(f"    <description>{escape(s.description)}</description>")
         lines.append("  </skill>")
-
-    skills_list = "\n".join(lines)
-
-    return SKILLS_SYSTEM_PROMPT_TEMPLATE.render(
-        custom_system_prompt=custom_sys_prompt, skills_list=skills_list
-    )
+    if categories:
+        for c in categories:
+            lines.append("  <category>")
+            lines.append(f"    <name>{escape(c.path)}</name>")
+            lines.append(f"    <summary>{escape(c.summary)}</summary>")
+            lines.append("  </category>")
+        lines.append(CATEGORY_HINT)
+    return "\n".join(lines)
@@ -0,0 +1,176 @@
+"""Rate limits for resource reads.
+
+A ``ResourceQuota`` limits the resource reads of one session to a number of
+calls and bytes per second, using token buckets. Quotas can be chained to a
+``parent`` shared by all sessions, so one process-wide budget is divided
+among them and a session looping over large files only slows itself down
+once it exhausts its own budget.
+
+Each call reserves its token when it arrives, so waiting calls proceed in
+arrival order. A call that would have to wait longer than ``max_wait`` is
+refused with ``ThrottledError`` instead of queued. A batch of more calls
+than the bucket holds is admitted once the bucket is full, and its excess
+delays the calls after it. Bytes are only known after a read, so they are
+charged afterwards. A read that overdraws the byte budget delays the calls
+that come after it.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from contextlib import ExitStack
+from threading import Lock
+
+from .instrumentation import get_instrumentation
+
+
+class ThrottledError(RuntimeError):
+    """Raised when a call would wait longer than the quota allows.
+
+    Attributes:
+        retry_after: Seconds after which the call would be admitted.
+    """
+
+    def __init__(self, retry_after: float) -> None:
+        super().__init__(f"Resource reads are over quota; retry in {retry_after:.2f}s")
+        self.retry_after = retry_after
+
+
+class TokenBucket:
+    """A token bucket refilled continuously at ``rate`` tokens per second.
+
+    The level may go negative: a debt is repaid by refilling before any
+    further tokens are available. Not thread-safe; ``ResourceQuota`` locks
+    around it.
+
+    Args:
+        rate: Tokens added per second.
+        capacity: Most tokens held, i.e. the largest burst; defaults to one
+            second's worth.
+        now: Clock reading at which the bucket is full.
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None, now: float = 0.0):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = rate if capacity is None else capacity
+        self._level = self.capacity
+        self._updated = now
+
+    def delay(self, amount: float, now: float) -> float:
+        """Seconds until ``amount`` tokens are available.
+
+        An amount larger than the capacity is available once the bucket is
+        full; taking it leaves a debt.
+        """
+        self._refill(now)
+        amount = min(amount, self.capacity)
+        return max(0.0, (amount - self._level) / self.rate)
+
+    def take(self, amount: float, now: float) -> None:
+        """Remove ``amount`` tokens, going into debt if there are too few."""
+        self._refill(now)
+        self._level -= amount
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._level = min(self.capacity, self._level + elapsed * self.rate)
+            self._updated = now
+
+
+class ResourceQuota:
+    """Calls and bytes per second allowed for resource reads.
+
+    Args:
+        calls_per_second: Reads admitted per second; None for no limit.
+        bytes_per_second: Bytes read per second; None for no limit.
+        burst: Seconds of budget that may be used at once after idling.
+        max_wait: Longest a call is queued before it is refused instead.
+        parent: A quota shared with other sessions that also applies.
+        name: Reported as the ``quota`` attribute of the metrics.
+        clock: Monotonic time source, in seconds.
+        sleep: Function used to wait.
+    """
+
+    def __init__(
+        self,
+        calls_per_second: float | None = None,
+        bytes_per_second: float | None = None,
+        *,
+        burst: float = 1.0,
+        max_wait: float = 1.0,
+        parent: ResourceQuota | None = None,
+        name: str = "session",
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.max_wait = max_wait
+        self.parent = parent
+        self.name = name
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = Lock()
+        now = clock()
+        self._calls = self._bytes = None
+        if calls_per_second is not None:
+            self._calls = TokenBucket(
+                calls_per_second, max(1.0, calls_per_second * burst), now
+            )
+        if bytes_per_second is not None:
+            self._bytes = TokenBucket(bytes_per_second, bytes_per_second * burst, now)
+
+    def acquire(self, calls: int = 1) -> float:
+        """Wait until ``calls`` reads are admitted by this quota and its parents.
+
+        Returns:
+            Seconds waited.
+
+        Raises:
+            ThrottledError: If the wait would exceed ``max_wait``.
+        """
+        chain = self._chain()
+        with ExitStack() as stack:
+            for quota in chain:
+                stack.enter_context(quota._lock)
+            now = self._clock()
+            delays = [(quota._delay(calls, now), quota) for quota in chain]
+            delay, limiting = max(delays, key=lambda d: d[0])
+            if delay > self.max_wait:
+                get_instrumentation().add(
+                    "skills.quota.throttled", attributes={"quota": limiting.name}
+                )
+                raise ThrottledError(delay)
+            for quota in chain:
+                if quota._calls is not None:
+                    quota._calls.take(calls, now)
+        if delay > 0:
+            get_instrumentation().record_duration(
+                "skills.quota.wait.duration", delay, {"quota": limiting.name}
+            )
+            self._sleep(delay)
+        return delay
+
+    def charge(self, nbytes: int) -> None:
+        """Count ``nbytes`` read against this quota and its parents."""
+        for quota in self._chain():
+            if quota._bytes is not None:
+                with quota._lock:
+                    quota._bytes.take(nbytes, quota._clock())
+
+    def _chain(self) -> list[ResourceQuota]:
+        chain = [self]
+        while chain[-1].parent is not None:
+            chain.append(chain[-1].parent)
+        return chain
+
+    def _delay(self, calls: int, now: float) -> float:
+        delay = 0.0
+        if self._calls is not None:
+            delay = self._calls.delay(calls, now)
+        if self._bytes is not None:
+            # Admit once any byte debt is repaid.
+            delay = max(delay, self._bytes.delay(0, now))
+        return delay
@@ -2,14 +2,60 @@
 
 from __future__ import annotations
 
+import contextlib
+import hashlib
+import os
+import threading
 from abc import ABC, abstractmethod
+from collections import Counter, OrderedDict
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from .models import Skill, SkillMetadata
-from .parser import parse_skill
-from .prompt import render_system_prompt
-from .tools import create_skill_tools
+from ._records import load_skill_record
+from .blobs import BlobStore, content_digest
+from .categories import CategoryTree, skill_category
+from .discovery import discover_skills
+from .graph import SkillGraph, dependency_order, estimate_tokens
+from .instrumentation import get_instrumentation, timed
+from .models import (
+    RESOURCE_TYPES,
+    BatchResult,
+    ScriptResult,
+    SearchHit,
+    Skill,
+    SkillMetadata,
+)
+from .parser import parse_skill, parse_skill_location
+from .prompt import CacheablePrompt, render_cacheable_prompt, render_system_prompt
+from .search import SEARCHED_RESOURCE_TYPES, ResourceIndex
+from .scripts import DEFAULT_MAX_OUTPUT, DEFAULT_TIMEOUT, ScriptPool, get_script_pool
+from .usage import UsageProfile
 from .validation import validate_resource_path
+from .versions import ResidentVersion, skill_version
+
+if TYPE_CHECKING:
+    from .sessions import SkillSession
+    from .views import ScopedSkillRegistry
+
+
+# Guards the creation of each registry's _RegistryState.
+_STATE_LOCK = threading.Lock()
+
+
+@dataclass
+class _RegistryState:
+    """Per-instance state of ``SkillRegistry``, created on first use."""
+
+    change_listeners: list[Callable[[str], None]] = field(default_factory=list)
+    script_results: OrderedDict[tuple, ScriptResult] = field(
+        default_factory=OrderedDict
+    )
+    script_lock: threading.Lock = field(default_factory=threading.Lock)
+    resource_index: ResourceIndex | None = None
+    index_lock: threading.Lock = field(default_factory=threading.Lock)
 
 
 class SkillRegistry(ABC):
@@ -18,8 +64,28 @@ class SkillRegistry(ABC):
     Concrete implementations must provide skill storage, retrieval,
     activation, and resource access. Convenience methods for system
     prompt generation and tool creation are provided.
+
+    Implementations call ``_notify_changed`` whenever a skill is added or
+    replaced so that dependents (e.g. rendered persona prompts) can
+    invalidate only what is affected. They need not call
+    ``super().__init__()``: state kept by the base class is created on
+    first use.
+
+    Attributes:
+        script_pool: Pool that runs skill scripts; None uses the shared
+            process-wide pool from ``get_script_pool``.
     """
 
+    script_pool: ScriptPool | None = None
+
+    @property
+    def _state(self) -> _RegistryState:
+        try:
+            return self.__dict__["_registry_state"]
+        except KeyError:
+            with _STATE_LOCK:
+                return self.__dict__.setdefault("_registry_state", _RegistryState())
+
     @abstractmethod
     def get_skill(self, name: str) -> Skill | None:
         """Get a loaded skill by name."""
@@ -42,7 +108,8 @@ class SkillRegistry(ABC):
 
         Raises:
             KeyError: If skill not found.
-            ValueError: If resource_type is invalid or path traversal detected.
+            ValueError: If resource_type is invalid, path traversal is detected
+                or the file is not UTF-8 text.
             FileNotFoundError: If resource directory or file doesn't exist.
         """
 
@@ -57,13 +124,335 @@ class SkillRegistry(ABC):
     @abstractmethod
     def __contains__(self, name: str) -> bool: ...
 
-    def to_system_prompt(self, custom_sys_prompt: str) -> str:
-        """Generate the system prompt XML block for all loaded skills."""
+    def activate_skills(
+        self, names: list[str], max_workers: int = 8
+    ) -> list[BatchResult]:
+        """Activate several skills concurrently.
+
+        Returns one result per name, in order, keyed by skill name. Failures
+        are reported per item instead of raised.
+        """
+        return _run_batch(
+            [(name, self.activate_skill, (name,)) for name in names], max_workers
+        )
+
+    def read_resources(
+        self, requests: list[tuple[str, str, str]], max_workers: int = 8
+    ) -> list[BatchResult]:
+        """Read several resource files concurrently.
+
+        Args:
+            requests: ``(skill_name, resource_type, file_path)`` tuples.
+            max_workers: Upper bound on concurrent reads.
+
+        Returns:
+            One result per request, in order, keyed by
+            ``skill_name/resource_type/file_path``. Failures are reported per
+            item instead of raised.
+        """
+        return _run_batch(
+            [("/".join(req), self.read_resource, req) for req in requests],
+            max_workers,
+        )
+
+    def skill_dependencies(self, name: str) -> list[str]:
+        """Return the loaded skills a skill depends on directly.
+
+        Raises:
+            KeyError: If no skill with that name is loaded.
+        """
+        skill = self.get_skill(name)
+        if skill is None:
+            raise KeyError(f"Skill '{name}' not found in registry")
+        loaded = set(self.skill_names)
+        return [r for r in skill.references if r in loaded]
+
+    def activate_with_dependencies(
+        self, names: list[str], token_budget: int | None = None
+    ) -> list[BatchResult]:
+        """Activate skills together with everything they transitively depend on.
+
+        Returns one result per skill, prerequisites before the skills that
+        need them, each skill once. With a ``token_budget`` (estimated from
+        instruction length), the requested skills are always activated and
+        prerequisites are added nearest first while they fit; the rest are
+        reported as errors instead of activated.
+        """
+        order = dependency_order(names, self.skill_dependencies)
+        skipped: dict[str, int] = {}
+        if token_budget is not None:
+            costs = {name: self._instruction_tokens(name) for name in order}
+            remaining = token_budget - sum(costs[n] for n in set(names))
+            for name in self._by_distance(names):
+                if costs[name] <= remaining:
+                    remaining -= costs[name]
+                else:
+                    skipped[name] = costs[name]
+
+        activated = iter(self.activate_skills([n for n in order if n not in skipped]))
+        return [
+            BatchResult(
+                key=name,
+                error=f"Skipped: ~{skipped[name]} tokens exceed the token budget",
+            )
+            if name in skipped
+            else next(activated)
+            for name in order
+        ]
+
+    def list_resources(self, name: str) -> dict[str, list[str]]:
+        """Return the resource manifest of a skill.
+
+        Maps each resource type ('scripts', 'references', 'assets') that has
+        files to the sorted relative paths within it.
+
+        Raises:
+            KeyError: If no skill with that name is loaded.
+        """
+        skill = self.get_skill(name)
+        if skill is None:
+            raise KeyError(f"Skill '{name}' not found in registry")
+        manifest = {}
+        for rtype in RESOURCE_TYPES:
+            files = skill.resources.list_files(rtype)
+            if files:
+                manifest[rtype] = files
+        return manifest
+
+    def resource_digests(self, name: str) -> dict[str, dict[str, str]]:
+        """Return the resource manifest of a skill with content digests.
+
+        Maps each resource type that has files to ``{relative_path: digest}``,
+        where the digest is ``content_digest`` of the file's contents.
+        Identical files shipped by different skills share a digest. Files
+        that ``read_resource`` cannot return as text, such as images, are
+        left out.
+
+        Raises:
+            KeyError: If no skill with that name is loaded.
+        """
+        digests: dict[str, dict[str, str]] = {}
+        for rtype, files in self.list_resources(name).items():
+            digests[rtype] = {}
+            for f in files:
+                try:
+                    content = self.read_resource(name, rtype, f)
+                except ValueError:
+                    continue  # binary
+                digests[rtype][f] = content_digest(content)
+        return digests
+
+    def run_skill_script(
+        self,
+        skill_name: str,
+        file_path: str,
+        args: Sequence[str] = (),
+        *,
+        timeout: float = DEFAULT_TIMEOUT,
+        max_output: int = DEFAULT_MAX_OUTPUT,
+        memoize: bool = False,
+    ) -> ScriptResult:
+        """Run a script from a skill's ``scripts/`` directory.
+
+        The script runs in a worker of ``script_pool`` with the skill
+        directory as its working directory. With ``memoize``, a result is
+        reused for the same script contents and arguments; only use it for
+        deterministic scripts. Runs that time out are never reused.
+
+        Args:
+            skill_name: Name of the skill.
+            file_path: Relative path within the scripts directory.
+            args: Command-line arguments.
+            timeout: Seconds before the script is killed.
+            max_output: Bytes of stdout and of stderr kept.
+            memoize: Reuse and record results keyed on script hash and args.
+
+        Raises:
+            KeyError: If skill not found.
+            ValueError: If path traversal detected.
+            FileNotFoundError: If the scripts directory or file doesn't exist.
+            OSError: If the script cannot be started.
+        """
+        skill = self.get_skill(skill_name)
+        if skill is None:
+            raise KeyError(f"Skill '{skill_name}' not found in registry")
+        path = validate_resource_path(skill, "scripts", file_path)
+        args = [str(a) for a in args]
+
+        key = None
+        if memoize:
+            with open(path, "rb") as f:
+                key = (hashlib.sha256(f.read()).hexdigest(), tuple(args))
+            state = self._state
+            with state.script_lock:
+                result = state.script_results.get(key)
+                if result is not None:
+                    state.script_results.move_to_end(key)
+            if result is not None:
+                get_instrumentation().add(
+                    "skills.cache.hits", attributes=_SCRIPT_CACHE
+                )
+                return result.model_copy(update={"cached": True})
+            get_instrumentation().add("skills.cache.misses", attributes=_SCRIPT_CACHE)
+
+        pool = self.script_pool or get_script_pool()
+        with timed("skills.script.duration", skill=skill_name):
+            result = pool.run(
+                path, args, cwd=skill.path, timeout=timeout, max_output=max_output
+            )
+        outcome = "timeout" if result.timed_out else "ok" if result.ok else "error"
+        get_instrumentation().add(
+            "skills.script.runs", attributes={"skill": skill_name, "outcome": outcome}
+        )
+        if key is not None and not result.timed_out:
+            state = self._state
+            with state.script_lock:
+                state.script_results[key] = result
+                while len(state.script_results) > _SCRIPT_MEMO_SIZE:
+                    state.script_results.popitem(last=False)
+        return result
+
+    def search_resources(
+        self, query: str, skill_name: str | None = None, limit: int = 10
+    ) -> list[SearchHit]:
+        """Search the text of the skills' references and assets.
+
+        Args:
+            query: Words and quoted phrases (see ``agent_skills.search``).
+            skill_name: Only search this skill.
+            limit: Most files returned.
+
+        Returns:
+            Matching files, best first, with the lines that matched.
+
+        Raises:
+            KeyError: If ``skill_name`` is given and not loaded.
+        """
+        if skill_name is not None and skill_name not in self:
+            raise KeyError(f"Skill '{skill_name}' not found in registry")
+        skills = None if skill_name is None else (skill_name,)
+        with timed("skills.search.duration"):
+            return self.resource_index().search(query, skills, limit)
+
+    def resource_index(self) -> ResourceIndex:
+        """Return the full-text index, first indexing skills not yet in it.
+
+        Skills are indexed on first use, one at a time, and dropped from
+        the index when they change.
+        """
+        state = self._state
+        with state.index_lock:
+            index = state.resource_index
+            if index is None:
+                index = state.resource_index = ResourceIndex()
+            for name in self.skill_names:
+                if name not in index:
+                    self._index_skill(index, name)
+        return index
+
+    def _index_skill(self, index: ResourceIndex, name: str) -> None:
+        with timed("skills.index.duration", skill=name):
+            try:
+                manifest = self.list_resources(name)
+            except KeyError:
+                return
+            files = {}
+            for rtype in SEARCHED_RESOURCE_TYPES:
+                for path in manifest.get(rtype, ()):
+                    try:
+                        files[rtype, path] = self._index_text(name, rtype, path)
+                    except (ValueError, FileNotFoundError):
+                        continue  # binary or vanished
+            index.add_skill(name, files)
+
+    def _index_text(self, skill_name: str, resource_type: str, file_path: str) -> str:
+        return self.read_resource(skill_name, resource_type, file_path)
+
+    def clear_script_results(self) -> None:
+        """Forget all memoized script results."""
+        state = self._state
+        with state.script_lock:
+            state.script_results.clear()
+
+    def _instruction_tokens(self, name: str) -> int:
+        skill = self.get_skill(name)
+        return 0 if skill is None else estimate_tokens(skill.instructions)
+
+    def _by_distance(self, names: list[str]) -> list[str]:
+        """Prerequisites of ``names`` (excluding them), nearest first."""
+        seen = set(names)
+        frontier = list(names)
+        found = []
+        while frontier:
+            next_frontier = []
+            for name in frontier:
+                try:
+                    deps = self.skill_dependencies(name)
+                except KeyError:
+                    continue
+                for dep in deps:
+                    if dep not in seen:
+                        seen.add(dep)
+                        found.append(dep)
+                        next_frontier.append(dep)
+            frontier = next_frontier
+        return found
+
+    def add_change_listener(self, listener: Callable[[str], None]) -> None:
+        """Register a callback invoked with a skill name when that skill changes."""
+        self._state.change_listeners.append(listener)
+
+    def remove_change_listener(self, listener: Callable[[str], None]) -> None:
+        """Unregister a callback previously passed to ``add_change_listener``."""
+        self._state.change_listeners.remove(listener)
+
+    def _notify_changed(self, name: str) -> None:
+        state = self._state
+        if state.resource_index is not None:
+            state.resource_index.remove_skill(name)
+        for listener in list(state.change_listeners):
+            listener(name)
+
+    def category_tree(self) -> CategoryTree:
+        """Return the category hierarchy of the loaded skills."""
+        return CategoryTree(self.list_skills())
+
+    def to_system_prompt(
+        self, custom_sys_prompt: str, hierarchical: bool = False
+    ) -> str:
+        """Generate the system prompt XML block for all loaded skills.
+
+        With ``hierarchical``, only uncategorized skills are listed, followed
+        by a summary of each top-level category.
+        """
+        if hierarchical:
+            categories, skills = self.category_tree().expand()
+            return render_system_prompt(custom_sys_prompt, skills, categories)
         return render_system_prompt(custom_sys_prompt, self.list_skills())
 
-    def get_tools(self) -> list:
-        """Create and return Strands agent tools bound to this registry."""
-        return create_skill_tools(self)
+    def to_cacheable_prompt(
+        self, custom_sys_prompt: str, hierarchical: bool = False
+    ) -> CacheablePrompt:
+        """Generate a byte-stable, cache-friendly system prompt for all skills."""
+        if hierarchical:
+            categories, skills = self.category_tree().expand()
+            return render_cacheable_prompt(custom_sys_prompt, skills, categories)
+        return render_cacheable_prompt(custom_sys_prompt, self.list_skills())
+
+    def scoped(self, names: Iterable[str]) -> ScopedSkillRegistry:
+        """Return a read-only view exposing only the named skills."""
+        from .views import ScopedSkillRegistry
+
+        return ScopedSkillRegistry(self, names)
+
+    def get_tools(self, **options: object) -> list:
+        """Create and return Strands agent tools bound to this registry.
+
+        Keyword arguments are passed to ``create_skill_tools``.
+        """
+        from .tools import create_skill_tools
+
+        return create_skill_tools(self, **options)
 
 
 class FileSystemSkillRegistry(SkillRegistry):
@@ -82,10 +471,70 @@ class FileSystemSkillRegistry(SkillRegistry):
         tools = repo.get_tools()
 
         agent = Agent(tools=tools, system_prompt=system_prompt)
+
+    Args:
+        cache_resources: Keep resource contents and manifests in memory
+            after the first read. Contents are stored by digest, so a file
+            shipped by several skills is held once. Reloading a skill drops
+            its entries.
+        usage: Profile that records activations and resource reads. It
+            drives ``warm_up`` and activation prefetching.
+        prefetch_on_activate: When a skill is activated, read its usual
+            follow-up resources (per ``usage``) into the cache in the
+            background.
+        max_background_workers: Size of the thread pool used for warm-up
+            and prefetching.
+        compresslevel: zlib level (1-9) for keeping instruction bodies and
+            cached resources compressed in memory; 0 keeps plain strings.
+            With compression, ``get_skill`` returns a copy of the stored
+            skill with its instructions decompressed.
+        hot_size: Number of decompressed bodies and resources (each) kept
+            so repeated access skips decompression.
+        script_pool: Pool that runs ``run_skill_script``; by default the
+            shared process-wide pool.
+        index_resources: Add each skill's text references and assets to
+            the full-text index as it is loaded, instead of on the first
+            ``search_resources`` call.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        *,
+        cache_resources: bool = False,
+        usage: UsageProfile | None = None,
+        prefetch_on_activate: bool = False,
+        max_background_workers: int = 4,
+        compresslevel: int = 0,
+        hot_size: int = 64,
+        script_pool: ScriptPool | None = None,
+        index_resources: bool = False,
+    ) -> None:
+        super().__init__()
+        self.script_pool = script_pool
+        self._index_resources = index_resources
         self._skills: dict[str, Skill] = {}
+        self._bodies = BlobStore(compresslevel, hot_size)
+        self._body_digests: dict[str, str] = {}
+        self._graph = SkillGraph()
+        self._category_tree: CategoryTree | None = None
+        self._sources: dict[str, int] = {}
+        self._versions: dict[str, str] = {}
+        self._since: dict[str, int] = {}
+        self._retired: dict[str, list[ResidentVersion]] = {}
+        self._sessions: Counter[int] = Counter()
+        self._epoch = 0
+        self._version_lock = threading.Lock()
+        self.usage = usage
+        self._cache_resources = cache_resources
+        self._prefetch_on_activate = prefetch_on_activate
+        self._blobs = BlobStore(compresslevel, hot_size)
+        self._resource_cache: dict[tuple[str, str, str], str] = {}
+        self._manifest_cache: dict[str, dict[str, list[str]]] = {}
+        self._digest_cache: dict[str, dict[str, dict[str, str]]] = {}
+        self._cache_lock = threading.Lock()
+        self._max_background_workers = max_background_workers
+        self._executor: ThreadPoolExecutor | None = None
+        self._executor_lock = threading.Lock()
 
     def load_skill(self, path: str | Path) -> Skill:
         """Load a single skill from a directory path.
@@ -100,38 +549,216 @@ class FileSystemSkillRegistry(SkillRegistry):
             FileNotFoundError: If the path or SKILL.md doesn't exist.
             ValueError: If the skill is invalid or already loaded.
         """
+        mtime = _mtime_ns(Path(path) / "SKILL.md")
+        return self._add_skill(parse_skill(path), mtime)
+
+    def reload_skill(self, name: str) -> Skill:
+        """Re-parse a loaded skill from its directory and replace it.
+
+        Change listeners are notified with the skill name. The directory
+        already holds the new version, so open sessions move to it too; use
+        ``load_skill_version`` with a new directory to keep the replaced
+        version for them.
+
+        Raises:
+            KeyError: If no skill with that name is loaded.
+            FileNotFoundError: If the skill directory or SKILL.md is gone.
+            ValueError: If the updated skill is invalid.
+        """
+        current = self._skills.get(name)
+        if current is None:
+            raise KeyError(f"Skill '{name}' not found in registry")
+        mtime = _mtime_ns(current.path / "SKILL.md")
+        skill = parse_skill(current.path, _folder_category(current))
+        self._sources[str(skill.path / "SKILL.md")] = mtime
+        self._replace_skill(skill)
+        return skill
+
+    def load_skill_version(self, path: str | Path) -> Skill:
+        """Load a skill directory as the new current version of its skill.
+
+        Unlike ``load_skill``, a skill with the same name may already be
+        loaded; sessions started before keep the version they were pinned
+        to (see ``session``). Change listeners are notified with the skill
+        name.
+
+        Raises:
+            FileNotFoundError: If the path or SKILL.md doesn't exist.
+            ValueError: If the skill is invalid or this version is loaded.
+        """
+        mtime = _mtime_ns(Path(path) / "SKILL.md")
         skill = parse_skill(path)
-        if skill.metadata.name in self._skills:
-            raise ValueError(f"Skill '{skill.metadata.name}' is already loaded")
-        self._skills[skill.metadata.name] = skill
+        name = skill.metadata.name
+        current = self._skills.get(name)
+        if current is None:
+            return self._add_skill(skill, mtime)
+        version = skill_version(skill)
+        if version == self._versions[name]:
+            raise ValueError(f"Version '{version}' of skill '{name}' is already loaded")
+        if current.path != skill.path:
+            self._sources.pop(str(current.path / "SKILL.md"), None)
+        self._sources[str(skill.path / "SKILL.md")] = mtime
+        self._replace_skill(skill)
         return skill
 
-    def load_skills_from_directory(self, path: str | Path) -> list[Skill]:
+    def session(self) -> SkillSession:
+        """Start a session pinned to the skill versions current now.
+
+        The session is a registry view that keeps serving these versions
+        after skills are replaced with ``load_skill_version`` from another
+        directory. Skills loaded later, or reloaded in place, are visible as
+        they are. A replaced version stays resident, with a copy of its text
+        resources, until the last session pinned to it is closed.
+
+        Usage::
+
+            with registry.session() as session:
+                agent = Agent(tools=session.get_tools(), ...)
+        """
+        from .sessions import SkillSession
+
+        with self._version_lock:
+            epoch = self._epoch
+            self._sessions[epoch] += 1
+        return SkillSession(self, epoch)
+
+    def resident_versions(self, name: str) -> list[str]:
+        """Return the resident versions of a skill, oldest first.
+
+        The last one is the current version.
+
+        Raises:
+            KeyError: If no skill with that name is loaded.
+        """
+        if name not in self._skills:
+            raise KeyError(f"Skill '{name}' not found in registry")
+        with self._version_lock:
+            retired = [r.version for r in self._retired.get(name, ())]
+        return [*retired, self._versions[name]]
+
+    def load_skills_from_directory(
+        self, path: str | Path, max_depth: int = 1
+    ) -> list[Skill]:
         """Load all skills from subdirectories of the given path.
 
-        Each immediate subdirectory containing a SKILL.md is treated as a skill.
+        Each subdirectory containing a SKILL.md is treated as a skill. Other
+        subdirectories are searched as category folders, down to
+        ``max_depth`` levels below ``path`` (see ``discover_skills``).
 
         Args:
             path: Parent directory containing skill subdirectories.
+            max_depth: Deepest level below ``path`` at which skills are found;
+                1 only loads immediate subdirectories.
 
         Returns:
             List of successfully loaded Skill instances.
         """
         parent = Path(path).resolve()
+        self._sources[str(parent)] = _mtime_ns(parent)
         loaded = []
-        for child in sorted(parent.iterdir()):
-            if child.is_dir() and (child / "SKILL.md").is_file():
-                loaded.append(self.load_skill(child))
+        with timed("skills.load_directory.duration"):
+            tree = discover_skills(parent, max_depth)
+            for category in tree.categories:
+                self._sources[str(category)] = _mtime_ns(category)
+            for location in tree.skills:
+                skill = parse_skill_location(location)
+                loaded.append(self._add_skill(skill, location.mtime_ns))
         return loaded
 
+    def save_snapshot(self, path: str | Path) -> Path:
+        """Write the loaded state to a snapshot file for fast startup.
+
+        The snapshot is a skill catalog (see ``agent_skills.shared``) holding
+        metadata, bodies, manifests and dependency references, plus the
+        modification times of every loaded SKILL.md and skills directory as
+        they were when loaded, and of every skill and resource directory as
+        they are now. Keep it outside the skills directories, since writing
+        it there would itself make the snapshot stale.
+        """
+        from .shared import encode_catalog
+
+        # Taken before the manifests are listed, so a file added meanwhile
+        # makes the snapshot stale rather than silently missing.
+        resource_dirs: dict[str, int] = {}
+        for skill in self._skills.values():
+            resource_dirs.update(_resource_dir_mtimes(skill))
+        extra = {
+            "snapshot": {
+                "version": SNAPSHOT_VERSION,
+                "sources": self._sources,
+                "resource_dirs": resource_dirs,
+            }
+        }
+        path = Path(path)
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_bytes(encode_catalog(self, extra=extra))
+        tmp.replace(path)
+        return path
+
+    @classmethod
+    def load_snapshot(
+        cls, path: str | Path, *, check_sources: bool = True, **options
+    ) -> FileSystemSkillRegistry:
+        """Create a registry from a snapshot written by ``save_snapshot``.
+
+        No SKILL.md is parsed and no model is validated again. Resources are
+        still read from the skill directories.
+
+        Args:
+            path: The snapshot file.
+            check_sources: Verify that no recorded SKILL.md, skills directory
+                or resource directory was modified, added to or removed since
+                it was recorded.
+            **options: Keyword arguments for the registry constructor.
+
+        Raises:
+            FileNotFoundError: If the snapshot does not exist.
+            ValueError: If the file is not a snapshot of a supported version,
+                or it is stale.
+        """
+        from .shared import decode_catalog, read_blob
+
+        data = Path(path).read_bytes()
+        catalog, blob_start = decode_catalog(data)
+        snapshot = catalog.get("snapshot", {})
+        if snapshot.get("version") != SNAPSHOT_VERSION:
+            raise ValueError(f"Not a supported registry snapshot: {path}")
+        sources: dict[str, int] = snapshot["sources"]
+        if check_sources:
+            recorded = {**sources, **snapshot["resource_dirs"]}
+            for source, mtime in recorded.items():
+                if _mtime_ns(source) != mtime:
+                    raise ValueError(f"Snapshot is stale: {source} changed")
+
+        registry = cls(**options)
+        registry._sources = dict(sources)
+        for name, entry in catalog["skills"].items():
+            body = read_blob(data, catalog, blob_start, entry["body"])
+            registry._store_skill(load_skill_record(entry, body))
+            if registry._cache_resources:
+                registry._manifest_cache[name] = entry["manifest"]
+            registry._index_loaded(name)
+        return registry
+
     def get_skill(self, name: str) -> Skill | None:
         """Get a loaded skill by name."""
-        return self._skills.get(name)
+        skill = self._skills.get(name)
+        digest = self._body_digests.get(name)
+        if skill is None or digest is None:
+            return skill
+        return skill.model_copy(update={"instructions": self._bodies.get(digest)})
 
     def list_skills(self) -> list[SkillMetadata]:
         """Return metadata for all loaded skills."""
         return [s.metadata for s in self._skills.values()]
 
+    def category_tree(self) -> CategoryTree:
+        """Return the category hierarchy, rebuilt after skills change."""
+        tree = self._category_tree
+        if tree is None:
+            tree = self._category_tree = CategoryTree(self.list_skills())
+        return tree
+
     def activate_skill(self, name: str) -> str:
         """Mark a skill as activated and return its full instructions.
 
@@ -144,11 +771,46 @@ class FileSystemSkillRegistry(SkillRegistry):
         Raises:
             KeyError: If no skill with that name is loaded.
         """
-        skill = self._skills.get(name)
-        if skill is None:
-            raise KeyError(f"Skill '{name}' not found in registry")
-        skill.activated = True
-        return skill.instructions
+        with timed("skills.activate.duration", skill=name):
+            skill = self._skills.get(name)
+            if skill is None:
+                raise KeyError(f"Skill '{name}' not found in registry")
+            skill.activated = True
+            instructions = self._instructions(name, skill)
+        get_instrumentation().add("skills.activations", attributes={"skill": name})
+        if self.usage is not None:
+            self.usage.record_activation(name)
+            if self._prefetch_on_activate:
+                for rtype, fpath in self.usage.follow_up_resources(name):
+                    if (name, rtype, fpath) not in self._resource_cache:
+                        self._submit(self._warm_resource, name, rtype, fpath)
+        return instructions
+
+    def activate_skills(
+        self, names: list[str], max_workers: int = 8
+    ) -> list[BatchResult]:
+        """Activate several skills.
+
+        Bodies are held in memory, so they are activated inline, in order;
+        ``max_workers`` is accepted for compatibility.
+        """
+        return _run_batch([(name, self.activate_skill, (name,)) for name in names], 1)
+
+    def read_resources(
+        self, requests: list[tuple[str, str, str]], max_workers: int = 8
+    ) -> list[BatchResult]:
+        """Read several resource files (see ``SkillRegistry.read_resources``).
+
+        Files already in the resource cache are read inline; only the others,
+        which need disk I/O, are read concurrently.
+        """
+        calls = [("/".join(req), self.read_resource, req) for req in requests]
+        cached = self._resource_cache
+        misses = [i for i, req in enumerate(requests) if tuple(req) not in cached]
+        read = dict(zip(misses, _run_batch([calls[i] for i in misses], max_workers)))
+        return [
+            read[i] if i in read else _run_call(call) for i, call in enumerate(calls)
+        ]
 
     def read_resource(self, skill_name: str, resource_type: str, file_path: str) -> str:
         """Read a resource file from a skill.
@@ -163,15 +825,333 @@ class FileSystemSkillRegistry(SkillRegistry):
 
         Raises:
             KeyError: If skill not found.
-            ValueError: If resource_type is invalid or path traversal detected.
+            ValueError: If resource_type is invalid, path traversal is detected
+                or the file is not UTF-8 text.
             FileNotFoundError: If resource directory or file doesn't exist.
         """
+        key = (skill_name, resource_type, file_path)
+        content = self._cached_resource(key)
+        if content is not None:
+            get_instrumentation().add("skills.cache.hits", attributes=_RESOURCE_CACHE)
+        else:
+            if self._cache_resources:
+                get_instrumentation().add(
+                    "skills.cache.misses", attributes=_RESOURCE_CACHE
+                )
+            skill = self._skills.get(skill_name)
+            content = _read_resource_file(skill, skill_name, resource_type, file_path)
+            if self._cache_resources:
+                _, content = self._cache_resource(key, content)
+
+        if self.usage is not None:
+            self.usage.record_resource_read(skill_name, resource_type, file_path)
+        return content
+
+    def list_resources(self, name: str) -> dict[str, list[str]]:
+        """Return the resource manifest of a skill, cached if enabled."""
+        manifest = self._manifest_cache.get(name)
+        if manifest is None:
+            manifest = super().list_resources(name)
+            if self._cache_resources:
+                self._manifest_cache[name] = manifest
+        return {rtype: list(files) for rtype, files in manifest.items()}
+
+    def skill_dependencies(self, name: str) -> list[str]:
+        """Return the loaded skills a skill depends on directly."""
+        try:
+            return self._graph.dependencies(name)
+        except KeyError:
+            raise KeyError(f"Skill '{name}' not found in registry") from None
+
+    def resource_digests(self, name: str) -> dict[str, dict[str, str]]:
+        """Return the digest manifest of a skill, cached if enabled.
+
+        Contents read to compute digests populate the resource cache.
+        """
+        digests = self._digest_cache.get(name)
+        if digests is None:
+            skill = self._skills.get(name)
+            digests = {}
+            for rtype, files in self.list_resources(name).items():
+                digests[rtype] = {}
+                for f in files:
+                    try:
+                        digests[rtype][f] = self._resource_digest(skill, name, rtype, f)
+                    except ValueError:
+                        continue  # binary
+            if self._cache_resources:
+                self._digest_cache[name] = digests
+        return {rtype: dict(files) for rtype, files in digests.items()}
+
+    @property
+    def blobs(self) -> BlobStore:
+        """Unique resource contents held by the cache."""
+        return self._blobs
+
+    @property
+    def bodies(self) -> BlobStore:
+        """Instruction bodies, when held compressed (see ``compresslevel``)."""
+        return self._bodies
+
+    def warm_up(self, top_n: int = 10) -> list[Future]:
+        """Warm the most used skills in the background.
+
+        For the ``top_n`` most activated skills in ``usage``, builds their
+        resource manifests and reads their usual follow-up resources on the
+        background pool. Reads populate the in-memory cache when
+        ``cache_resources`` is enabled and the OS page cache in any case.
+
+        Returns:
+            Futures for the submitted tasks; failures are swallowed so a
+            stale profile entry cannot break startup.
+        """
+        if self.usage is None:
+            return []
+        futures = []
+        for name in self.usage.top_skills(top_n):
+            if name not in self._skills:
+                continue
+            futures.append(self._submit(self._warm_manifest, name))
+            for rtype, fpath in self.usage.follow_up_resources(name, min_ratio=0):
+                futures.append(self._submit(self._warm_resource, name, rtype, fpath))
+        return futures
+
+    def close(self) -> None:
+        """Stop the background pool after its submitted tasks finish."""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
+    def _submit(self, func: Callable[..., None], *args: str) -> Future:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    self._max_background_workers, thread_name_prefix="skill-warm-up"
+                )
+            return self._executor.submit(func, *args)
+
+    def _warm_manifest(self, name: str) -> None:
+        with contextlib.suppress(KeyError):
+            self.list_resources(name)
+
+    def _warm_resource(self, skill_name: str, resource_type: str, file_path: str) -> None:
+        key = (skill_name, resource_type, file_path)
+        if key in self._resource_cache:
+            return
         skill = self._skills.get(skill_name)
-        if skill is None:
-            raise KeyError(f"Skill '{skill_name}' not found in registry")
+        with contextlib.suppress(KeyError, ValueError, FileNotFoundError):
+            content = _read_resource_file(skill, skill_name, resource_type, file_path)
+            if self._cache_resources:
+                self._cache_resource(key, content)
 
-        resolved_path = validate_resource_path(skill, resource_type, file_path)
-        return resolved_path.read_text(encoding="utf-8")
+    def _add_skill(self, skill: Skill, mtime_ns: int) -> Skill:
+        if skill.metadata.name in self._skills:
+            raise ValueError(f"Skill '{skill.metadata.name}' is already loaded")
+        self._sources[str(skill.path / "SKILL.md")] = mtime_ns
+        self._store_skill(skill)
+        self._notify_changed(skill.metadata.name)
+        self._index_loaded(skill.metadata.name)
+        return skill
+
+    def _replace_skill(self, skill: Skill) -> None:
+        name = skill.metadata.name
+        if skill_version(skill) != self._versions[name]:
+            self._retire(name, skill)
+        self._drop_cached(name)
+        self._store_skill(skill)
+        self._notify_changed(name)
+        self._index_loaded(name)
+
+    def _index_loaded(self, name: str) -> None:
+        if not self._index_resources:
+            return
+        state = self._state
+        with state.index_lock:
+            if state.resource_index is None:
+                state.resource_index = ResourceIndex()
+            self._index_skill(state.resource_index, name)
+
+    def _index_text(self, skill_name: str, resource_type: str, file_path: str) -> str:
+        # Read past the cache and usage profile: indexing is not a real read.
+        skill = self._skills.get(skill_name)
+        return _read_resource_file(skill, skill_name, resource_type, file_path)
+
+    def _retire(self, name: str, replacement: Skill) -> None:
+        """Make the current version of a skill resident if sessions use it.
+
+        Its text resources are copied into the blob store, where files that
+        did not change are shared with the new version. The files are read
+        without holding ``_version_lock``. A version replaced in place is not
+        kept: its files already hold the new version.
+        """
+        with self._version_lock:
+            self._epoch += 1
+            since, until = self._since[name], self._epoch
+            if not any(since <= epoch < until for epoch in self._sessions):
+                return
+            skill = self._skills[name]
+            version = self._versions[name]
+        if skill.path.resolve() == replacement.path.resolve():
+            return
+
+        # The version stays current until the replacement is stored, so its
+        # files are still in place. Cached files are moved over below.
+        with self._cache_lock:
+            cached = {key[1:] for key in self._resource_cache if key[0] == name}
+        copies: dict[tuple[str, str], str] = {}
+        for rtype, files in self.list_resources(name).items():
+            for f in files:
+                if (rtype, f) in cached:
+                    continue
+                try:
+                    content = _read_resource_file(skill, name, rtype, f)
+                except (ValueError, FileNotFoundError):
+                    continue  # binary or vanished
+                copies[rtype, f], _ = self._blobs.add(content)
+
+        with self._version_lock:
+            retained = any(since <= epoch < until for epoch in self._sessions)
+            if retained:
+                body = self._body_digests.pop(name, None)
+                if body is None:
+                    body, _ = self._bodies.add(skill.instructions)
+                resident = ResidentVersion(
+                    skill.model_copy(update={"instructions": ""}),
+                    version,
+                    since,
+                    until,
+                    body,
+                )
+                with self._cache_lock:
+                    for key in [k for k in self._resource_cache if k[0] == name]:
+                        resident.resources[key[1:]] = self._resource_cache.pop(key)
+                for key, digest in copies.items():
+                    if key in resident.resources:
+                        self._blobs.release(digest)
+                    else:
+                        resident.resources[key] = digest
+                self._retired.setdefault(name, []).append(resident)
+        if not retained:
+            # The pinned sessions ended while the files were copied.
+            for digest in copies.values():
+                self._blobs.release(digest)
+            return
+        get_instrumentation().add(
+            "skills.versions.retained", attributes={"skill": name}
+        )
+
+    def _resident(self, name: str, epoch: int) -> ResidentVersion | None:
+        """The replaced version a session at ``epoch`` is pinned to, if any."""
+        if self._since.get(name, 0) <= epoch:
+            return None
+        with self._version_lock:
+            for resident in self._retired.get(name, ()):
+                if resident.serves(epoch):
+                    return resident
+        return None
+
+    def _resident_instructions(self, resident: ResidentVersion) -> str:
+        return self._bodies.get(resident.body)
+
+    def _read_resident_resource(
+        self, resident: ResidentVersion, resource_type: str, file_path: str
+    ) -> str:
+        """Read a resource of a replaced version from the copy kept of it."""
+        digest = resident.resources.get((resource_type, file_path))
+        if digest is None:
+            # Not a text file of this version: fail as reading it would.
+            validate_resource_path(resident.skill, resource_type, file_path)
+            raise FileNotFoundError(
+                f"Resource '{resource_type}/{file_path}' is not available in "
+                f"version '{resident.version}' of skill "
+                f"'{resident.skill.metadata.name}'"
+            )
+        get_instrumentation().add("skills.cache.hits", attributes=_RESOURCE_CACHE)
+        return self._blobs.get(digest)
+
+    def _end_session(self, epoch: int) -> None:
+        """Release a session's pin and collect versions no session uses."""
+        collected = []
+        with self._version_lock:
+            self._sessions[epoch] -= 1
+            if self._sessions[epoch] <= 0:
+                del self._sessions[epoch]
+            for name, residents in list(self._retired.items()):
+                keep = []
+                for resident in residents:
+                    if any(resident.serves(e) for e in self._sessions):
+                        keep.append(resident)
+                    else:
+                        collected.append(resident)
+                if keep:
+                    self._retired[name] = keep
+                else:
+                    del self._retired[name]
+        for resident in collected:
+            self._bodies.release(resident.body)
+            for digest in resident.resources.values():
+                self._blobs.release(digest)
+            get_instrumentation().add(
+                "skills.versions.collected",
+                attributes={"skill": resident.skill.metadata.name},
+            )
+
+    def _store_skill(self, skill: Skill) -> None:
+        name = skill.metadata.name
+        version = skill_version(skill)
+        if self._versions.get(name) != version:
+            self._versions[name] = version
+            self._since[name] = self._epoch
+        if self._bodies.compresslevel:
+            self._body_digests[name], _ = self._bodies.add(skill.instructions)
+            skill = skill.model_copy(update={"instructions": ""})
+        self._skills[name] = skill
+        self._graph.set(name, skill.references)
+        self._category_tree = None
+
+    def _instructions(self, name: str, skill: Skill) -> str:
+        digest = self._body_digests.get(name)
+        return skill.instructions if digest is None else self._bodies.get(digest)
+
+    def _cached_resource(self, key: tuple[str, str, str]) -> str | None:
+        digest = self._resource_cache.get(key)
+        return None if digest is None else self._blobs.get(digest)
+
+    def _cache_resource(
+        self, key: tuple[str, str, str], content: str
+    ) -> tuple[str, str]:
+        """Cache contents under ``key``; returns the digest and shared contents."""
+        with self._cache_lock:
+            digest = self._resource_cache.get(key)
+            if digest is not None:
+                return digest, self._blobs.get(digest)
+            digest, content = self._blobs.add(content)
+            self._resource_cache[key] = digest
+        return digest, content
+
+    def _resource_digest(
+        self, skill: Skill | None, skill_name: str, resource_type: str, file_path: str
+    ) -> str:
+        key = (skill_name, resource_type, file_path)
+        digest = self._resource_cache.get(key)
+        if digest is None:
+            content = _read_resource_file(skill, skill_name, resource_type, file_path)
+            if self._cache_resources:
+                digest, _ = self._cache_resource(key, content)
+            else:
+                digest = content_digest(content)
+        return digest
+
+    def _drop_cached(self, name: str) -> None:
+        digest = self._body_digests.pop(name, None)
+        if digest is not None:
+            self._bodies.release(digest)
+        with self._cache_lock:
+            self._manifest_cache.pop(name, None)
+            self._digest_cache.pop(name, None)
+            for key in [k for k in self._resource_cache if k[0] == name]:
+                self._blobs.release(self._resource_cache.pop(key))
 
     @property
     def skill_names(self) -> list[str]:
@@ -183,3 +1163,123 @@ class FileSystemSkillRegistry(SkillRegistry):
 
     def __contains__(self, name: str) -> bool:
         return name in self._skills
+
+
+_RESOURCE_CACHE = {"cache": "resources"}
+_SCRIPT_CACHE = {"cache": "scripts"}
+_SCRIPT_MEMO_SIZE = 256
+
+SNAPSHOT_VERSION = 2
+
+
+def _mtime_ns(path: str | Path) -> int:
+    """Modification time of ``path``, or -1 if it does not exist."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return -1
+
+
+def _resource_dir_mtimes(skill: Skill) -> dict[str, int]:
+    """Modification times of a skill's directory and all its resource folders.
+
+    Adding or removing a resource file or folder changes one of them.
+    """
+    mtimes = {str(skill.path): _mtime_ns(skill.path)}
+    for rtype in RESOURCE_TYPES:
+        top = getattr(skill.resources, f"{rtype}_dir")
+        if top is not None:
+            for dirpath, _, _ in os.walk(top):
+                mtimes[dirpath] = _mtime_ns(dirpath)
+    return mtimes
+
+
+def _folder_category(skill: Skill) -> str:
+    """Category of a skill if it matches the folders above its directory.
+
+    Lets a reload keep a category that discovery took from category folders.
+    """
+    category = skill_category(skill.metadata)
+    parts = category.split("/") if category else []
+    parents = skill.path.parts[-1 - len(parts) : -1] if parts else ()
+    return category if list(parents) == parts else ""
+
+
+def _read_resource_file(
+    skill: Skill | None, skill_name: str, resource_type: str, file_path: str
+) -> str:
+    """Read a resource of a locally available skill, recording metrics."""
+    attributes = {"skill": skill_name, "resource_type": resource_type}
+    with timed("skills.resource.read.duration", **attributes):
+        if skill is None:
+            raise KeyError(f"Skill '{skill_name}' not found in registry")
+
+        resolved_path = validate_resource_path(skill, resource_type, file_path)
+        with open(resolved_path, encoding="utf-8") as f:
+            try:
+                content = f.read()
+            except UnicodeDecodeError:
+                raise ValueError(
+                    f"Resource '{resource_type}/{file_path}' of skill "
+                    f"'{skill_name}' is not UTF-8 text"
+                ) from None
+            size = f.buffer.tell()
+    get_instrumentation().add("skills.resource.bytes_read", size, attributes)
+    return content
+
+
+_batch_executor: ThreadPoolExecutor | None = None
+_batch_executor_lock = threading.Lock()
+
+
+def _get_batch_executor() -> ThreadPoolExecutor:
+    """Return the thread pool shared by batch reads, creating it on first use."""
+    global _batch_executor
+    with _batch_executor_lock:
+        if _batch_executor is None:
+            _batch_executor = ThreadPoolExecutor(thread_name_prefix="skill-batch")
+        return _batch_executor
+
+
+def _run_call(call: tuple[str, Callable[..., str], tuple]) -> BatchResult:
+    key, func, args = call
+    try:
+        return BatchResult(key=key, content=func(*args))
+    except (KeyError, ValueError, FileNotFoundError) as e:
+        return BatchResult(key=key, error=str(e))
+
+
+def _run_batch(
+    calls: list[tuple[str, Callable[..., str], tuple]], max_workers: int
+) -> list[BatchResult]:
+    """Run ``calls`` with up to ``max_workers`` at a time, results in order.
+
+    The calling thread takes part and the rest run on the shared batch pool,
+    so a batch always makes progress even when the pool is busy (or when it
+    is started from a pool thread).
+    """
+    workers = min(max_workers, len(calls))
+    if workers <= 1:
+        return [_run_call(call) for call in calls]
+
+    results: list[BatchResult | None] = [None] * len(calls)
+    pending = iter(enumerate(calls))
+    lock = threading.Lock()
+
+    def drain() -> None:
+        while True:
+            with lock:
+                item = next(pending, None)
+            if item is None:
+                return
+            index, call = item
+            results[index] = _run_call(call)
+
+    executor = _get_batch_executor()
+    futures = [executor.submit(drain) for _ in range(workers - 1)]
+    drain()
+    for future in futures:
+        # Helpers that have not started yet would find nothing left to do.
+        if not future.cancel():
+            future.result()
+    return results
@@ -0,0 +1,308 @@
+"""Skill registry client for a ``SkillServer`` running in another process."""
+
+from __future__ import annotations
+
+import http.client
+import json
+import queue
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import quote, urlsplit
+
+from ._records import load_skill_metadata, load_skill_record
+from .instrumentation import get_instrumentation, timed
+from .models import BatchResult, Skill, SkillMetadata
+from .registry import SkillRegistry
+from .server import resource_route
+
+_CACHE_ATTRS = {"cache": "remote"}
+
+_ERROR_TYPES: dict[str, type[Exception]] = {
+    "KeyError": KeyError,
+    "ValueError": ValueError,
+    "FileNotFoundError": FileNotFoundError,
+}
+
+
+class _ConnectionPool:
+    """Thread-safe pool of keep-alive HTTP connections to one host."""
+
+    def __init__(self, host: str, port: int, size: int, timeout: float) -> None:
+        self._host = host
+        self._port = port
+        self._timeout = timeout
+        self._idle: queue.LifoQueue[http.client.HTTPConnection] = queue.LifoQueue(size)
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        body: bytes | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> tuple[int, dict[str, str], bytes]:
+        """Send a request, retrying once if a pooled connection went stale."""
+        for attempt in range(2):
+            conn = self._acquire()
+            try:
+                conn.request(method, path, body=body, headers=headers or {})
+                response = conn.getresponse()
+                data = response.read()
+            except (http.client.HTTPException, ConnectionError):
+                conn.close()
+                if attempt:
+                    raise
+                continue
+            self._release(conn)
+            return response.status, dict(response.getheaders()), data
+        raise AssertionError("unreachable")
+
+    def close(self) -> None:
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+    def _acquire(self) -> http.client.HTTPConnection:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            return http.client.HTTPConnection(
+                self._host, self._port, timeout=self._timeout
+            )
+
+    def _release(self, conn: http.client.HTTPConnection) -> None:
+        try:
+            self._idle.put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+
+class RemoteSkillRegistry(SkillRegistry):
+    """Registry backed by a ``SkillServer`` over HTTP.
+
+    Responses are cached client-side by URL together with their ETag. Within
+    ``cache_ttl`` seconds cached entries are served without a request; after
+    that they are revalidated with ``If-None-Match``, which costs a round trip
+    but no payload when nothing changed. At most ``cache_size`` responses are
+    kept; the least recently used are dropped first. Activation state is
+    local to this client.
+
+    Args:
+        base_url: Server URL, e.g. ``http://127.0.0.1:8765``.
+        pool_size: Maximum number of idle keep-alive connections kept open.
+        timeout: Socket timeout in seconds.
+        cache_ttl: Seconds a cached response is trusted without revalidation.
+        cache_size: Most responses kept in the client cache.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        pool_size: int = 8,
+        timeout: float = 10.0,
+        cache_ttl: float = 0.0,
+        cache_size: int = 1024,
+    ) -> None:
+        super().__init__()
+        parts = urlsplit(base_url)
+        self._pool = _ConnectionPool(
+            parts.hostname or "127.0.0.1", parts.port or 80, pool_size, timeout
+        )
+        self._prefix = parts.path.rstrip("/")
+        self._cache_ttl = cache_ttl
+        self._cache_size = cache_size
+        self._cache: OrderedDict[str, tuple[str, object, float]] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._skills: dict[str, Skill] = {}
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        self._pool.close()
+
+    def __enter__(self) -> RemoteSkillRegistry:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def get_skill(self, name: str) -> Skill | None:
+        """Get a skill by name, or None if the server does not have it."""
+        try:
+            record = self._fetch_skill(name)
+        except KeyError:
+            return None
+        return self._skill_from_record(name, record)
+
+    def list_skills(self) -> list[SkillMetadata]:
+        """Return metadata for all skills on the server."""
+        return [load_skill_metadata(m) for m in self._get("/skills")["skills"]]
+
+    def list_resources(self, name: str) -> dict[str, list[str]]:
+        """Return the resource manifest reported by the server."""
+        manifest = self._fetch_skill(name)["manifest"]
+        return {rtype: list(files) for rtype, files in manifest.items()}
+
+    def activate_skill(self, name: str) -> str:
+        """Mark a skill as activated and return its full instructions.
+
+        Raises:
+            KeyError: If the server has no skill with that name.
+        """
+        with timed("skills.activate.duration", skill=name):
+            record = self._fetch_skill(name)
+            skill = self._skill_from_record(name, record)
+            skill.activated = True
+        get_instrumentation().add("skills.activations", attributes={"skill": name})
+        return skill.instructions
+
+    def read_resource(self, skill_name: str, resource_type: str, file_path: str) -> str:
+        """Read a resource file from a skill via the server.
+
+        Raises:
+            KeyError: If skill not found.
+            ValueError: If resource_type is invalid or path traversal detected.
+            FileNotFoundError: If resource directory or file doesn't exist.
+        """
+        with timed(
+            "skills.resource.read.duration",
+            skill=skill_name,
+            resource_type=resource_type,
+        ):
+            return self._get(resource_route(skill_name, resource_type, file_path))
+
+    def activate_skills(
+        self, names: list[str], max_workers: int = 8
+    ) -> list[BatchResult]:
+        """Activate several skills with a single request to the server."""
+        results = []
+        for name, result in zip(names, self._batch_skills(names)):
+            if "error" in result:
+                results.append(BatchResult(key=name, error=str(_to_exception(result))))
+                continue
+            self._store(result["path"], result["etag"], result["value"])
+            skill = self._skill_from_record(name, result["value"])
+            skill.activated = True
+            get_instrumentation().add("skills.activations", attributes={"skill": name})
+            results.append(BatchResult(key=name, content=skill.instructions))
+        return results
+
+    def read_resources(
+        self, requests: list[tuple[str, str, str]], max_workers: int = 8
+    ) -> list[BatchResult]:
+        """Read several resource files with a single request to the server."""
+        results = []
+        for req, result in zip(requests, self._batch_resources(requests)):
+            key = "/".join(req)
+            if "error" in result:
+                results.append(BatchResult(key=key, error=str(_to_exception(result))))
+                continue
+            self._store(result["path"], result["etag"], result["value"])
+            results.append(BatchResult(key=key, content=result["value"]))
+        return results
+
+    def prefetch(
+        self,
+        skill_names: list[str] = (),
+        resources: list[tuple[str, str, str]] = (),
+    ) -> None:
+        """Fill the client cache for several skills and resources in one request.
+
+        Items the server cannot provide are skipped silently; the error is
+        raised when the item is later requested individually.
+        """
+        results = self._batch_skills(skill_names) + self._batch_resources(resources)
+        for result in results:
+            if "error" not in result:
+                self._store(result["path"], result["etag"], result["value"])
+
+    @property
+    def skill_names(self) -> list[str]:
+        """Return names of all skills on the server."""
+        return [m["name"] for m in self._get("/skills")["skills"]]
+
+    def __len__(self) -> int:
+        return len(self._get("/skills")["skills"])
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.skill_names
+
+    def _fetch_skill(self, name: str) -> dict:
+        return self._get(f"/skills/{quote(name, safe='')}")
+
+    def _skill_from_record(self, name: str, record: dict) -> Skill:
+        skill = self._skills.get(name)
+        if skill is not None and skill.instructions == record["instructions"]:
+            return skill
+        skill = load_skill_record(record, record["instructions"])
+        self._skills[name] = skill
+        return skill
+
+    def _get(self, path: str) -> object:
+        with self._cache_lock:
+            cached = self._cache.get(path)
+            if cached is not None:
+                self._cache.move_to_end(path)
+        headers = {}
+        if cached is not None:
+            etag, value, stored_at = cached
+            if time.monotonic() - stored_at < self._cache_ttl:
+                get_instrumentation().add("skills.cache.hits", attributes=_CACHE_ATTRS)
+                return value
+            headers["If-None-Match"] = etag
+
+        status, response_headers, data = self._pool.request(
+            "GET", self._prefix + path, headers=headers
+        )
+        if status == 304 and cached is not None:
+            get_instrumentation().add("skills.cache.hits", attributes=_CACHE_ATTRS)
+            self._store(path, cached[0], cached[1])
+            return cached[1]
+        get_instrumentation().add("skills.cache.misses", attributes=_CACHE_ATTRS)
+        if status != 200:
+            raise _to_exception(json.loads(data))
+
+        if response_headers.get("Content-Type", "").startswith("application/json"):
+            value = json.loads(data)
+        else:
+            value = data.decode("utf-8")
+        self._store(path, response_headers["ETag"], value)
+        return value
+
+    def _batch_skills(self, names: list[str]) -> list[dict]:
+        return self._batch([{"op": "skill", "name": n} for n in names])
+
+    def _batch_resources(self, requests: list[tuple[str, str, str]]) -> list[dict]:
+        return self._batch(
+            [
+                {"op": "resource", "skill_name": s, "resource_type": t, "file_path": p}
+                for s, t, p in requests
+            ]
+        )
+
+    def _batch(self, requests: list[dict]) -> list[dict]:
+        if not requests:
+            return []
+        body = json.dumps({"requests": requests}).encode("utf-8")
+        status, _, data = self._pool.request(
+            "POST",
+            self._prefix + "/batch",
+            body=body,
+            headers={"Content-Type": "application/json"},
+        )
+        if status != 200:
+            raise _to_exception(json.loads(data))
+        return json.loads(data)["results"]
+
+    def _store(self, path: str, etag: str, value: object) -> None:
+        with self._cache_lock:
+            self._cache[path] = (etag, value, time.monotonic())
+            self._cache.move_to_end(path)
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+
+
+def _to_exception(payload: dict) -> Exception:
+    error = payload["error"]
+    return _ERROR_TYPES.get(error["type"], RuntimeError)(error["message"])
@@ -0,0 +1,183 @@
+"""Running skill scripts in a pool of pre-started worker processes.
+
+Starting an interpreter for every script run costs tens of milliseconds
+before the script does anything. A ``ScriptPool`` keeps a few worker
+processes running; a worker forks itself to run a Python script, so the
+script starts from an initialized interpreter (with any preloaded modules
+already imported), and spawns other scripts directly. Workers enforce the
+timeout and output limits, killing the script's whole process group when it
+runs too long.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import queue
+import subprocess
+import sys
+import threading
+from collections.abc import Sequence
+from pathlib import Path
+
+from .models import ScriptResult
+
+DEFAULT_TIMEOUT = 30.0
+DEFAULT_MAX_OUTPUT = 64 * 1024
+
+_WORKER = str(Path(__file__).with_name("_script_worker.py"))
+
+
+class ScriptPool:
+    """Thread-safe pool of worker processes that run scripts.
+
+    Each worker runs one script at a time; ``run`` blocks while all workers
+    are busy. A worker that dies is replaced.
+
+    Args:
+        size: Number of worker processes, all started up front.
+        preload: Modules each worker imports at startup, so Python scripts
+            that import them start faster.
+    """
+
+    def __init__(self, size: int = 2, preload: Sequence[str] = ()) -> None:
+        if size < 1:
+            raise ValueError("ScriptPool size must be at least 1")
+        self.size = size
+        self._preload = list(preload)
+        # None, once queued by close(), wakes threads waiting for a worker.
+        self._idle: queue.LifoQueue[subprocess.Popen | None] = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._closed = False
+        for _ in range(size):
+            self._idle.put(self._spawn())
+
+    def run(
+        self,
+        path: str | Path,
+        args: Sequence[str] = (),
+        *,
+        cwd: str | Path | None = None,
+        timeout: float = DEFAULT_TIMEOUT,
+        max_output: int = DEFAULT_MAX_OUTPUT,
+    ) -> ScriptResult:
+        """Run a script and wait for it to finish.
+
+        Args:
+            path: Script to run. ``.py`` files run under this Python; other
+                files run directly if executable, ``.sh`` files under ``sh``.
+            args: Command-line arguments.
+            cwd: Working directory; defaults to the script's directory.
+            timeout: Seconds before the script is killed.
+            max_output: Bytes of stdout and of stderr kept; the rest is
+                discarded and the result marked ``truncated``.
+
+        Raises:
+            OSError: If the script cannot be started or the worker dies.
+            RuntimeError: If the pool is closed.
+        """
+        path = os.path.abspath(path)
+        request = {
+            "path": path,
+            "args": [str(a) for a in args],
+            "cwd": str(cwd) if cwd is not None else os.path.dirname(path),
+            "timeout": timeout,
+            "max_output": max_output,
+        }
+        worker = self._acquire()
+        try:
+            worker.stdin.write(json.dumps(request).encode("utf-8") + b"\n")
+            worker.stdin.flush()
+            line = worker.stdout.readline()
+        except OSError:
+            line = b""
+        if not line:
+            self._replace(worker)
+            raise OSError(f"Script worker exited while running {path}")
+        self._release(worker)
+
+        response = json.loads(line)
+        if "error" in response:
+            raise OSError(response["error"])
+        return ScriptResult(**response)
+
+    def close(self) -> None:
+        """Stop the workers; busy workers stop when their script finishes.
+
+        Calls waiting for a worker raise ``RuntimeError``.
+        """
+        with self._lock:
+            self._closed = True
+        while True:
+            try:
+                worker = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            if worker is not None:
+                _stop(worker)
+        self._idle.put(None)
+
+    def _spawn(self) -> subprocess.Popen:
+        return subprocess.Popen(
+            [sys.executable, _WORKER, *self._preload],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+        )
+
+    def _acquire(self) -> subprocess.Popen:
+        if self._closed:
+            raise RuntimeError("ScriptPool is closed")
+        worker = self._idle.get()
+        if worker is None:
+            self._idle.put(None)  # wake the next waiter too
+            raise RuntimeError("ScriptPool is closed")
+        return worker
+
+    def _release(self, worker: subprocess.Popen) -> None:
+        with self._lock:
+            if not self._closed:
+                self._idle.put(worker)
+                return
+        _stop(worker)
+
+    def _replace(self, worker: subprocess.Popen) -> None:
+        worker.kill()
+        worker.wait()
+        with self._lock:
+            if not self._closed:
+                self._idle.put(self._spawn())
+
+    def __enter__(self) -> ScriptPool:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+def _stop(worker: subprocess.Popen) -> None:
+    worker.stdin.close()
+    try:
+        worker.wait(timeout=5)
+    except subprocess.TimeoutExpired:
+        worker.kill()
+        worker.wait()
+    worker.stdout.close()
+
+
+_default_pool: ScriptPool | None = None
+_default_lock = threading.Lock()
+
+
+def get_script_pool() -> ScriptPool:
+    """Return the process-wide pool, starting it on first use.
+
+    Registries without their own ``script_pool`` share it. It is closed at
+    interpreter exit.
+    """
+    global _default_pool
+    with _default_lock:
+        if _default_pool is None:
+            _default_pool = ScriptPool()
+            atexit.register(_default_pool.close)
+        return _default_pool
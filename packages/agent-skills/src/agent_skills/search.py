@@ -0,0 +1,278 @@
+"""Full-text search over skill resources.
+
+A ``ResourceIndex`` is a positional inverted index over the text files in
+skills' ``references/`` and ``assets/`` directories. Each term maps to the
+files it occurs in and its token positions there, and each file keeps the
+character offset of every token, so a search can match phrases, rank files
+and point at the exact lines without reading any file again. Skills are
+added and removed one at a time as they are loaded and reloaded.
+
+File paths are indexed too, after the text, so a file can also be found by
+its name. Queries are words and ``"quoted phrases"``. A word that splits into several
+tokens, such as ``speckit.requirements.clarify``, is matched as a phrase.
+Files matching any part of the query are ranked with BM25.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+import threading
+from array import array
+from bisect import bisect_right
+from collections.abc import Collection, Iterator
+from dataclasses import dataclass
+
+from .models import SearchHit, SearchMatch
+
+# Resource directories whose files are indexed.
+SEARCHED_RESOURCE_TYPES = ("references", "assets")
+
+# Files larger than this many characters are not indexed.
+MAX_INDEXED_CHARS = 1 << 20
+
+# Matches reported per file, and characters of context in a snippet.
+MAX_MATCHES_PER_HIT = 3
+SNIPPET_CHARS = 160
+
+# BM25 parameters.
+_K1 = 1.2
+_B = 0.75
+
+_TOKEN = re.compile(r"\w+")
+_QUERY_PART = re.compile(r'"([^"]*)"|(\S+)')
+
+
+def tokenize(text: str) -> Iterator[tuple[str, int, int]]:
+    """Yield ``(term, start, end)`` for each lowercased word in ``text``."""
+    for match in _TOKEN.finditer(text):
+        yield match.group().lower(), match.start(), match.end()
+
+
+def parse_query(query: str) -> list[tuple[str, ...]]:
+    """Split a query into phrases of one or more terms, dropping duplicates."""
+    phrases: list[tuple[str, ...]] = []
+    for match in _QUERY_PART.finditer(query):
+        phrase = tuple(
+            term for term, _, _ in tokenize(match.group(1) or match.group(2))
+        )
+        if phrase and phrase not in phrases:
+            phrases.append(phrase)
+    return phrases
+
+
+@dataclass
+class _Document:
+    skill_name: str
+    resource_type: str
+    file_path: str
+    text: str
+    starts: array
+    ends: array
+    line_ends: array
+
+    @property
+    def length(self) -> int:
+        return len(self.starts)
+
+    def line_of(self, offset: int) -> int:
+        return bisect_right(self.line_ends, offset) + 1
+
+    def snippet(self, start: int, end: int) -> str:
+        line_start = self.text.rfind("\n", 0, start) + 1
+        line_end = self.text.find("\n", end)
+        if line_end == -1:
+            line_end = len(self.text)
+        if line_end - line_start > SNIPPET_CHARS:
+            margin = max(0, (SNIPPET_CHARS - (end - start)) // 2)
+            line_start = max(line_start, start - margin)
+            line_end = min(line_end, end + margin)
+        return self.text[line_start:line_end].strip()
+
+
+class ResourceIndex:
+    """Positional inverted index over the text resources of some skills.
+
+    Thread-safe. Add a skill's files with ``add_skill`` and drop them with
+    ``remove_skill`` when the skill is reloaded.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._documents: dict[int, _Document] = {}
+        self._postings: dict[str, dict[int, array]] = {}
+        self._by_skill: dict[str, list[int]] = {}
+        self._next_id = 0
+        self._total_length = 0
+
+    def add_skill(self, skill_name: str, files: dict[tuple[str, str], str]) -> None:
+        """Index a skill's files, replacing any indexed before.
+
+        Args:
+            skill_name: Name of the skill.
+            files: Text by ``(resource_type, file_path)``. Files longer than
+                ``MAX_INDEXED_CHARS`` are skipped.
+        """
+        built = [
+            self._build(skill_name, rtype, path, text)
+            for (rtype, path), text in files.items()
+            if len(text) <= MAX_INDEXED_CHARS
+        ]
+        with self._lock:
+            self._remove(skill_name)
+            ids = self._by_skill[skill_name] = []
+            for document, terms in built:
+                doc_id = self._next_id
+                self._next_id += 1
+                self._documents[doc_id] = document
+                self._total_length += document.length
+                for term, positions in terms.items():
+                    self._postings.setdefault(term, {})[doc_id] = positions
+                ids.append(doc_id)
+
+    def remove_skill(self, skill_name: str) -> None:
+        """Drop a skill's files from the index."""
+        with self._lock:
+            self._remove(skill_name)
+
+    def search(
+        self,
+        query: str,
+        skills: Collection[str] | None = None,
+        limit: int = 10,
+    ) -> list[SearchHit]:
+        """Return the files best matching ``query``, best first.
+
+        Args:
+            query: Words and quoted phrases.
+            skills: Only search these skills; None searches all.
+            limit: Most files returned.
+        """
+        phrases = parse_query(query)
+        with self._lock:
+            count = len(self._documents)
+            if not phrases or not count:
+                return []
+            average = self._total_length / count
+            scores: dict[int, float] = {}
+            found: dict[int, list[tuple[int, int]]] = {}
+            for phrase in phrases:
+                occurrences = self._occurrences(phrase, skills)
+                if not occurrences:
+                    continue
+                idf = math.log(
+                    1 + (count - len(occurrences) + 0.5) / (len(occurrences) + 0.5)
+                )
+                for doc_id, positions in occurrences.items():
+                    document = self._documents[doc_id]
+                    tf = len(positions)
+                    norm = _K1 * (1 - _B + _B * document.length / average)
+                    scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (_K1 + 1) / (
+                        tf + norm
+                    )
+                    spans = found.setdefault(doc_id, [])
+                    last = len(phrase) - 1
+                    spans.extend(
+                        (document.starts[p], document.ends[p + last])
+                        for p in positions
+                        if p < document.length  # not in the path
+                    )
+            ranked = sorted(scores, key=lambda d: (-scores[d], d))[:limit]
+            return [self._hit(d, scores[d], found[d]) for d in ranked]
+
+    def __len__(self) -> int:
+        """Number of indexed files."""
+        return len(self._documents)
+
+    def __contains__(self, skill_name: str) -> bool:
+        return skill_name in self._by_skill
+
+    @staticmethod
+    def _build(
+        skill_name: str, resource_type: str, file_path: str, text: str
+    ) -> tuple[_Document, dict[str, array]]:
+        starts, ends = array("I"), array("I")
+        terms: dict[str, array] = {}
+        for position, (term, start, end) in enumerate(tokenize(text)):
+            starts.append(start)
+            ends.append(end)
+            positions = terms.get(term)
+            if positions is None:
+                positions = terms[term] = array("I")
+            positions.append(position)
+        # Path terms go after a gap so no phrase spans text and path.
+        base = len(starts) + 1
+        for position, (term, _, _) in enumerate(tokenize(file_path), base):
+            terms.setdefault(term, array("I")).append(position)
+        line_ends = array("I", (m.start() for m in re.finditer("\n", text)))
+        document = _Document(
+            skill_name, resource_type, file_path, text, starts, ends, line_ends
+        )
+        return document, terms
+
+    def _remove(self, skill_name: str) -> None:
+        for doc_id in self._by_skill.pop(skill_name, ()):
+            document = self._documents.pop(doc_id)
+            self._total_length -= document.length
+            text = document.text + "\n" + document.file_path
+            for term in {term for term, _, _ in tokenize(text)}:
+                postings = self._postings.get(term)
+                if postings is not None:
+                    postings.pop(doc_id, None)
+                    if not postings:
+                        del self._postings[term]
+
+    def _occurrences(
+        self, phrase: tuple[str, ...], skills: Collection[str] | None
+    ) -> dict[int, list[int]]:
+        """Positions where ``phrase`` starts, by document."""
+        lists = [self._postings.get(term) for term in phrase]
+        if not all(lists):
+            return {}
+        first, rest = lists[0], lists[1:]
+        occurrences = {}
+        for doc_id, positions in first.items():
+            if skills is not None and self._documents[doc_id].skill_name not in skills:
+                continue
+            if not rest:
+                occurrences[doc_id] = list(positions)
+                continue
+            following = [postings.get(doc_id) for postings in rest]
+            if not all(following):
+                continue
+            sets = [set(p) for p in following]
+            starts = [
+                p for p in positions if all(p + i + 1 in s for i, s in enumerate(sets))
+            ]
+            if starts:
+                occurrences[doc_id] = starts
+        return occurrences
+
+    def _hit(
+        self, doc_id: int, score: float, spans: list[tuple[int, int]]
+    ) -> SearchHit:
+        document = self._documents[doc_id]
+        matches = []
+        lines = set()
+        for start, end in sorted(spans):
+            line = document.line_of(start)
+            if line in lines:
+                continue
+            lines.add(line)
+            matches.append(
+                SearchMatch(
+                    line=line,
+                    start=start,
+                    end=end,
+                    snippet=document.snippet(start, end),
+                )
+            )
+            if len(matches) == MAX_MATCHES_PER_HIT:
+                break
+        return SearchHit(
+            skill_name=document.skill_name,
+            resource_type=document.resource_type,
+            file_path=document.file_path,
+            score=round(score, 4),
+            matches=matches,
+        )
@@ -0,0 +1,325 @@
+"""Local HTTP server exposing a skill registry to other processes.
+
+Routes (all responses are JSON unless noted)::
+
+    GET  /skills                                     metadata for every skill
+    GET  /skills/{name}                              metadata, instructions, manifest
+    GET  /skills/{name}/resources/{type}/{path}      resource contents (text/plain)
+    POST /batch                                      several of the above in one call
+
+GET responses carry a strong ``ETag`` and honour ``If-None-Match`` with
+``304 Not Modified``. Connections are HTTP/1.1 keep-alive.
+
+Run a long-lived, pre-warmed daemon with::
+
+    python -m agent_skills.server ./skills --port 8765
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import threading
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import quote, unquote
+
+from ._records import dump_skill_record
+from .registry import FileSystemSkillRegistry, SkillRegistry
+
+# Largest POST body the server reads; larger requests get 413.
+MAX_REQUEST_BYTES = 1 << 20
+
+
+def compute_etag(body: bytes) -> str:
+    """Return a strong ETag for a response body."""
+    return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+
+def resource_route(skill_name: str, resource_type: str, file_path: str) -> str:
+    """Build the URL path of a resource on the server."""
+    return (
+        f"/skills/{quote(skill_name, safe='')}/resources/"
+        f"{quote(resource_type, safe='')}/{quote(file_path)}"
+    )
+
+
+class _RouteError(Exception):
+    def __init__(self, status: HTTPStatus, error: Exception):
+        super().__init__(str(error))
+        self.status = status
+        self.error = error
+
+
+class SkillServer:
+    """Serve a skill registry over HTTP on a local interface.
+
+    Also usable in-process as a stand-in server for tests::
+
+        with SkillServer(registry) as server:
+            remote = RemoteSkillRegistry(server.url)
+
+    Args:
+        registry: The registry to serve.
+        host: Interface to bind. Defaults to loopback only.
+        port: TCP port; 0 picks a free port.
+    """
+
+    def __init__(
+        self, registry: SkillRegistry, host: str = "127.0.0.1", port: int = 0
+    ) -> None:
+        self.registry = registry
+        self._httpd = ThreadingHTTPServer((host, port), _make_handler(self))
+        self._httpd.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        """Base URL of the running server."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> SkillServer:
+        """Serve requests on a background thread."""
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever,
+            kwargs={"poll_interval": 0.05},
+            name="skill-server",
+            daemon=True,
+        )
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """Serve requests on the calling thread until interrupted."""
+        self._httpd.serve_forever()
+
+    def stop(self) -> None:
+        """Stop serving and close the listening socket."""
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+
+    def __enter__(self) -> SkillServer:
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def handle(self, path: str) -> tuple[bytes, str]:
+        """Resolve a GET route to a response body and content type.
+
+        Raises:
+            _RouteError: If the route or the requested item does not exist.
+        """
+        parts = [unquote(p) for p in path.split("?", 1)[0].strip("/").split("/")]
+        try:
+            if parts == ["skills"]:
+                return self._json(self._list_skills()), "application/json"
+            if len(parts) == 2 and parts[0] == "skills":
+                return self._json(self._get_skill(parts[1])), "application/json"
+            if len(parts) >= 5 and parts[0] == "skills" and parts[2] == "resources":
+                content = self.registry.read_resource(
+                    parts[1], parts[3], "/".join(parts[4:])
+                )
+                return content.encode("utf-8"), "text/plain; charset=utf-8"
+        except (KeyError, FileNotFoundError) as e:
+            raise _RouteError(HTTPStatus.NOT_FOUND, e) from e
+        except ValueError as e:
+            raise _RouteError(HTTPStatus.BAD_REQUEST, e) from e
+        raise _RouteError(HTTPStatus.NOT_FOUND, KeyError(f"No route for {path}"))
+
+    def handle_batch(self, payload: dict) -> dict:
+        """Resolve each request of a batch independently.
+
+        Each request is ``{"op": "skill", "name": ...}`` or
+        ``{"op": "resource", "skill_name": ..., "resource_type": ...,
+        "file_path": ...}``. Per-item failures, including malformed
+        requests, are reported in place.
+
+        Raises:
+            _RouteError: If the payload is not an object with a list of
+                ``requests``.
+        """
+        requests = payload.get("requests", []) if isinstance(payload, dict) else None
+        if not isinstance(requests, list):
+            error = ValueError("Batch payload must be an object with a 'requests' list")
+            raise _RouteError(HTTPStatus.BAD_REQUEST, error)
+        results = []
+        for item in requests:
+            try:
+                path = _batch_path(item)
+            except ValueError as e:
+                results.append({"path": None, "error": _error_payload(e)})
+                continue
+            try:
+                body, content_type = self.handle(path)
+            except _RouteError as e:
+                results.append({"path": path, "error": _error_payload(e.error)})
+                continue
+            value = (
+                json.loads(body) if content_type == "application/json"
+                else body.decode("utf-8")
+            )
+            results.append({"path": path, "etag": compute_etag(body), "value": value})
+        return {"results": results}
+
+    def _list_skills(self) -> dict:
+        return {"skills": [m.model_dump() for m in self.registry.list_skills()]}
+
+    def _get_skill(self, name: str) -> dict:
+        skill = self.registry.get_skill(name)
+        if skill is None:
+            raise KeyError(f"Skill '{name}' not found in registry")
+        return {
+            **dump_skill_record(skill),
+            "instructions": skill.instructions,
+            "manifest": self.registry.list_resources(name),
+        }
+
+    @staticmethod
+    def _json(payload: dict) -> bytes:
+        return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+
+def _batch_path(item: object) -> str:
+    """Return the GET route of a batch request.
+
+    Raises:
+        ValueError: If the request is not an object with string fields.
+    """
+    if not isinstance(item, dict):
+        raise ValueError("Batch request must be an object")
+    op = item.get("op", "resource")
+    if op == "skill":
+        fields = ("name",)
+    elif op == "resource":
+        fields = ("skill_name", "resource_type", "file_path")
+    else:
+        raise ValueError(f"Unknown batch op {op!r}")
+    values = [item.get(field) for field in fields]
+    missing = [f for f, v in zip(fields, values) if not isinstance(v, str)]
+    if missing:
+        raise ValueError(f"Batch {op} request is missing: {', '.join(missing)}")
+    if op == "skill":
+        return f"/skills/{quote(values[0], safe='')}"
+    return resource_route(*values)
+
+
+def _error_payload(error: Exception) -> dict:
+    message = error.args[0] if error.args else str(error)
+    return {"type": type(error).__name__, "message": message}
+
+
+def _make_handler(server: SkillServer) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def do_GET(self) -> None:
+            try:
+                body, content_type = server.handle(self.path)
+            except _RouteError as e:
+                self._send_error(e)
+                return
+            etag = compute_etag(body)
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(HTTPStatus.NOT_MODIFIED)
+                self.send_header("ETag", etag)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            self._send(HTTPStatus.OK, body, content_type, etag)
+
+        def do_POST(self) -> None:
+            try:
+                raw = self._read_body()
+            except _RouteError as e:
+                # The body was not read, so the connection cannot be reused.
+                self.close_connection = True
+                self._send_error(e)
+                return
+            if self.path != "/batch":
+                error = KeyError(f"No route for {self.path}")
+                self._send_error(_RouteError(HTTPStatus.NOT_FOUND, error))
+                return
+            try:
+                payload = json.loads(raw)
+            except json.JSONDecodeError as e:
+                self._send_error(_RouteError(HTTPStatus.BAD_REQUEST, ValueError(e)))
+                return
+            try:
+                body = SkillServer._json(server.handle_batch(payload))
+            except _RouteError as e:
+                self._send_error(e)
+                return
+            self._send(HTTPStatus.OK, body, "application/json")
+
+        def _read_body(self) -> bytes:
+            header = self.headers.get("Content-Length", "0")
+            try:
+                length = int(header)
+            except ValueError:
+                length = -1
+            if length < 0:
+                error = ValueError(f"Invalid Content-Length: {header!r}")
+                raise _RouteError(HTTPStatus.BAD_REQUEST, error)
+            if length > MAX_REQUEST_BYTES:
+                error = ValueError(
+                    f"Request body of {length} bytes exceeds the limit of "
+                    f"{MAX_REQUEST_BYTES}"
+                )
+                raise _RouteError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, error)
+            return self.rfile.read(length)
+
+        def _send_error(self, e: _RouteError) -> None:
+            body = SkillServer._json({"error": _error_payload(e.error)})
+            self._send(e.status, body, "application/json")
+
+        def _send(
+            self,
+            status: HTTPStatus,
+            body: bytes,
+            content_type: str,
+            etag: str | None = None,
+        ) -> None:
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            if etag is not None:
+                self.send_header("ETag", etag)
+            if self.close_connection:
+                self.send_header("Connection", "close")
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args) -> None:
+            pass
+
+    return Handler
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Serve a skills directory over HTTP.")
+    parser.add_argument("skills_dir", help="Directory containing skill subdirectories")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args(argv)
+
+    registry = FileSystemSkillRegistry()
+    registry.load_skills_from_directory(args.skills_dir)
+    server = SkillServer(registry, host=args.host, port=args.port)
+    print(f"Serving {len(registry)} skill(s) at {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
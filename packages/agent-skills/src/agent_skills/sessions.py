@@ -0,0 +1,160 @@
+"""Registry views pinned to the skill versions of one session."""
+
+from __future__ import annotations
+
+import weakref
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
+from .instrumentation import get_instrumentation, timed
+from .models import ScriptResult, SearchHit, Skill, SkillMetadata
+from .registry import SkillRegistry
+from .search import ResourceIndex
+
+if TYPE_CHECKING:
+    from .registry import FileSystemSkillRegistry
+    from .versions import ResidentVersion
+
+
+class SkillSession(SkillRegistry):
+    """A view of a registry pinned to the skill versions current at its start.
+
+    Create with ``FileSystemSkillRegistry.session()``. Skills that have not
+    been replaced since the session started are served by the registry
+    itself, with its caches; replaced ones are served from the resident
+    version the registry keeps for the session. Close the session (or use it
+    as a context manager) so versions nobody uses any more are released; a
+    session that is garbage-collected unclosed releases them then.
+
+    Attributes:
+        registry: The registry the session reads from.
+        epoch: Registry epoch the session is pinned to.
+    """
+
+    def __init__(self, registry: FileSystemSkillRegistry, epoch: int) -> None:
+        super().__init__()
+        self.registry = registry
+        self.epoch = epoch
+        self._finalizer = weakref.finalize(self, registry._end_session, epoch)
+
+    def close(self) -> None:
+        """End the session; further calls see the current versions."""
+        self._finalizer()
+
+    @property
+    def closed(self) -> bool:
+        return not self._finalizer.alive
+
+    def __enter__(self) -> SkillSession:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def version(self, name: str) -> str:
+        """Return the version of a skill this session is pinned to.
+
+        Raises:
+            KeyError: If no skill with that name is loaded.
+        """
+        resident = self._resident(name)
+        if resident is not None:
+            return resident.version
+        return self.registry.resident_versions(name)[-1]
+
+    def get_skill(self, name: str) -> Skill | None:
+        """Get a skill by name, in the version pinned by this session."""
+        resident = self._resident(name)
+        if resident is None:
+            return self.registry.get_skill(name)
+        instructions = self.registry._resident_instructions(resident)
+        return resident.skill.model_copy(update={"instructions": instructions})
+
+    def list_skills(self) -> list[SkillMetadata]:
+        """Return metadata for all loaded skills, in the pinned versions."""
+        metadata = []
+        for m in self.registry.list_skills():
+            resident = self._resident(m.name)
+            metadata.append(m if resident is None else resident.skill.metadata)
+        return metadata
+
+    def activate_skill(self, name: str) -> str:
+        """Activate a skill and return the instructions of the pinned version.
+
+        Raises:
+            KeyError: If no skill with that name is loaded.
+        """
+        resident = self._resident(name)
+        if resident is None:
+            return self.registry.activate_skill(name)
+        with timed("skills.activate.duration", skill=name):
+            instructions = self.registry._resident_instructions(resident)
+        get_instrumentation().add("skills.activations", attributes={"skill": name})
+        return instructions
+
+    def read_resource(self, skill_name: str, resource_type: str, file_path: str) -> str:
+        """Read a resource file from the pinned version of a skill.
+
+        Raises:
+            KeyError: If skill not found.
+            ValueError: If resource_type is invalid or path traversal detected.
+            FileNotFoundError: If resource directory or file doesn't exist.
+        """
+        resident = self._resident(skill_name)
+        if resident is None:
+            return self.registry.read_resource(skill_name, resource_type, file_path)
+        return self.registry._read_resident_resource(resident, resource_type, file_path)
+
+    def list_resources(self, name: str) -> dict[str, list[str]]:
+        """Return the resource manifest of the pinned version of a skill."""
+        if self._resident(name) is None:
+            return self.registry.list_resources(name)
+        return super().list_resources(name)
+
+    def resource_digests(self, name: str) -> dict[str, dict[str, str]]:
+        """Return the digest manifest of the pinned version of a skill."""
+        if self._resident(name) is None:
+            return self.registry.resource_digests(name)
+        return super().resource_digests(name)
+
+    def skill_dependencies(self, name: str) -> list[str]:
+        """Return the loaded skills the pinned version of a skill depends on."""
+        if self._resident(name) is None:
+            return self.registry.skill_dependencies(name)
+        return super().skill_dependencies(name)
+
+    def run_skill_script(
+        self, skill_name: str, file_path: str, args: Sequence[str] = (), **options
+    ) -> ScriptResult:
+        """Run a script of the pinned version of a skill (see ``SkillRegistry``)."""
+        if self._resident(skill_name) is None:
+            return self.registry.run_skill_script(
+                skill_name, file_path, args, **options
+            )
+        return super().run_skill_script(skill_name, file_path, args, **options)
+
+    def search_resources(
+        self, query: str, skill_name: str | None = None, limit: int = 10
+    ) -> list[SearchHit]:
+        """Search the registry's index, which covers the current versions."""
+        return self.registry.search_resources(query, skill_name, limit)
+
+    def resource_index(self) -> ResourceIndex:
+        """Return the registry's full-text index."""
+        return self.registry.resource_index()
+
+    @property
+    def skill_names(self) -> list[str]:
+        """Return names of all loaded skills."""
+        return self.registry.skill_names
+
+    def __len__(self) -> int:
+        return len(self.registry)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.registry
+
+    def _resident(self, name: str) -> ResidentVersion | None:
+        if self.closed:
+            return None
+        return self.registry._resident(name, self.epoch)
@@ -0,0 +1,298 @@
+"""Read-only skill catalogs shared between worker processes.
+
+A loader process builds a compact binary catalog (metadata, instruction
+bodies, resource manifests and optionally resource contents) from a
+populated registry and publishes it
+either as a ``multiprocessing.shared_memory`` segment or as a file. Worker
+processes attach a ``SharedSkillRegistry`` to it; entries are decoded lazily
+on first access, so N workers pay roughly the memory and startup cost of one.
+
+Catalog layout (all integers little-endian)::
+
+    magic "ASKC" | u16 version | u16 reserved | u64 index length
+    index (UTF-8 JSON)
+    blob region (UTF-8 instruction bodies and resource contents)
+
+Blobs are content-addressed: the index maps each digest to its offset and
+length, and a body or resource file shared by several skills is stored once.
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import struct
+from multiprocessing.shared_memory import SharedMemory
+from pathlib import Path
+
+from ._records import dump_skill_record, load_skill_metadata, load_skill_record
+from .blobs import content_digest
+from .categories import CategoryTree
+from .instrumentation import get_instrumentation, timed
+from .models import Skill, SkillMetadata
+from .registry import SkillRegistry, _read_resource_file
+
+CATALOG_MAGIC = b"ASKC"
+CATALOG_VERSION = 2
+
+_HEADER = struct.Struct("<4sHHQ")
+
+
+def encode_catalog(
+    registry: SkillRegistry,
+    include_resources: bool = False,
+    extra: dict | None = None,
+) -> bytes:
+    """Serialize every skill in a registry into catalog bytes.
+
+    Args:
+        registry: The registry to serialize.
+        include_resources: Also embed every text resource file, so workers
+            read resources from the catalog instead of the filesystem. Files
+            that are not UTF-8 text are left to the filesystem, and files
+            removed since they were listed are skipped.
+        extra: Additional JSON-serializable entries stored in the index,
+            e.g. snapshot bookkeeping.
+    """
+    index: dict[str, dict] = {}
+    offsets: dict[str, list[int]] = {}
+    region = bytearray()
+
+    def put(content: str) -> str:
+        digest = content_digest(content)
+        if digest not in offsets:
+            data = content.encode("utf-8")
+            offsets[digest] = [len(region), len(data)]
+            region.extend(data)
+        return digest
+
+    for name in registry.skill_names:
+        skill = registry.get_skill(name)
+        manifest = registry.list_resources(name)
+        entry = {
+            **dump_skill_record(skill),
+            "manifest": manifest,
+            "body": put(skill.instructions),
+        }
+        if include_resources:
+            entry["digests"] = digests = {}
+            for rtype, files in manifest.items():
+                digests[rtype] = {}
+                for f in files:
+                    try:
+                        digests[rtype][f] = put(registry.read_resource(name, rtype, f))
+                    except ValueError:
+                        continue  # binary; read from the filesystem instead
+                    except FileNotFoundError:
+                        continue  # removed since it was listed
+        index[name] = entry
+
+    payload = {**(extra or {}), "skills": index, "blobs": offsets}
+    index_bytes = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    header = _HEADER.pack(CATALOG_MAGIC, CATALOG_VERSION, 0, len(index_bytes))
+    return header + index_bytes + bytes(region)
+
+
+def decode_catalog(buffer: memoryview | bytes) -> tuple[dict, int]:
+    """Parse a catalog header and index.
+
+    Returns:
+        The index and the offset of the blob region in ``buffer``.
+
+    Raises:
+        ValueError: If ``buffer`` is not a catalog of a supported version.
+    """
+    magic, version, _, index_len = _HEADER.unpack_from(buffer, 0)
+    if magic != CATALOG_MAGIC:
+        raise ValueError("Not a skill catalog")
+    if version != CATALOG_VERSION:
+        raise ValueError(f"Unsupported skill catalog version: {version}")
+    blob_start = _HEADER.size + index_len
+    return json.loads(bytes(buffer[_HEADER.size : blob_start])), blob_start
+
+
+def read_blob(
+    buffer: memoryview | bytes, index: dict, blob_start: int, digest: str
+) -> str:
+    """Decode one blob of a catalog by digest."""
+    offset, length = index["blobs"][digest]
+    start = blob_start + offset
+    return str(buffer[start : start + length], "utf-8")
+
+
+def publish_catalog(
+    registry: SkillRegistry, name: str | None = None, include_resources: bool = False
+) -> SharedMemory:
+    """Publish a registry's catalog into a new shared memory segment.
+
+    The caller owns the returned segment: keep a reference for as long as
+    workers may attach, then call ``close()`` and ``unlink()``.
+    """
+    data = encode_catalog(registry, include_resources)
+    segment = SharedMemory(name=name, create=True, size=len(data))
+    segment.buf[: len(data)] = data
+    return segment
+
+
+def write_catalog(
+    registry: SkillRegistry, path: str | Path, include_resources: bool = False
+) -> Path:
+    """Write a registry's catalog to a file that workers can mmap."""
+    path = Path(path)
+    path.write_bytes(encode_catalog(registry, include_resources))
+    return path
+
+
+class SharedSkillRegistry(SkillRegistry):
+    """Read-only registry backed by a shared catalog.
+
+    Create instances with ``attach`` (shared memory) or ``open`` (mmapped
+    file) rather than calling the constructor directly. Skills are decoded
+    on first access and validated data from the loader is trusted, so no
+    SKILL.md is parsed in the worker. Activation state is per process.
+
+    Usage::
+
+        # loader
+        segment = publish_catalog(fs_registry, name="skills")
+
+        # each worker
+        registry = SharedSkillRegistry.attach("skills")
+        tools = registry.get_tools()
+    """
+
+    def __init__(self, buffer: memoryview, owner: SharedMemory | mmap.mmap) -> None:
+        super().__init__()
+        self._owner = owner
+        self._raw_buffer = buffer
+        self._buffer = buffer.toreadonly()
+
+        self._catalog, self._blob_start = decode_catalog(self._buffer)
+        self._index: dict[str, dict] = self._catalog["skills"]
+        self._metadata: dict[str, SkillMetadata] = {}
+        self._skills: dict[str, Skill] = {}
+        self._category_tree: CategoryTree | None = None
+
+    @classmethod
+    def attach(cls, name: str) -> SharedSkillRegistry:
+        """Attach to a catalog published with ``publish_catalog``."""
+        segment = SharedMemory(name=name, track=False)
+        return cls(segment.buf, segment)
+
+    @classmethod
+    def open(cls, path: str | Path) -> SharedSkillRegistry:
+        """Map a catalog file written with ``write_catalog``."""
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(memoryview(mapped), mapped)
+
+    def close(self) -> None:
+        """Detach from the underlying catalog.
+
+        Skills already returned by ``get_skill`` remain usable.
+        """
+        self._buffer.release()
+        self._raw_buffer.release()
+        self._owner.close()
+
+    def __enter__(self) -> SharedSkillRegistry:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def get_skill(self, name: str) -> Skill | None:
+        """Get a skill by name, decoding it from the catalog on first access."""
+        skill = self._skills.get(name)
+        if skill is not None:
+            return skill
+        entry = self._index.get(name)
+        if entry is None:
+            return None
+
+        skill = load_skill_record(
+            entry, self._read_blob(entry["body"]), self._get_metadata(name)
+        )
+        self._skills[name] = skill
+        return skill
+
+    def list_skills(self) -> list[SkillMetadata]:
+        """Return metadata for all skills in the catalog."""
+        return [self._get_metadata(name) for name in self._index]
+
+    def category_tree(self) -> CategoryTree:
+        """Return the category hierarchy, built on first use."""
+        if self._category_tree is None:
+            self._category_tree = CategoryTree(self.list_skills())
+        return self._category_tree
+
+    def list_resources(self, name: str) -> dict[str, list[str]]:
+        """Return the resource manifest recorded by the loader."""
+        entry = self._index.get(name)
+        if entry is None:
+            raise KeyError(f"Skill '{name}' not found in registry")
+        return {rtype: list(files) for rtype, files in entry["manifest"].items()}
+
+    def activate_skill(self, name: str) -> str:
+        """Mark a skill as activated and return its full instructions.
+
+        Raises:
+            KeyError: If the skill is not in the catalog.
+        """
+        with timed("skills.activate.duration", skill=name):
+            skill = self.get_skill(name)
+            if skill is None:
+                raise KeyError(f"Skill '{name}' not found in registry")
+            skill.activated = True
+        get_instrumentation().add("skills.activations", attributes={"skill": name})
+        return skill.instructions
+
+    def read_resource(self, skill_name: str, resource_type: str, file_path: str) -> str:
+        """Read a resource file from a skill.
+
+        Raises:
+            KeyError: If skill not found.
+            ValueError: If resource_type is invalid or path traversal detected.
+            FileNotFoundError: If resource directory or file doesn't exist.
+        """
+        entry = self._index.get(skill_name) or {}
+        digests = entry.get("digests", {}).get(resource_type, {})
+        digest = digests.get(file_path)
+        if digest is None:
+            skill = self.get_skill(skill_name)
+            return _read_resource_file(skill, skill_name, resource_type, file_path)
+        with timed(
+            "skills.resource.read.duration",
+            skill=skill_name,
+            resource_type=resource_type,
+        ):
+            return self._read_blob(digest)
+
+    def resource_digests(self, name: str) -> dict[str, dict[str, str]]:
+        """Return the digest manifest, from the catalog when it embeds resources."""
+        entry = self._index.get(name)
+        if entry is None or "digests" not in entry:
+            return super().resource_digests(name)
+        return {rtype: dict(files) for rtype, files in entry["digests"].items()}
+
+    @property
+    def skill_names(self) -> list[str]:
+        """Return names of all skills in the catalog."""
+        return list(self._index.keys())
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._index
+
+    def _read_blob(self, digest: str) -> str:
+        return read_blob(self._buffer, self._catalog, self._blob_start, digest)
+
+    def _get_metadata(self, name: str) -> SkillMetadata:
+        metadata = self._metadata.get(name)
+        if metadata is None:
+            metadata = load_skill_metadata(self._index[name]["metadata"])
+            self._metadata[name] = metadata
+        return metadata
+
@@ -1,4 +1,11 @@
-"""Strands agent tool factory for progressive skill disclosure."""
+"""Strands agent tools for progressive skill disclosure.
+
+The tools are methods of ``SkillTools``, decorated with ``@tool`` once when
+this module is imported, so their JSON specs are built once per process.
+Each ``SkillTools`` instance binds them to a registry and per-session
+options; binding reuses the prebuilt specs and costs a few microseconds
+per tool.
+"""
 
 from __future__ import annotations
 
@@ -6,40 +13,220 @@ from typing import TYPE_CHECKING
 
 from strands import tool
 
+from .instrumentation import get_instrumentation, instrument_tool
+from .quotas import ThrottledError
+
 if TYPE_CHECKING:
+    from .ledger import ContextLedger
+    from .models import BatchResult, SkillMetadata
+    from .quotas import ResourceQuota
     from .registry import SkillRegistry
 
+DEFAULT_ACTIVATION_TOKEN_BUDGET = 20_000
+
 
-def create_skill_tools(registry: SkillRegistry) -> list:
+def create_skill_tools(
+    registry: SkillRegistry,
+    activation_token_budget: int | None = DEFAULT_ACTIVATION_TOKEN_BUDGET,
+    run_scripts: bool = False,
+    memoize_scripts: bool = False,
+    ledger: ContextLedger | None = None,
+    hierarchical: bool = False,
+    quota: ResourceQuota | None = None,
+) -> list:
     """Create Strands agent tools bound to the given registry.
 
-    Returns three tools implementing progressive disclosure:
+    Returns tools implementing progressive disclosure:
     1. list_skills — metadata only (~100 tokens each)
     2. activate_skill — full instructions (<5000 tokens)
     3. read_skill_resource — individual resource files (as needed)
+
+    plus batch variants of 2 and 3 (activate_skills, read_skill_resources)
+    that save a model round trip per extra item, and search_skill_resources,
+    which finds the lines of reference and asset files matching a query
+    without reading them in full.
+
+    Both activation tools can also activate a skill's prerequisites in the
+    same call; ``activation_token_budget`` caps how many are included.
+
+    With ``run_scripts``, a run_skill_script tool is added that executes
+    scripts from a skill's scripts directory (see
+    ``SkillRegistry.run_skill_script``); ``memoize_scripts`` reuses results
+    of identical runs. Only enable it for skills whose scripts you trust.
+
+    Pass a ``ledger`` (one per conversation) to stop resending content: a
+    skill or resource the conversation already received unchanged is
+    answered with a short note, unless the call sets ``refresh``.
+
+    list_skills takes a ``category`` to list one branch of the category
+    hierarchy. With ``hierarchical``, it lists only the top level by
+    default; pair it with ``to_system_prompt(..., hierarchical=True)``.
+
+    A ``quota`` (one per session, optionally chained to a shared parent)
+    limits the resource reads of these tools; calls over it are queued or
+    answered with a short "Throttled:" message.
     """
+    return SkillTools(
+        registry,
+        activation_token_budget=activation_token_budget,
+        run_scripts=run_scripts,
+        memoize_scripts=memoize_scripts,
+        ledger=ledger,
+        hierarchical=hierarchical,
+        quota=quota,
+    ).tools()
+
+
+class SkillTools:
+    """The skill tools bound to one registry and session.
+
+    Create one per agent session; see ``create_skill_tools`` for the
+    options. Accessing a tool on an instance (``SkillTools(reg).list_skills``)
+    returns it bound to that instance.
+    """
+
+    TOOL_NAMES = (
+        "list_skills",
+        "activate_skill",
+        "read_skill_resource",
+        "activate_skills",
+        "read_skill_resources",
+        "search_skill_resources",
+    )
+
+    def __init__(
+        self,
+        registry: SkillRegistry,
+        *,
+        activation_token_budget: int | None = DEFAULT_ACTIVATION_TOKEN_BUDGET,
+        run_scripts: bool = False,
+        memoize_scripts: bool = False,
+        ledger: ContextLedger | None = None,
+        hierarchical: bool = False,
+        quota: ResourceQuota | None = None,
+    ) -> None:
+        self.registry = registry
+        self.activation_token_budget = activation_token_budget
+        self.run_scripts = run_scripts
+        self.memoize_scripts = memoize_scripts
+        self.ledger = ledger
+        self.hierarchical = hierarchical
+        self.quota = quota
+
+    def tools(self) -> list:
+        """Return the enabled tools bound to this instance."""
+        names = self.TOOL_NAMES
+        if self.run_scripts:
+            names += ("run_skill_script",)
+        return [getattr(self, name) for name in names]
+
+    def _admit(self, calls: int = 1) -> str | None:
+        """Apply the quota; returns the tool response if the call is refused."""
+        if self.quota is None:
+            return None
+        try:
+            self.quota.acquire(calls)
+        except ThrottledError as e:
+            return f"Throttled: {e}"
+        return None
+
+    def _charge(self, content: str) -> None:
+        if self.quota is not None:
+            self.quota.charge(len(content.encode("utf-8")))
+
+    def _deliver(
+        self, key: tuple[str, ...], content: str, refresh: bool, label: str
+    ) -> str:
+        ledger = self.ledger
+        if ledger is None:
+            return content
+        if refresh:
+            ledger.forget(key)
+        if not ledger.seen(key, content):
+            return content
+        attributes = {"kind": key[0]}
+        get_instrumentation().add("skills.context.deduplicated", 1, attributes)
+        get_instrumentation().add(
+            "skills.context.bytes_saved", len(content), attributes
+        )
+        return (
+            f"{label} was already provided earlier in this conversation and is "
+            "unchanged. Call again with refresh=True if you no longer have it."
+        )
+
+    def _format_activation(
+        self, skill_name: str, instructions: str, refresh: bool = False
+    ) -> str:
+        resource_info = [
+            f"{rtype.title()}: {', '.join(files)}"
+            for rtype, files in self.registry.list_resources(skill_name).items()
+        ]
+        if resource_info:
+            instructions += (
+                "\n\n---\nAvailable resources:\n" + "\n".join(resource_info)
+            )
+        return self._deliver(
+            ("skill", skill_name),
+            instructions,
+            refresh,
+            f"Skill '{skill_name}' instructions",
+        )
+
+    def _format_results(
+        self, results: list[BatchResult], refresh: bool = False
+    ) -> str:
+        sections = []
+        for result in results:
+            if result.ok:
+                body = self._format_activation(result.key, result.content, refresh)
+            else:
+                body = f"Error: {result.error}"
+            sections.append(f"## {result.key}\n\n{body}")
+        return "\n\n".join(sections)
 
     @tool
-    def list_skills() -> str:
+    @instrument_tool
+    def list_skills(self, category: str | None = None) -> str:
         """List all available agent skills with their names and descriptions.
 
         Call this tool to discover which skills are available before activating one.
         Returns skill names and descriptions only (metadata level).
 
+        Args:
+            category: List only this category (e.g. 'engineering/backend'):
+                its subcategories with a summary each, then its own skills.
+
         Returns:
             A formatted list of available skills with name and description.
         """
-        skills = registry.list_skills()
-        if not skills:
-            return "No skills are currently loaded."
+        if category is None and not self.hierarchical:
+            skills = self.registry.list_skills()
+            if not skills:
+                return "No skills are currently loaded."
+            return _skill_lines(skills)
 
-        lines = []
-        for s in skills:
-            lines.append(f"- **{s.name}**: {s.description}")
-        return "\n".join(lines)
+        try:
+            categories, skills = self.registry.category_tree().expand(category or "")
+        except KeyError as e:
+            return f"Error: {e}"
+        sections = []
+        if categories:
+            lines = [f"- **{c.path}**: {c.summary}" for c in categories]
+            sections.append("## Categories\n\n" + "\n".join(lines))
+        if skills:
+            sections.append("## Skills\n\n" + _skill_lines(skills))
+        if not sections:
+            return "No skills are currently loaded."
+        return "\n\n".join(sections)
 
     @tool
-    def activate_skill(skill_name: str) -> str:
+    @instrument_tool
+    def activate_skill(
+        self,
+        skill_name: str,
+        include_prerequisites: bool = False,
+        refresh: bool = False,
+    ) -> str:
         """Activate a skill and load its full instructions.
 
         Call this after identifying a relevant skill from list_skills.
@@ -47,36 +234,66 @@ def create_skill_tools(registry: SkillRegistry) -> list:
 
         Args:
             skill_name: The name of the skill to activate (e.g. 'pdf-processing').
+            include_prerequisites: Also activate the skills it builds on, in
+                the same response, prerequisites first.
+            refresh: Send the instructions even if they were already
+                provided earlier in this conversation.
 
         Returns:
             The full markdown instructions for the skill, or an error message.
         """
+        if include_prerequisites:
+            return self._format_results(
+                self.registry.activate_with_dependencies(
+                    [skill_name], self.activation_token_budget
+                ),
+                refresh,
+            )
         try:
-            instructions = registry.activate_skill(skill_name)
-
-            skill = registry.get_skill(skill_name)
-            resource_info = []
-            if skill:
-                for rtype in ("scripts", "references", "assets"):
-                    files = skill.resources.list_files(rtype)
-                    if files:
-                        resource_info.append(f"{rtype.title()}: {', '.join(files)}")
-
-            result = instructions
-            if resource_info:
-                result += (
-                    "\n\n---\nAvailable resources:\n" + "\n".join(resource_info)
-                )
-
-            return result
+            instructions = self.registry.activate_skill(skill_name)
+            return self._format_activation(skill_name, instructions, refresh)
         except KeyError as e:
             return f"Error: {e}"
 
     @tool
+    @instrument_tool
+    def activate_skills(
+        self,
+        skill_names: list[str],
+        include_prerequisites: bool = False,
+        refresh: bool = False,
+    ) -> str:
+        """Activate several skills at once and load all their instructions.
+
+        Prefer this over repeated activate_skill calls when more than one
+        skill from list_skills is relevant.
+
+        Args:
+            skill_names: Names of the skills to activate.
+            include_prerequisites: Also activate the skills they build on,
+                each once, prerequisites first.
+            refresh: Send instructions even if they were already provided
+                earlier in this conversation.
+
+        Returns:
+            One section per skill with its full instructions or an error message.
+        """
+        if include_prerequisites:
+            results = self.registry.activate_with_dependencies(
+                skill_names, self.activation_token_budget
+            )
+        else:
+            results = self.registry.activate_skills(skill_names)
+        return self._format_results(results, refresh)
+
+    @tool
+    @instrument_tool
     def read_skill_resource(
+        self,
         skill_name: str,
         resource_type: str,
         file_path: str,
+        refresh: bool = False,
     ) -> str:
         """Read a resource file from an activated skill.
 
@@ -87,13 +304,132 @@ def create_skill_tools(registry: SkillRegistry) -> list:
             skill_name: Name of the skill (e.g. 'pdf-processing').
             resource_type: Type of resource directory: 'scripts', 'references', or 'assets'.
             file_path: Relative path to the file within the resource directory.
+            refresh: Send the contents even if they were already provided
+                earlier in this conversation.
 
         Returns:
             The contents of the requested file, or an error message.
         """
+        refused = self._admit()
+        if refused:
+            return refused
         try:
-            return registry.read_resource(skill_name, resource_type, file_path)
+            content = self.registry.read_resource(skill_name, resource_type, file_path)
         except (KeyError, ValueError, FileNotFoundError) as e:
             return f"Error: {e}"
+        self._charge(content)
+        key = ("resource", skill_name, resource_type, file_path)
+        return self._deliver(key, content, refresh, f"Resource {'/'.join(key[1:])}")
+
+    @tool
+    @instrument_tool
+    def read_skill_resources(
+        self, resources: list[dict[str, str]], refresh: bool = False
+    ) -> str:
+        """Read several resource files from activated skills at once.
+
+        Prefer this over repeated read_skill_resource calls when more than
+        one file is needed.
+
+        Args:
+            resources: Items with keys 'skill_name', 'resource_type'
+                ('scripts', 'references' or 'assets') and 'file_path'.
+            refresh: Send contents even if they were already provided
+                earlier in this conversation.
+
+        Returns:
+            One section per file with its contents or an error message.
+        """
+        requests = [
+            (
+                item.get("skill_name", ""),
+                item.get("resource_type", ""),
+                item.get("file_path", ""),
+            )
+            for item in resources
+        ]
+        refused = self._admit(len(requests))
+        if refused:
+            return refused
+        sections = []
+        for request, result in zip(requests, self.registry.read_resources(requests)):
+            if result.ok:
+                self._charge(result.content)
+                key = ("resource", *request)
+                label = f"Resource {result.key}"
+                body = self._deliver(key, result.content, refresh, label)
+            else:
+                body = f"Error: {result.error}"
+            sections.append(f"## {result.key}\n\n{body}")
+        return "\n\n".join(sections)
+
+    @tool
+    @instrument_tool
+    def search_skill_resources(self, query: str, skill_name: str | None = None) -> str:
+        """Search the text of skills' reference and asset files.
+
+        Use this to find a fact in a skill's references instead of reading
+        each file with read_skill_resource. Then read only the files you
+        need, or none if the matching lines suffice.
+
+        Args:
+            query: Words to look for; put exact phrases in double quotes.
+            skill_name: Only search this skill (e.g. 'pdf-processing').
+
+        Returns:
+            The best matching files, each with its matching line numbers and
+            lines, or an error message.
+        """
+        try:
+            hits = self.registry.search_resources(query, skill_name)
+        except KeyError as e:
+            return f"Error: {e}"
+        if not hits:
+            return f"No skill resources match '{query}'."
+        sections = []
+        for hit in hits:
+            lines = "\n".join(f"- line {m.line}: {m.snippet}" for m in hit.matches)
+            lines = lines or "- the file name matches"
+            sections.append(f"## {hit.key}\n\n{lines}")
+        return "\n\n".join(sections)
+
+    @tool
+    @instrument_tool
+    def run_skill_script(
+        self, skill_name: str, file_path: str, args: list[str] | None = None
+    ) -> str:
+        """Run a script from an activated skill's scripts directory.
+
+        Use this when a skill's instructions tell you to run one of its
+        scripts, instead of reading the script and reproducing its work.
+
+        Args:
+            skill_name: Name of the skill (e.g. 'pdf-processing').
+            file_path: Relative path to the script within the scripts directory.
+            args: Command-line arguments for the script.
+
+        Returns:
+            The exit code and the script's output, or an error message.
+        """
+        try:
+            result = self.registry.run_skill_script(
+                skill_name, file_path, args or (), memoize=self.memoize_scripts
+            )
+        except (KeyError, ValueError, OSError) as e:
+            return f"Error: {e}"
+        if result.timed_out:
+            status = "Timed out"
+        else:
+            status = f"Exit code: {result.exit_code}"
+        if result.truncated:
+            status += " (output truncated)"
+        sections = [status]
+        if result.stdout:
+            sections.append(f"## stdout\n\n{result.stdout}")
+        if result.stderr:
+            sections.append(f"## stderr\n\n{result.stderr}")
+        return "\n\n".join(sections)
+
 
-    return [list_skills, activate_skill, read_skill_resource]
+def _skill_lines(skills: list[SkillMetadata]) -> str:
+    return "\n".join(f"- **{s.name}**: {s.description}" for s in skills)
@@ -0,0 +1,85 @@
+"""Skill usage profiles for warm-up and prefetching."""
+
+from __future__ import annotations
+
+import json
+import threading
+from collections import Counter
+from pathlib import Path
+
+PROFILE_VERSION = 1
+
+
+class UsageProfile:
+    """Counts skill activations and resource reads.
+
+    Resource reads are attributed to their skill, so the resources most
+    often read per activation of a skill are its likely follow-ups. Profiles
+    are small JSON files meant to be saved at shutdown and loaded at startup.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.activations: Counter[str] = Counter()
+        self.resource_reads: dict[str, Counter[tuple[str, str]]] = {}
+
+    def record_activation(self, skill_name: str) -> None:
+        with self._lock:
+            self.activations[skill_name] += 1
+
+    def record_resource_read(
+        self, skill_name: str, resource_type: str, file_path: str
+    ) -> None:
+        with self._lock:
+            reads = self.resource_reads.setdefault(skill_name, Counter())
+            reads[(resource_type, file_path)] += 1
+
+    def top_skills(self, n: int) -> list[str]:
+        """The ``n`` most frequently activated skills, most frequent first."""
+        with self._lock:
+            return [name for name, _ in self.activations.most_common(n)]
+
+    def follow_up_resources(
+        self, skill_name: str, min_ratio: float = 0.5, limit: int | None = None
+    ) -> list[tuple[str, str]]:
+        """Resources read at least ``min_ratio`` times per activation of a skill.
+
+        Returns ``(resource_type, file_path)`` pairs, most frequent first.
+        """
+        with self._lock:
+            activations = self.activations.get(skill_name, 0)
+            reads = self.resource_reads.get(skill_name, Counter())
+            ranked = reads.most_common(limit)
+        threshold = max(1, activations) * min_ratio
+        return [resource for resource, count in ranked if count >= threshold]
+
+    def save(self, path: str | Path) -> None:
+        with self._lock:
+            data = {
+                "version": PROFILE_VERSION,
+                "activations": dict(self.activations),
+                "resource_reads": {
+                    skill: {
+                        f"{rtype}/{fpath}": n for (rtype, fpath), n in reads.items()
+                    }
+                    for skill, reads in self.resource_reads.items()
+                },
+            }
+        Path(path).write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+    @classmethod
+    def load(cls, path: str | Path) -> UsageProfile:
+        """Load a saved profile; a missing file yields an empty profile."""
+        profile = cls()
+        try:
+            data = json.loads(Path(path).read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return profile
+        if data.get("version") != PROFILE_VERSION:
+            return profile
+        profile.activations.update(data["activations"])
+        for skill, reads in data["resource_reads"].items():
+            profile.resource_reads[skill] = Counter(
+                {tuple(key.split("/", 1)): n for key, n in reads.items()}
+            )
+        return profile
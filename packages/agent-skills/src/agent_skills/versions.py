@@ -0,0 +1,61 @@
+"""Skill versions kept resident for pinned sessions.
+
+A registry serves one current version of each skill. When a skill is
+replaced by a version loaded from another directory while sessions started
+earlier are still open, the previous version stays resident for them until
+the last one ends (see ``FileSystemSkillRegistry.session``). Its text
+resources are copied, since its directory may change or go away. Versions
+are identified by the frontmatter ``metadata: {version: ...}`` or, without
+one, by a digest of the skill's metadata and instructions.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from .blobs import content_digest
+
+if TYPE_CHECKING:
+    from .models import Skill
+
+# Hex digits of the content digest used as a version when none is declared.
+VERSION_DIGEST_LENGTH = 12
+
+
+def skill_version(skill: Skill) -> str:
+    """Return the declared version of a skill, or a digest of its content."""
+    declared = (skill.metadata.metadata or {}).get("version")
+    if declared:
+        return declared
+    content = skill.metadata.model_dump_json() + "\n" + skill.instructions
+    return "sha256:" + content_digest(content)[:VERSION_DIGEST_LENGTH]
+
+
+@dataclass
+class ResidentVersion:
+    """A replaced version of a skill, kept for the sessions pinned to it.
+
+    Its body and resource contents are references into the registry's
+    blob stores, shared with every other version whose content is the same.
+
+    Attributes:
+        skill: The skill as it was loaded, without its instructions.
+        version: Version key (see ``skill_version``).
+        since: Registry epoch at which this version became current.
+        until: Registry epoch at which it was replaced.
+        body: Digest of the instructions in the registry's body store.
+        resources: Digests of its text resource contents, by
+            ``(resource_type, file_path)``.
+    """
+
+    skill: Skill
+    version: str
+    since: int
+    until: int
+    body: str
+    resources: dict[tuple[str, str], str] = field(default_factory=dict)
+
+    def serves(self, epoch: int) -> bool:
+        """Whether this was the current version at ``epoch``."""
+        return self.since <= epoch < self.until
@@ -0,0 +1,177 @@
+"""Read-only registry views limited to a subset of skills."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Sequence
+
+from .instrumentation import timed
+from .models import BatchResult, ScriptResult, SearchHit, Skill, SkillMetadata
+from .registry import SkillRegistry
+from .search import ResourceIndex
+
+
+class ScopedSkillRegistry(SkillRegistry):
+    """A view of another registry that only exposes some of its skills.
+
+    Every call is checked against a frozenset of allowed names and then
+    delegated, so the view holds no skills of its own, sees reloads in the
+    underlying registry immediately and costs next to nothing to create.
+    Skills outside the scope behave exactly like skills that are not
+    loaded. Allowed names that are not loaded are ignored.
+
+    Usage::
+
+        view = registry.scoped(["pdf-processing", "requirement-review"])
+        agent = Agent(tools=view.get_tools(), system_prompt=view.to_system_prompt(p))
+
+    Args:
+        registry: The registry to expose.
+        names: Skill names the view allows.
+    """
+
+    def __init__(self, registry: SkillRegistry, names: Iterable[str]) -> None:
+        super().__init__()
+        self.registry = registry
+        self.allowed = names if isinstance(names, frozenset) else frozenset(names)
+        self._listeners: dict[Callable[[str], None], Callable[[str], None]] = {}
+
+    def get_skill(self, name: str) -> Skill | None:
+        """Get an allowed skill by name."""
+        if name not in self.allowed:
+            return None
+        return self.registry.get_skill(name)
+
+    def list_skills(self) -> list[SkillMetadata]:
+        """Return metadata for the allowed skills, in the registry's order."""
+        allowed = self.allowed
+        return [m for m in self.registry.list_skills() if m.name in allowed]
+
+    def activate_skill(self, name: str) -> str:
+        """Activate an allowed skill and return its full instructions.
+
+        Raises:
+            KeyError: If the skill is outside the scope or not loaded.
+        """
+        self._check(name)
+        return self.registry.activate_skill(name)
+
+    def read_resource(self, skill_name: str, resource_type: str, file_path: str) -> str:
+        """Read a resource file from an allowed skill.
+
+        Raises:
+            KeyError: If the skill is outside the scope or not loaded.
+            ValueError: If resource_type is invalid or path traversal detected.
+            FileNotFoundError: If resource directory or file doesn't exist.
+        """
+        self._check(skill_name)
+        return self.registry.read_resource(skill_name, resource_type, file_path)
+
+    def activate_skills(
+        self, names: list[str], max_workers: int = 8
+    ) -> list[BatchResult]:
+        """Activate several allowed skills with one batch call to the registry."""
+        return self._batch(
+            names,
+            names,
+            lambda allowed: self.registry.activate_skills(allowed, max_workers),
+        )
+
+    def read_resources(
+        self, requests: list[tuple[str, str, str]], max_workers: int = 8
+    ) -> list[BatchResult]:
+        """Read several resources of allowed skills with one batch call."""
+        return self._batch(
+            requests,
+            [skill_name for skill_name, _, _ in requests],
+            lambda allowed: self.registry.read_resources(allowed, max_workers),
+        )
+
+    def list_resources(self, name: str) -> dict[str, list[str]]:
+        """Return the resource manifest of an allowed skill."""
+        self._check(name)
+        return self.registry.list_resources(name)
+
+    def resource_digests(self, name: str) -> dict[str, dict[str, str]]:
+        """Return the digest manifest of an allowed skill."""
+        self._check(name)
+        return self.registry.resource_digests(name)
+
+    def skill_dependencies(self, name: str) -> list[str]:
+        """Return the allowed skills an allowed skill depends on directly."""
+        self._check(name)
+        allowed = self.allowed
+        return [d for d in self.registry.skill_dependencies(name) if d in allowed]
+
+    def run_skill_script(
+        self, skill_name: str, file_path: str, args: Sequence[str] = (), **options
+    ) -> ScriptResult:
+        """Run a script of an allowed skill (see ``SkillRegistry``)."""
+        self._check(skill_name)
+        return self.registry.run_skill_script(skill_name, file_path, args, **options)
+
+    def search_resources(
+        self, query: str, skill_name: str | None = None, limit: int = 10
+    ) -> list[SearchHit]:
+        """Search the resources of allowed skills in the registry's index."""
+        if skill_name is not None:
+            self._check(skill_name)
+            return self.registry.search_resources(query, skill_name, limit)
+        with timed("skills.search.duration"):
+            return self.resource_index().search(query, self.allowed, limit)
+
+    def resource_index(self) -> ResourceIndex:
+        """Return the underlying registry's full-text index."""
+        return self.registry.resource_index()
+
+    def scoped(self, names: Iterable[str]) -> ScopedSkillRegistry:
+        """Return a narrower view; it never widens this view's scope."""
+        return ScopedSkillRegistry(self.registry, self.allowed.intersection(names))
+
+    def add_change_listener(self, listener: Callable[[str], None]) -> None:
+        """Register a callback for changes to allowed skills."""
+
+        def forward(name: str) -> None:
+            if name in self.allowed:
+                listener(name)
+
+        self._listeners[listener] = forward
+        self.registry.add_change_listener(forward)
+
+    def remove_change_listener(self, listener: Callable[[str], None]) -> None:
+        """Unregister a callback previously passed to ``add_change_listener``."""
+        self.registry.remove_change_listener(self._listeners.pop(listener))
+
+    @property
+    def skill_names(self) -> list[str]:
+        """Return names of the allowed skills that are loaded."""
+        allowed = self.allowed
+        return [n for n in self.registry.skill_names if n in allowed]
+
+    def __len__(self) -> int:
+        return len(self.skill_names)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.allowed and name in self.registry
+
+    def _check(self, name: str) -> None:
+        if name not in self.allowed:
+            raise KeyError(f"Skill '{name}' not found in registry")
+
+    def _batch(
+        self,
+        items: list,
+        skill_names: list[str],
+        call: Callable[[list], list[BatchResult]],
+    ) -> list[BatchResult]:
+        allowed = self.allowed
+        inside = [item for item, n in zip(items, skill_names) if n in allowed]
+        results = iter(call(inside) if inside else [])
+        return [
+            next(results)
+            if n in allowed
+            else BatchResult(
+                key=item if isinstance(item, str) else "/".join(item),
+                error=str(KeyError(f"Skill '{n}' not found in registry")),
+            )
+            for item, n in zip(items, skill_names)
+        ]
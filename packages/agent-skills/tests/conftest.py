@@ -1,9 +1,56 @@
 """Shared fixtures for Agent Skills tests."""
 
+from collections.abc import Callable
 from pathlib import Path
 
 import pytest
 
+from agent_skills.instrumentation import InMemoryRecorder, set_instrumentation
+
+
+@pytest.fixture
+def recorder():
+    """Install an InMemoryRecorder for the duration of a test."""
+    recorder = InMemoryRecorder()
+    previous = set_instrumentation(recorder)
+    yield recorder
+    set_instrumentation(previous)
+
+
+@pytest.fixture
+def make_skill() -> Callable[..., Path]:
+    """Return a function that writes a skill directory and returns its path.
+
+    ``make_skill(parent, name, body, metadata=..., references=...)`` writes
+    ``parent/name/SKILL.md``, creating missing parents and overwriting an
+    existing skill, and writes each ``references`` entry under
+    ``references/``. Metadata values are quoted so they stay strings.
+    """
+
+    def make(
+        parent: Path,
+        name: str,
+        body: str = "Body.",
+        *,
+        metadata: dict[str, str] | None = None,
+        references: dict[str, str] | None = None,
+    ) -> Path:
+        skill_dir = parent / name
+        skill_dir.mkdir(parents=True, exist_ok=True)
+        frontmatter = f"name: {name}\ndescription: Skill {name}.\n"
+        if metadata:
+            frontmatter += "metadata:\n" + "".join(
+                f'  {key}: "{value}"\n' for key, value in metadata.items()
+            )
+        (skill_dir / "SKILL.md").write_text(f"---\n{frontmatter}---\n{body}\n")
+        if references:
+            (skill_dir / "references").mkdir(exist_ok=True)
+            for path, text in references.items():
+                (skill_dir / "references" / path).write_text(text)
+        return skill_dir
+
+    return make
+
 
 @pytest.fixture
 def minimal_skill(tmp_path: Path) -> Path:
@@ -0,0 +1,75 @@
+"""Tests for the benchmark harness and synthetic skill-tree generator."""
+
+from pathlib import Path
+
+from agent_skills.registry import FileSystemSkillRegistry
+from benchmarks.__main__ import main
+from benchmarks.discovery import _legacy_load, slow_filesystem
+from benchmarks.harness import BenchmarkResult, BenchmarkRun, compare, measure
+from benchmarks.synthetic import TreeSpec, generate_skill_tree
+
+
+def _run(**medians: float) -> BenchmarkRun:
+    return BenchmarkRun(
+        results={
+            name: BenchmarkResult(
+                name=name, iterations=1, mean=m, median=m, p95=m, minimum=m
+            )
+            for name, m in medians.items()
+        }
+    )
+
+
+class TestSyntheticTree:
+    def test_generated_tree_loads(self, tmp_path: Path):
+        spec = TreeSpec(skill_count=3, body_size=500, resource_depth=2, files_per_dir=2)
+        root = generate_skill_tree(tmp_path / "skills", spec)
+        reg = FileSystemSkillRegistry()
+        assert len(reg.load_skills_from_directory(root)) == 3
+        skill = reg.get_skill("skill-00000")
+        assert len(skill.instructions) >= 500
+        assert len(skill.resources.list_files("references")) == 6
+        assert "level-1/level-2/ref-2-1.md" in skill.resources.list_files("references")
+
+
+class TestDiscoveryCalls:
+    def test_fewer_calls_than_legacy_walk(self, tmp_path: Path):
+        spec = TreeSpec(skill_count=5, body_size=100, resource_depth=0)
+        root = generate_skill_tree(tmp_path / "skills", spec)
+        with slow_filesystem(0) as legacy:
+            assert len(_legacy_load(root)) == 5
+        with slow_filesystem(0) as scandir:
+            reg = FileSystemSkillRegistry()
+            assert len(reg.load_skills_from_directory(root)) == 5
+        assert sum(scandir.values()) * 3 < sum(legacy.values())
+
+
+class TestHarness:
+    def test_measure(self):
+        calls = []
+        result = measure("noop", lambda: calls.append(1), min_time=0, min_iterations=3)
+        assert result.iterations == 3
+        assert len(calls) == 4  # includes the warm-up call
+        assert result.minimum <= result.median <= result.p95
+
+    def test_compare_flags_regressions(self):
+        baseline = _run(fast=1.0, slow=1.0, gone=1.0)
+        current = _run(fast=1.1, slow=1.5, new=9.0)
+        regressions = compare(current, baseline, threshold=0.2)
+        assert [r.name for r in regressions] == ["slow"]
+        assert regressions[0].ratio == 1.5
+
+    def test_round_trip(self, tmp_path: Path):
+        run = _run(a=0.5)
+        run.save(tmp_path / "run.json")
+        assert BenchmarkRun.load(tmp_path / "run.json") == run
+
+    def test_cli_baseline(self, tmp_path: Path):
+        args = ["--skills", "2", "--min-time", "0", "-k", "parse_skill"]
+        output = tmp_path / "run.json"
+        assert main(args + ["--output", str(output)]) == 0
+        assert "parse_skill" in BenchmarkRun.load(output).results
+
+        baseline = _run(parse_skill=1e-9)
+        baseline.save(tmp_path / "baseline.json")
+        assert main(args + ["--baseline", str(tmp_path / "baseline.json")]) == 1
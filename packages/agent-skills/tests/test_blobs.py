@@ -0,0 +1,72 @@
+"""Tests for content-addressed blob storage."""
+
+from pathlib import Path
+
+import pytest
+
+from agent_skills.blobs import BlobStore, content_digest
+from agent_skills.registry import FileSystemSkillRegistry
+
+TEXT = "Ünïcödé template line.\n" * 200
+
+
+class TestBlobStore:
+    def test_shared_and_refcounted(self):
+        store = BlobStore()
+        digest, first = store.add("x" * 100)
+        _, second = store.add("x" * 100)
+        assert digest == content_digest("x" * 100)
+        assert first is second
+        assert len(store) == 1
+        store.release(digest)
+        assert digest in store
+        store.release(digest)
+        assert digest not in store
+        assert store.nbytes == 0
+
+    @pytest.mark.parametrize("hot_size", [0, 2])
+    def test_compressed(self, hot_size: int):
+        plain, compressed = BlobStore(), BlobStore(compresslevel=6, hot_size=hot_size)
+        digest, _ = plain.add(TEXT)
+        compressed.add(TEXT)
+        assert compressed.nbytes < plain.nbytes / 10
+        assert compressed.get(digest) == TEXT
+        assert compressed.get(digest) == TEXT
+        assert (compressed.hot_nbytes > 0) == (hot_size > 0)
+        assert compressed.get("missing") is None
+
+    def test_hot_tier_is_bounded(self):
+        store = BlobStore(compresslevel=1, hot_size=2)
+        digests = [store.add(f"blob {i}\n" * 50)[0] for i in range(4)]
+        for digest in digests:
+            store.get(digest)
+        assert list(store._hot) == digests[2:]
+        store.get(digests[2])
+        assert list(store._hot) == [digests[3], digests[2]]
+        store.release(digests[2])
+        assert list(store._hot) == [digests[3]]
+
+
+class TestCompressedRegistry:
+    def test_bodies_and_resources(self, full_skill: Path):
+        (full_skill / "references" / "BIG.md").write_text(TEXT, encoding="utf-8")
+        plain = FileSystemSkillRegistry(cache_resources=True)
+        compressed = FileSystemSkillRegistry(
+            cache_resources=True, compresslevel=6, hot_size=0
+        )
+        for reg in (plain, compressed):
+            reg.load_skill(full_skill)
+            assert reg.read_resource("full-skill", "references", "BIG.md") == TEXT
+
+        assert compressed.blobs.nbytes < plain.blobs.nbytes
+        assert len(compressed.bodies) == 1
+        expected = plain.get_skill("full-skill").instructions
+        assert compressed.activate_skill("full-skill") == expected
+        skill = compressed.get_skill("full-skill")
+        assert skill.instructions == expected
+        assert skill.activated is True
+
+        compressed.reload_skill("full-skill")
+        assert len(compressed.bodies) == 1
+        assert len(compressed.blobs) == 0
+        assert compressed.get_skill("full-skill").activated is False
@@ -0,0 +1,138 @@
+"""Tests for the skill category hierarchy."""
+
+from pathlib import Path
+
+import pytest
+
+from agent_skills.categories import CategoryTree, skill_category
+from agent_skills.models import SkillMetadata
+from agent_skills.parser import parse_skill
+from agent_skills.registry import FileSystemSkillRegistry
+from agent_skills.tools import SkillTools
+
+
+def _meta(name: str, category: str = "") -> SkillMetadata:
+    metadata = {"category": category} if category else None
+    return SkillMetadata(name=name, description=f"Skill {name}.", metadata=metadata)
+
+
+@pytest.fixture
+def tree() -> CategoryTree:
+    return CategoryTree(
+        [
+            _meta("top-skill"),
+            _meta("code-review", "engineering"),
+            _meta("api-design", "engineering/backend"),
+            _meta("db-migrations", "engineering/backend"),
+            _meta("css-audit", "engineering/frontend"),
+            _meta("contracts", " legal/ "),
+        ]
+    )
+
+
+class TestCategoryTree:
+    def test_root(self, tree: CategoryTree):
+        assert tree.root.skills == ("top-skill",)
+        assert tree.root.children == ("engineering", "legal")
+        assert tree.root.skill_count == 6
+        assert len(tree) == 4
+
+    def test_expand(self, tree: CategoryTree):
+        categories, skills = tree.expand("engineering")
+        assert [c.path for c in categories] == [
+            "engineering/backend",
+            "engineering/frontend",
+        ]
+        assert [s.name for s in skills] == ["code-review"]
+
+    def test_summary(self, tree: CategoryTree):
+        engineering = tree.get("engineering")
+        assert engineering.summary == (
+            "4 skills in backend, frontend, e.g. code-review, api-design, "
+            "db-migrations"
+        )
+        assert tree.get("legal").summary == "1 skill, e.g. contracts"
+
+    def test_path_normalized(self, tree: CategoryTree):
+        assert "/engineering/backend/" in tree
+        assert tree.get("engineering/backend").name == "backend"
+
+    def test_unknown_category(self, tree: CategoryTree):
+        with pytest.raises(KeyError, match="Category 'nope' not found"):
+            tree.expand("nope")
+
+    def test_intermediate_category_without_skills(self):
+        tree = CategoryTree([_meta("deep", "a/b/c")])
+        assert tree.get("a").summary == "1 skill in b, e.g. deep"
+        assert tree.get("a/b").skills == ()
+
+
+class TestCategorySources:
+    def test_frontmatter_category(self, tmp_path: Path, make_skill):
+        skill = parse_skill(
+            make_skill(tmp_path, "tagged", metadata={"category": "ops/oncall"})
+        )
+        assert skill_category(skill.metadata) == "ops/oncall"
+
+    def test_directory_category(self, tmp_path: Path, make_skill):
+        make_skill(tmp_path / "engineering" / "backend", "api-design")
+        make_skill(tmp_path / "engineering", "tagged", metadata={"category": "ops"})
+        registry = FileSystemSkillRegistry()
+        registry.load_skills_from_directory(tmp_path, max_depth=3)
+        tree = registry.category_tree()
+        assert tree.get("engineering/backend").skills == ("api-design",)
+        assert tree.get("ops").skills == ("tagged",)
+
+    def test_reload_keeps_directory_category(self, tmp_path: Path, make_skill):
+        make_skill(tmp_path / "engineering", "code-review")
+        registry = FileSystemSkillRegistry()
+        registry.load_skills_from_directory(tmp_path, max_depth=2)
+        before = registry.category_tree()
+        registry.reload_skill("code-review")
+        after = registry.category_tree()
+        assert after is not before
+        assert after.get("engineering").skills == ("code-review",)
+
+
+class TestHierarchicalPresentation:
+    @pytest.fixture
+    def registry(self, tmp_path: Path, make_skill) -> FileSystemSkillRegistry:
+        make_skill(tmp_path, "top-skill")
+        make_skill(tmp_path / "engineering", "code-review")
+        make_skill(tmp_path / "engineering" / "backend", "api-design")
+        registry = FileSystemSkillRegistry()
+        registry.load_skills_from_directory(tmp_path, max_depth=3)
+        return registry
+
+    def test_prompt_lists_top_level(self, registry: FileSystemSkillRegistry):
+        prompt = registry.to_system_prompt("", hierarchical=True)
+        assert "<name>top-skill</name>" in prompt
+        assert "<name>engineering</name>" in prompt
+        assert "api-design" in prompt  # only as a summary example
+        assert "<name>api-design</name>" not in prompt
+        assert "list_skills" in prompt
+
+    def test_cacheable_prompt(self, registry: FileSystemSkillRegistry):
+        prompt = registry.to_cacheable_prompt("", hierarchical=True)
+        assert "<name>engineering</name>" in prompt.skills
+        assert "<name>api-design</name>" not in prompt.text
+
+    def test_list_skills_drill_down(self, registry: FileSystemSkillRegistry):
+        tools = SkillTools(registry, hierarchical=True)
+        top = tools.list_skills()
+        assert "**engineering**: 2 skills in backend" in top
+        assert "**top-skill**" in top
+        assert "code-review" not in top.split("## Skills")[1]
+
+        branch = tools.list_skills(category="engineering")
+        assert "**engineering/backend**" in branch
+        assert "- **code-review**: Skill code-review." in branch
+
+    def test_list_skills_flat_by_default(self, registry: FileSystemSkillRegistry):
+        listing = SkillTools(registry).list_skills()
+        assert "## " not in listing
+        assert listing.count("- **") == 3
+
+    def test_list_skills_unknown_category(self, registry: FileSystemSkillRegistry):
+        result = SkillTools(registry).list_skills(category="nope")
+        assert result == "Error: \"Category 'nope' not found\""
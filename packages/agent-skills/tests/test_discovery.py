@@ -0,0 +1,126 @@
+"""Tests for scandir-based skill discovery."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from agent_skills.discovery import discover_skills
+from agent_skills.parser import parse_skill, parse_skill_location
+from agent_skills.registry import FileSystemSkillRegistry
+
+
+@pytest.fixture
+def nested_tree(tmp_path: Path, make_skill) -> Path:
+    root = tmp_path / "library"
+    make_skill(root, "top-skill")
+    make_skill(root / "engineering", "code-review")
+    make_skill(root / "engineering" / "backend", "api-design", "Body of api-design.")
+    make_skill(root / ".hidden", "secret-skill")
+    (root / "engineering" / "notes.md").write_text("not a skill")
+    (root / "empty").mkdir()
+    return root
+
+
+class TestDiscoverSkills:
+    def test_immediate_children_by_default(self, nested_tree: Path):
+        tree = discover_skills(nested_tree)
+        assert [s.path.name for s in tree.skills] == ["top-skill"]
+        assert tree.categories == []
+
+    def test_nested_categories(self, nested_tree: Path):
+        tree = discover_skills(nested_tree, max_depth=3)
+        found = {s.path.name: s.category for s in tree.skills}
+        assert found == {
+            "top-skill": "",
+            "code-review": "engineering",
+            "api-design": "engineering/backend",
+        }
+        assert [c.name for c in tree.categories] == ["empty", "engineering", "backend"]
+
+    def test_depth_limit(self, nested_tree: Path):
+        tree = discover_skills(nested_tree, max_depth=2)
+        assert [s.path.name for s in tree.skills] == ["code-review", "top-skill"]
+
+    def test_location_details(self, full_skill: Path):
+        (location,) = discover_skills(full_skill.parent).skills
+        assert location.path == full_skill.resolve()
+        assert location.resource_dirs == {"scripts", "references", "assets"}
+        assert location.mtime_ns == os.stat(full_skill / "SKILL.md").st_mtime_ns
+
+    def test_follows_symlinks(self, tmp_path: Path, make_skill):
+        target = make_skill(tmp_path / "elsewhere", "linked-skill")
+        root = tmp_path / "root"
+        root.mkdir()
+        (root / "linked-skill").symlink_to(target)
+        (location,) = discover_skills(root).skills
+        assert location.path == target.resolve()
+
+    def test_missing_root(self, tmp_path: Path):
+        with pytest.raises(FileNotFoundError):
+            discover_skills(tmp_path / "nope")
+
+    @pytest.mark.parametrize("error", [PermissionError, FileNotFoundError])
+    @pytest.mark.parametrize("folder", ["engineering", "engineering/backend"])
+    def test_unreadable_folder_skipped(
+        self, nested_tree: Path, monkeypatch, error: type[OSError], folder: str
+    ):
+        scandir = os.scandir
+        unreadable = str(nested_tree / folder)
+
+        def guarded_scandir(path):
+            if os.fspath(path) == unreadable:
+                raise error(path)
+            return scandir(path)
+
+        monkeypatch.setattr("agent_skills.discovery.os.scandir", guarded_scandir)
+        names = [loc.path.name for loc in discover_skills(nested_tree, 3).skills]
+        assert "top-skill" in names
+        assert "api-design" not in names
+
+    @pytest.mark.skipif(os.geteuid() == 0, reason="root can read any folder")
+    def test_permission_denied_folder(self, nested_tree: Path):
+        locked = nested_tree / "engineering"
+        locked.chmod(0)
+        try:
+            reg = FileSystemSkillRegistry()
+            loaded = reg.load_skills_from_directory(nested_tree, max_depth=3)
+        finally:
+            locked.chmod(0o755)
+        assert [s.metadata.name for s in loaded] == ["top-skill"]
+
+
+class TestParseSkillLocation:
+    def test_matches_parse_skill(self, full_skill: Path):
+        (location,) = discover_skills(full_skill.parent).skills
+        assert parse_skill_location(location) == parse_skill(full_skill)
+
+    def test_missing_resource_dirs(self, minimal_skill: Path):
+        (location,) = discover_skills(minimal_skill.parent).skills
+        skill = parse_skill_location(location)
+        assert skill.resources.scripts_dir is None
+        assert skill.resources.list_files("references") == []
+
+
+class TestNestedLoading:
+    def test_load_nested(self, nested_tree: Path):
+        reg = FileSystemSkillRegistry()
+        loaded = reg.load_skills_from_directory(nested_tree, max_depth=3)
+        assert len(loaded) == 3
+        assert "api-design" in reg
+        assert reg.activate_skill("api-design") == "Body of api-design."
+
+    def test_snapshot_tracks_categories(
+        self,
+        nested_tree: Path,
+        tmp_path_factory: pytest.TempPathFactory,
+        make_skill,
+    ):
+        reg = FileSystemSkillRegistry()
+        reg.load_skills_from_directory(nested_tree, max_depth=3)
+        snapshot = reg.save_snapshot(tmp_path_factory.mktemp("snap") / "skills.snap")
+        assert len(FileSystemSkillRegistry.load_snapshot(snapshot)) == 3
+
+        make_skill(nested_tree / "engineering" / "backend", "db-design")
+        with pytest.raises(ValueError):
+            FileSystemSkillRegistry.load_snapshot(snapshot)
@@ -0,0 +1,67 @@
+"""Tests for the frontmatter fast path and its YAML fallback."""
+
+import pytest
+import yaml
+
+from agent_skills.frontmatter import _parse_flat, load_frontmatter
+from agent_skills.models import SkillMetadata
+
+FLAT = [
+    "name: my-skill\ndescription: A test skill.\n",
+    "name: a\nlicense: Apache-2.0\ncompatibility: Requires Python 3.13+\n",
+    'name: a\nmetadata:\n  author: test-org\n  version: "1.0"\n',
+    "name: a\nallowed-tools: Read Bash(git:*)\n",
+    "name: a\nlicense:\ndescription: d\n",
+    "metadata:\n    a: x\n    b:\nname: a\n",
+    "# comment\nname: 'quoted'\ndescription: C# and url://x\n\n",
+    "name: a\r\ndescription: Windows line endings.\r\n",
+]
+
+FALLBACK = [
+    "name: a\ndescription: yes\n",
+    "name: a\nversion: 1.0\n",
+    "name: a\ndescription: trailing # comment\n",
+    "name: a\ndescription: wraps\n  onto two lines\n",
+    "name: a\ndescription: 'it''s'\n",
+    'name: a\ndescription: "tab\\there"\n',
+    "name: a\ndescription: |\n  block\n",
+    "name: a\nallowed-tools:\n  - Read\n  - Bash\n",
+    "name: a\nmetadata: {author: x}\n",
+    "true: a\n",
+    "- item\n",
+    "",
+    "# comment\u2028description: hidden\nname: a\n",
+    "# comment\x85description: hidden\nname: a\n",
+    "# comment\rdescription: hidden\nname: a\n",
+    "name: a\nmetadata:\n  # comment\u2029  author: x\n  version: y\n",
+]
+
+
+class TestLoadFrontmatter:
+    @pytest.mark.parametrize("text", FLAT)
+    def test_fast_path_matches_yaml(self, text: str):
+        assert _parse_flat(text) is not None
+        assert load_frontmatter(text) == yaml.safe_load(text)
+
+    @pytest.mark.parametrize("text", FALLBACK)
+    def test_fallback_matches_yaml(self, text: str):
+        assert _parse_flat(text) is None
+        assert load_frontmatter(text) == yaml.safe_load(text)
+
+    @pytest.mark.parametrize(
+        "text", ["name: a\ndescription: b: c\n", "metadata:\n  a: b\n    c: d\n"]
+    )
+    def test_invalid_yaml_raises(self, text: str):
+        assert _parse_flat(text) is None
+        with pytest.raises(yaml.YAMLError):
+            load_frontmatter(text)
+
+    def test_validation_unchanged(self):
+        fast = load_frontmatter("name: Bad_Name\ndescription: x\n")
+        with pytest.raises(ValueError, match="lowercase"):
+            SkillMetadata(**fast)
+        fallback = load_frontmatter(
+            "name: a\ndescription: x\nmetadata:\n  version: 1.0\n"
+        )
+        with pytest.raises(ValueError):
+            SkillMetadata(**fallback)
@@ -0,0 +1,102 @@
+"""Tests for the skill dependency graph and prerequisite activation."""
+
+from pathlib import Path
+
+import pytest
+
+from agent_skills.graph import dependency_order, estimate_tokens, extract_references
+from agent_skills.registry import FileSystemSkillRegistry
+from agent_skills.tools import create_skill_tools
+
+
+@pytest.fixture
+def graph_registry(tmp_path: Path, make_skill) -> FileSystemSkillRegistry:
+    """review -> spec -> glossary, review -> style; style mentions review."""
+    make_skill(tmp_path, "glossary", "G" * 400)
+    make_skill(tmp_path, "spec", "Use the terms from `glossary`.")
+    make_skill(tmp_path, "style-guide", "Used by `requirement-review`.")
+    make_skill(
+        tmp_path,
+        "requirement-review",
+        "R" * 40,
+        metadata={"requires": "spec, style-guide"},
+    )
+    reg = FileSystemSkillRegistry()
+    reg.load_skills_from_directory(tmp_path)
+    return reg
+
+
+class TestExtractReferences:
+    def test_declared_and_inline_code(self):
+        body = "Run `spec` first, then data-model. See `docs/api-guide.md`."
+        refs = extract_references("review", "glossary, style-guide", body)
+        assert refs == ["glossary", "spec", "style-guide"]
+
+    def test_prose_is_not_a_dependency(self):
+        body = "Unlike requirement-review, keep user-facing text to 2-4 lines."
+        assert extract_references("spec", "", body) == []
+
+    def test_excludes_self(self):
+        assert extract_references("my-skill", "my-skill", "Use `my-skill`.") == []
+
+    def test_estimate_tokens(self):
+        assert estimate_tokens("") == 0
+        assert estimate_tokens("abcde") == 2
+
+
+class TestDependencyOrder:
+    def test_prerequisites_first_and_deduplicated(self):
+        deps = {"a": ["b", "c"], "b": ["c"], "c": []}
+        assert dependency_order(["a", "b"], deps.__getitem__) == ["c", "b", "a"]
+
+    def test_cycle_and_unknown(self):
+        deps = {"a": ["b"], "b": ["a", "x"]}
+        assert dependency_order(["a"], deps.__getitem__) == ["x", "b", "a"]
+
+
+class TestRegistryDependencies:
+    def test_resolved_against_loaded_skills(self, graph_registry):
+        assert graph_registry.skill_dependencies("requirement-review") == [
+            "spec",
+            "style-guide",
+        ]
+        assert graph_registry.skill_dependencies("spec") == ["glossary"]
+        with pytest.raises(KeyError, match="not found"):
+            graph_registry.skill_dependencies("nope")
+
+    def test_activate_with_dependencies(self, graph_registry):
+        results = graph_registry.activate_with_dependencies(["requirement-review"])
+        assert [r.key for r in results] == [
+            "glossary",
+            "spec",
+            "style-guide",
+            "requirement-review",
+        ]
+        assert all(r.ok for r in results)
+        assert graph_registry.get_skill("glossary").activated is True
+
+    def test_token_budget_prefers_nearest(self, graph_registry):
+        results = graph_registry.activate_with_dependencies(
+            ["requirement-review"], token_budget=50
+        )
+        by_key = {r.key: r for r in results}
+        assert by_key["requirement-review"].ok
+        assert by_key["spec"].ok and by_key["style-guide"].ok
+        assert "token budget" in by_key["glossary"].error
+        assert graph_registry.get_skill("glossary").activated is False
+
+    def test_unknown_skill(self, graph_registry):
+        [result] = graph_registry.activate_with_dependencies(["nope"])
+        assert "not found" in result.error
+
+    def test_tool_mode(self, graph_registry):
+        funcs = {
+            t.tool_name: t._tool_func
+            for t in create_skill_tools(graph_registry, activation_token_budget=None)
+        }
+        result = funcs["activate_skill"]("spec", include_prerequisites=True)
+        assert result.index("## glossary") < result.index("## spec")
+        assert "## requirement-review" not in result
+        assert "## style-guide" in funcs["activate_skills"](
+            ["requirement-review"], include_prerequisites=True
+        )
@@ -0,0 +1,64 @@
+"""Import-time budget: heavy dependencies load only on first use."""
+
+import json
+import re
+import subprocess
+import sys
+
+import pytest
+
+HEAVY = ("strands", "jinja2", "yaml", "pydantic")
+
+# Cumulative microseconds for ``import agent_skills`` itself. Generous enough
+# for slow CI machines, far below the cost of importing any heavy dependency.
+PACKAGE_IMPORT_BUDGET_US = 50_000
+
+
+def _import(statement: str) -> tuple[list[str], dict[str, int]]:
+    code = (
+        f"{statement}\n"
+        "import json, sys\n"
+        f"print(json.dumps([m for m in {HEAVY!r} if m in sys.modules]))"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    cumulative = {}
+    for line in proc.stderr.splitlines():
+        match = re.match(r"import time:\s+\d+ \|\s+(\d+) \| (\s*)(\S+)", line)
+        if match:
+            cumulative[match.group(3)] = int(match.group(1))
+    return json.loads(proc.stdout), cumulative
+
+
+class TestImportCost:
+    def test_package_import_is_light(self):
+        loaded, cumulative = _import("import agent_skills")
+        assert loaded == []
+        assert cumulative["agent_skills"] < PACKAGE_IMPORT_BUDGET_US
+
+    def test_validation_needs_no_heavy_dependencies(self):
+        loaded, _ = _import("from agent_skills import validate_skill_directory")
+        assert loaded == []
+
+    def test_registry_does_not_import_strands_or_yaml(self):
+        loaded, _ = _import("from agent_skills import FileSystemSkillRegistry")
+        assert loaded == ["pydantic"]
+
+    def test_prompt_rendering_does_not_import_jinja(self):
+        loaded, _ = _import(
+            "from agent_skills import SkillMetadata, render_system_prompt\n"
+            "render_system_prompt('', [SkillMetadata(name='a', description='A.')])"
+        )
+        assert "jinja2" not in loaded
+
+    def test_lazy_exports(self):
+        import agent_skills
+
+        for name in agent_skills.__all__:
+            assert getattr(agent_skills, name) is not None
+        with pytest.raises(AttributeError):
+            agent_skills.does_not_exist
@@ -0,0 +1,111 @@
+"""Tests for instrumentation hooks."""
+
+from pathlib import Path
+
+import pytest
+
+from agent_skills.instrumentation import (
+    InMemoryRecorder,
+    Instrumentation,
+    OpenTelemetryInstrumentation,
+    get_instrumentation,
+    set_instrumentation,
+    timed,
+)
+from agent_skills.models import SkillMetadata
+from agent_skills.parser import parse_skill
+from agent_skills.prompt import render_system_prompt
+from agent_skills.registry import FileSystemSkillRegistry
+from agent_skills.tools import create_skill_tools
+
+
+class TestInstrumentationSetup:
+    def test_default_is_noop(self):
+        assert type(get_instrumentation()) is Instrumentation
+
+    def test_set_returns_previous(self):
+        recorder = InMemoryRecorder()
+        previous = set_instrumentation(recorder)
+        try:
+            assert get_instrumentation() is recorder
+        finally:
+            assert set_instrumentation(previous) is recorder
+
+    def test_timed_collects_late_attributes(self, recorder: InMemoryRecorder):
+        with timed("op", a="1") as attrs:
+            attrs["b"] = "2"
+        assert len(recorder.durations("op", a="1", b="2")) == 1
+
+    def test_opentelemetry_adapter(self):
+        class FakeInstrument:
+            def __init__(self):
+                self.calls = []
+
+            def record(self, value, attributes=None):
+                self.calls.append((value, attributes))
+
+            def add(self, value, attributes=None):
+                self.calls.append((value, attributes))
+
+        class FakeMeter:
+            def __init__(self):
+                self.created = {}
+
+            def create_histogram(self, name, unit=""):
+                return self.created.setdefault(name, FakeInstrument())
+
+            def create_counter(self, name):
+                return self.created.setdefault(name, FakeInstrument())
+
+        meter = FakeMeter()
+        otel = OpenTelemetryInstrumentation(meter)
+        otel.record_duration("d", 0.5, {"skill": "x"})
+        otel.add("c", 2)
+        otel.add("c", 3)
+        assert meter.created["d"].calls == [(0.5, {"skill": "x"})]
+        assert [v for v, _ in meter.created["c"].calls] == [2, 3]
+
+
+class TestEmittedMetrics:
+    def test_parse_and_load(self, recorder: InMemoryRecorder, skills_parent: Path):
+        parse_skill(skills_parent / "my-skill")
+        assert len(recorder.durations("skills.parse.duration", skill="my-skill")) == 1
+        FileSystemSkillRegistry().load_skills_from_directory(skills_parent)
+        assert len(recorder.durations("skills.load_directory.duration")) == 1
+        assert len(recorder.durations("skills.parse.duration")) == 3
+
+    def test_render(self, recorder: InMemoryRecorder):
+        render_system_prompt("", [SkillMetadata(name="a", description="A.")])
+        assert len(recorder.durations("skills.prompt.render.duration")) == 1
+
+    def test_activation_frequency(self, recorder: InMemoryRecorder, skills_parent: Path):
+        reg = FileSystemSkillRegistry()
+        reg.load_skills_from_directory(skills_parent)
+        reg.activate_skill("my-skill")
+        reg.activate_skill("my-skill")
+        reg.activate_skill("full-skill")
+        with pytest.raises(KeyError):
+            reg.activate_skill("nope")
+        assert recorder.counts_by("skills.activations", "skill") == {
+            "my-skill": 2,
+            "full-skill": 1,
+        }
+        assert len(recorder.durations("skills.activate.duration")) == 4
+
+    def test_resource_bytes(self, recorder: InMemoryRecorder, full_skill: Path):
+        reg = FileSystemSkillRegistry()
+        reg.load_skill(full_skill)
+        reg.read_resource("full-skill", "scripts", "run.sh")
+        size = (full_skill / "scripts" / "run.sh").stat().st_size
+        assert recorder.count("skills.resource.bytes_read", resource_type="scripts") == size
+        assert len(recorder.durations("skills.resource.read.duration")) == 1
+
+    def test_tool_calls(self, recorder: InMemoryRecorder, minimal_skill: Path):
+        reg = FileSystemSkillRegistry()
+        reg.load_skill(minimal_skill)
+        funcs = {t.tool_name: t._tool_func for t in create_skill_tools(reg)}
+        funcs["activate_skill"](skill_name="my-skill")
+        funcs["activate_skill"](skill_name="nope")
+        assert recorder.count("skills.tool.calls", tool="activate_skill", outcome="ok") == 1
+        assert recorder.count("skills.tool.calls", tool="activate_skill", outcome="error") == 1
+        assert len(recorder.durations("skills.tool.duration", tool="activate_skill")) == 2
@@ -0,0 +1,32 @@
+"""Tests for per-conversation delivery tracking."""
+
+from agent_skills.ledger import ContextLedger
+
+
+class TestContextLedger:
+    def test_seen_after_first_delivery(self):
+        ledger = ContextLedger()
+        assert not ledger.seen("a", "content")
+        assert ledger.seen("a", "content")
+        assert "a" in ledger
+        assert len(ledger) == 1
+
+    def test_changed_content_is_delivered_again(self):
+        ledger = ContextLedger()
+        ledger.seen("a", "v1")
+        assert not ledger.seen("a", "v2")
+        assert ledger.seen("a", "v2")
+
+    def test_keys_are_independent(self):
+        ledger = ContextLedger()
+        ledger.seen("a", "same")
+        assert not ledger.seen("b", "same")
+
+    def test_forget(self):
+        ledger = ContextLedger()
+        ledger.seen("a", "x")
+        ledger.seen("b", "y")
+        ledger.forget("a")
+        assert not ledger.seen("a", "x")
+        ledger.forget()
+        assert len(ledger) == 0
@@ -1,7 +1,7 @@
 """Tests for system prompt XML generation."""
 
 from agent_skills.models import SkillMetadata
-from agent_skills.prompt import render_system_prompt
+from agent_skills.prompt import render_cacheable_prompt, render_system_prompt
 
 
 class TestRenderSystemPrompt:
@@ -36,3 +36,38 @@ class TestRenderSystemPrompt:
         result = render_system_prompt("", skills)
         assert "&lt;special&gt;" in result
         assert "&amp;" in result
+
+
+class TestRenderCacheablePrompt:
+    SKILLS = [
+        SkillMetadata(name="skill-b", description="Second skill."),
+        SkillMetadata(name="skill-a", description="First skill."),
+    ]
+
+    def test_empty_list(self):
+        assert render_cacheable_prompt("Hi", []).text == ""
+
+    def test_canonical_order(self):
+        forward = render_cacheable_prompt("Hi", self.SKILLS)
+        backward = render_cacheable_prompt("Hi", list(reversed(self.SKILLS)))
+        assert forward == backward
+        assert forward.text.index("skill-a") < forward.text.index("skill-b")
+
+    def test_static_content_first(self):
+        prompt = render_cacheable_prompt("You are a reviewer.", self.SKILLS)
+        assert prompt.text.startswith("## Skills System")
+        assert prompt.text.endswith("\nYou are a reviewer.\n")
+        assert "".join(prompt.segments) == prompt.text
+
+    def test_cache_boundaries(self):
+        reviewer = render_cacheable_prompt("You are a reviewer.", self.SKILLS)
+        writer = render_cacheable_prompt("You are a writer.", self.SKILLS[:1])
+        first, second = reviewer.cache_boundaries
+        assert reviewer.text[:first] == writer.text[: writer.cache_boundaries[0]]
+        assert reviewer.text[first:second] == reviewer.skills
+        assert reviewer.text[first:second].endswith("</available_skills>\n")
+
+    def test_same_content_as_default_layout(self):
+        default = render_system_prompt("Hi", self.SKILLS)
+        cacheable = render_cacheable_prompt("Hi", self.SKILLS)
+        assert sorted(default.split()) == sorted(cacheable.text.split())
@@ -0,0 +1,149 @@
+"""Tests for resource read quotas."""
+
+from pathlib import Path
+
+import pytest
+
+from agent_skills.quotas import ResourceQuota, ThrottledError, TokenBucket
+from agent_skills.registry import FileSystemSkillRegistry
+from agent_skills.tools import SkillTools
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.waits: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.waits.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+def _quota(clock: FakeClock, **options) -> ResourceQuota:
+    return ResourceQuota(clock=clock, sleep=clock.sleep, **options)
+
+
+class TestTokenBucket:
+    def test_refill_and_debt(self):
+        bucket = TokenBucket(rate=10, capacity=5)
+        assert bucket.delay(5, now=0) == 0
+        bucket.take(8, now=0)
+        assert bucket.delay(1, now=0) == pytest.approx(0.4)
+        assert bucket.delay(1, now=10) == 0
+        bucket.take(100, now=10)
+        assert bucket.delay(0, now=10) == pytest.approx(9.5)
+
+    def test_more_than_capacity_waits_for_full_bucket(self):
+        bucket = TokenBucket(rate=2, capacity=2)
+        assert bucket.delay(5, now=0) == 0
+        bucket.take(1, now=0)
+        assert bucket.delay(5, now=0) == pytest.approx(0.5)
+
+
+class TestResourceQuota:
+    def test_calls_queue_in_order(self, clock: FakeClock, recorder):
+        quota = _quota(clock, calls_per_second=2, max_wait=5)
+        for _ in range(5):
+            quota.acquire()
+        assert clock.waits == pytest.approx([0.5, 0.5, 0.5])
+        assert len(recorder.durations("skills.quota.wait.duration")) == 3
+
+    def test_throttled_beyond_max_wait(self, clock: FakeClock, recorder):
+        quota = _quota(clock, calls_per_second=1, max_wait=0)
+        quota.acquire()
+        with pytest.raises(ThrottledError) as excinfo:
+            quota.acquire()
+        assert excinfo.value.retry_after == pytest.approx(1.0)
+        assert recorder.count("skills.quota.throttled", quota="session") == 1
+        clock.now += 1
+        quota.acquire()
+
+    def test_byte_debt_delays_next_call(self, clock: FakeClock):
+        quota = _quota(clock, bytes_per_second=1000, max_wait=10)
+        quota.acquire()
+        quota.charge(3000)
+        quota.acquire()
+        assert clock.waits == pytest.approx([2.0])
+
+    def test_parent_shared_between_sessions(self, clock: FakeClock, recorder):
+        shared = _quota(clock, calls_per_second=2, name="global")
+        first = _quota(clock, calls_per_second=100, parent=shared, max_wait=0)
+        second = _quota(clock, calls_per_second=100, parent=shared, max_wait=0)
+        first.acquire()
+        first.acquire()
+        with pytest.raises(ThrottledError):
+            second.acquire()
+        assert recorder.count("skills.quota.throttled", quota="global") == 1
+
+    def test_refused_call_reserves_nothing(self, clock: FakeClock):
+        shared = _quota(clock, calls_per_second=1, name="global")
+        session = _quota(clock, calls_per_second=1, parent=shared, max_wait=0)
+        session.acquire()
+        for _ in range(3):
+            with pytest.raises(ThrottledError):
+                session.acquire()
+        clock.now += 1
+        session.acquire()
+
+    def test_batch_larger_than_capacity(self, clock: FakeClock):
+        quota = _quota(clock, calls_per_second=2)
+        assert quota.acquire(5) == 0
+        with pytest.raises(ThrottledError, match="retry in 2.00s"):
+            quota.acquire()
+        clock.now += 2
+        quota.acquire()
+        clock.now += 0.5
+        assert quota.acquire(5) == pytest.approx(0.5)
+        assert clock.waits == pytest.approx([0.5])
+
+
+class TestQuotaTools:
+    @pytest.fixture
+    def registry(self, full_skill: Path) -> FileSystemSkillRegistry:
+        registry = FileSystemSkillRegistry()
+        registry.load_skill(full_skill)
+        return registry
+
+    def test_throttled_response(
+        self, registry: FileSystemSkillRegistry, clock: FakeClock, recorder
+    ):
+        quota = _quota(clock, calls_per_second=1, max_wait=0)
+        tools = SkillTools(registry, quota=quota)
+        args = ("full-skill", "references", "REFERENCE.md")
+        assert tools.read_skill_resource(*args).startswith("# Reference")
+        result = tools.read_skill_resource(*args)
+        assert result.startswith("Throttled: Resource reads are over quota")
+        assert recorder.counts_by("skills.tool.calls", "outcome") == {
+            "ok": 1,
+            "throttled": 1,
+        }
+
+    def test_batch_larger_than_capacity(
+        self, registry: FileSystemSkillRegistry, clock: FakeClock
+    ):
+        tools = SkillTools(registry, quota=_quota(clock, calls_per_second=2))
+        item = {"skill_name": "full-skill", "resource_type": "assets"}
+        result = tools.read_skill_resources([{**item, "file_path": "template.txt"}] * 5)
+        assert not result.startswith("Throttled")
+        assert result.count("Template content.") == 5
+
+    def test_batch_counts_each_file(
+        self, registry: FileSystemSkillRegistry, clock: FakeClock
+    ):
+        quota = _quota(clock, calls_per_second=2, bytes_per_second=10, max_wait=60)
+        tools = SkillTools(registry, quota=quota)
+        item = {"skill_name": "full-skill", "resource_type": "assets"}
+        tools.read_skill_resources([{**item, "file_path": "template.txt"}] * 3)
+        # The full bucket admits all 3 calls at once, leaving a 1-call debt.
+        assert clock.waits == []
+        tools.read_skill_resource("full-skill", "assets", "template.txt")
+        # 3 x 18 bytes overdraw the 10-byte burst; the debt takes 4.4s to repay
+        assert clock.waits == pytest.approx([4.4])
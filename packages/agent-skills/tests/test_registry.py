@@ -1,8 +1,12 @@
 """Tests for SkillRegistry ABC and LocalSkillRepository."""
 
+import os
+import shutil
+import threading
 from pathlib import Path
 
 import pytest
+from agent_skills.blobs import content_digest
 from agent_skills.registry import FileSystemSkillRegistry, SkillRegistry
 
 
@@ -11,6 +15,43 @@ class TestSkillRegistryABC:
         with pytest.raises(TypeError):
             SkillRegistry()
 
+    def test_subclass_without_super_init(self, full_skill: Path):
+        class Wrapper(SkillRegistry):
+            def __init__(self, inner: SkillRegistry) -> None:
+                self.inner = inner
+
+            def get_skill(self, name):
+                return self.inner.get_skill(name)
+
+            def list_skills(self):
+                return self.inner.list_skills()
+
+            def activate_skill(self, name):
+                return self.inner.activate_skill(name)
+
+            def read_resource(self, skill_name, resource_type, file_path):
+                return self.inner.read_resource(skill_name, resource_type, file_path)
+
+            @property
+            def skill_names(self):
+                return self.inner.skill_names
+
+            def __len__(self):
+                return len(self.inner)
+
+            def __contains__(self, name):
+                return name in self.inner
+
+        inner = FileSystemSkillRegistry()
+        inner.load_skill(full_skill)
+        reg = Wrapper(inner)
+        changed = []
+        reg.add_change_listener(changed.append)
+        reg._notify_changed("full-skill")
+        assert changed == ["full-skill"]
+        assert reg.search_resources("details")[0].file_path == "REFERENCE.md"
+        reg.clear_script_results()
+
 
 class TestLocalSkillRepository:
     def test_load_skill(self, minimal_skill: Path):
@@ -87,7 +128,7 @@ class TestLocalSkillRepository:
         reg = FileSystemSkillRegistry()
         reg.load_skill(minimal_skill)
         tools = reg.get_tools()
-        assert len(tools) == 3
+        assert len(tools) == 6
 
     def test_empty_registry(self):
         reg = FileSystemSkillRegistry()
@@ -98,3 +139,237 @@ class TestLocalSkillRepository:
     def test_is_skill_registry(self):
         reg = FileSystemSkillRegistry()
         assert isinstance(reg, SkillRegistry)
+
+    def test_change_listener_on_load(self, minimal_skill: Path):
+        reg = FileSystemSkillRegistry()
+        changed = []
+        reg.add_change_listener(changed.append)
+        reg.load_skill(minimal_skill)
+        assert changed == ["my-skill"]
+
+    def test_reload_skill(self, minimal_skill: Path):
+        reg = FileSystemSkillRegistry()
+        reg.load_skill(minimal_skill)
+        changed = []
+        reg.add_change_listener(changed.append)
+        (minimal_skill / "SKILL.md").write_text(
+            "---\nname: my-skill\ndescription: Updated.\n---\nNew body.\n"
+        )
+        skill = reg.reload_skill("my-skill")
+        assert skill.instructions == "New body."
+        assert reg.list_skills()[0].description == "Updated."
+        assert changed == ["my-skill"]
+
+    def test_reload_missing_skill(self):
+        reg = FileSystemSkillRegistry()
+        with pytest.raises(KeyError, match="not found"):
+            reg.reload_skill("nope")
+
+    def test_remove_change_listener(self, minimal_skill: Path):
+        reg = FileSystemSkillRegistry()
+        changed = []
+        reg.add_change_listener(changed.append)
+        reg.remove_change_listener(changed.append)
+        reg.load_skill(minimal_skill)
+        assert changed == []
+
+    def test_activate_skills(self, skills_parent: Path):
+        reg = FileSystemSkillRegistry()
+        reg.load_skills_from_directory(skills_parent)
+        results = reg.activate_skills(["full-skill", "nope", "my-skill"])
+        assert [r.key for r in results] == ["full-skill", "nope", "my-skill"]
+        assert results[0].ok and "detailed instructions" in results[0].content
+        assert not results[1].ok and "not found" in results[1].error
+        assert results[2].ok
+        assert reg.get_skill("my-skill").activated is True
+
+    def test_read_resources(self, full_skill: Path):
+        reg = FileSystemSkillRegistry()
+        reg.load_skill(full_skill)
+        results = reg.read_resources(
+            [
+                ("full-skill", "scripts", "run.sh"),
+                ("full-skill", "bogus", "x"),
+                ("full-skill", "references", "REFERENCE.md"),
+            ]
+        )
+        assert [r.key for r in results] == [
+            "full-skill/scripts/run.sh",
+            "full-skill/bogus/x",
+            "full-skill/references/REFERENCE.md",
+        ]
+        assert "echo hello" in results[0].content
+        assert "Invalid resource type" in results[1].error
+        assert results[2].content.startswith("# Reference")
+
+    def test_batches_use_threads_only_for_io(self, full_skill: Path, monkeypatch):
+        reg = FileSystemSkillRegistry(cache_resources=True)
+        reg.load_skill(full_skill)
+        threads = []
+        barrier = threading.Barrier(2, timeout=5)
+        for method in ("activate_skill", "read_resource"):
+            original = getattr(reg, method)
+
+            def record(*args, original=original):
+                threads.append(threading.current_thread())
+                if len(args) == 3 and args not in reg._resource_cache:
+                    barrier.wait()  # both uncached reads run at once
+                return original(*args)
+
+            monkeypatch.setattr(reg, method, record)
+
+        reg.activate_skills(["full-skill"] * 4)
+        assert set(threads) == {threading.current_thread()}
+
+        requests = [
+            ("full-skill", "scripts", "run.sh"),
+            ("full-skill", "assets", "template.txt"),
+        ]
+        threads.clear()
+        assert all(r.ok for r in reg.read_resources(requests))
+        assert len(set(threads)) == 2
+        threads.clear()
+        assert all(r.ok for r in reg.read_resources(requests))
+        assert set(threads) == {threading.current_thread()}
+
+
+def _copy_skill(source: Path, name: str) -> Path:
+    target = source.parent / name
+    shutil.copytree(source, target)
+    skill_md = target / "SKILL.md"
+    skill_md.write_text(
+        skill_md.read_text().replace(f"name: {source.name}", f"name: {name}")
+    )
+    return target
+
+
+class TestResourceDedup:
+    def test_resource_digests(self, full_skill: Path):
+        reg = FileSystemSkillRegistry()
+        reg.load_skill(full_skill)
+        digests = reg.resource_digests("full-skill")
+        assert set(digests) == {"scripts", "references", "assets"}
+        assert digests["assets"] == {
+            "template.txt": content_digest("Template content.\n")
+        }
+        with pytest.raises(KeyError):
+            reg.resource_digests("nope")
+
+    @pytest.mark.parametrize("cache_resources", [False, True])
+    def test_binary_asset_left_out(self, full_skill: Path, cache_resources: bool):
+        (full_skill / "assets" / "x.bin").write_bytes(b"\x89\xff\xfe")
+        reg = FileSystemSkillRegistry(cache_resources=cache_resources)
+        reg.load_skill(full_skill)
+        assert reg.list_resources("full-skill")["assets"] == ["template.txt", "x.bin"]
+        assert list(reg.resource_digests("full-skill")["assets"]) == ["template.txt"]
+        view = reg.scoped(["full-skill"])
+        assert SkillRegistry.resource_digests(view, "full-skill") == (
+            reg.resource_digests("full-skill")
+        )
+        with pytest.raises(ValueError, match="'assets/x.bin' .* is not UTF-8 text"):
+            reg.read_resource("full-skill", "assets", "x.bin")
+
+    def test_identical_files_cached_once(self, full_skill: Path):
+        twin = _copy_skill(full_skill, "twin-skill")
+        (twin / "assets" / "template.txt").write_text("Different.\n")
+        reg = FileSystemSkillRegistry(cache_resources=True)
+        reg.load_skill(full_skill)
+        reg.load_skill(twin)
+
+        first = reg.read_resource("full-skill", "references", "REFERENCE.md")
+        second = reg.read_resource("twin-skill", "references", "REFERENCE.md")
+        assert first is second
+        reg.read_resource("full-skill", "assets", "template.txt")
+        reg.read_resource("twin-skill", "assets", "template.txt")
+        assert len(reg.blobs) == 3
+
+        shared = reg.resource_digests("full-skill")["references"]
+        assert shared == reg.resource_digests("twin-skill")["references"]
+        assert len(reg.blobs) == 4  # run.sh, read while computing digests
+
+        reg.reload_skill("twin-skill")
+        assert len(reg.blobs) == 3  # only the twin's own template is dropped
+        reg.reload_skill("full-skill")
+        assert len(reg.blobs) == 0
+        assert reg.blobs.nbytes == 0
+
+
+class TestSnapshot:
+    @pytest.fixture
+    def snapshot(self, skills_parent: Path, tmp_path_factory) -> Path:
+        reg = FileSystemSkillRegistry()
+        reg.load_skills_from_directory(skills_parent)
+        reg.activate_skill("my-skill")
+        return reg.save_snapshot(tmp_path_factory.mktemp("snap") / "registry.snapshot")
+
+    def test_round_trip(self, skills_parent: Path, snapshot: Path, monkeypatch):
+        def no_parsing(path):
+            raise AssertionError("snapshot import must not parse SKILL.md")
+
+        monkeypatch.setattr("agent_skills.registry.parse_skill", no_parsing)
+        reg = FileSystemSkillRegistry.load_snapshot(snapshot, cache_resources=True)
+        assert sorted(reg.skill_names) == ["full-skill", "my-skill"]
+        skill = reg.get_skill("full-skill")
+        assert skill.metadata.allowed_tools == ["Bash(git:*)", "Read"]
+        assert skill.activated is False
+        assert "detailed instructions" in reg.activate_skill("full-skill")
+        assert reg.list_resources("full-skill")["scripts"] == ["run.sh"]
+        assert "echo hello" in reg.read_resource("full-skill", "scripts", "run.sh")
+
+    def test_stale_after_edit(self, skills_parent: Path, snapshot: Path):
+        skill_md = skills_parent / "my-skill" / "SKILL.md"
+        os.utime(skill_md, ns=(0, skill_md.stat().st_mtime_ns + 1))
+        with pytest.raises(ValueError, match="stale"):
+            FileSystemSkillRegistry.load_snapshot(snapshot)
+        reg = FileSystemSkillRegistry.load_snapshot(snapshot, check_sources=False)
+        assert "my-skill" in reg
+
+    def test_stale_after_new_skill(self, skills_parent: Path, snapshot: Path):
+        os.utime(skills_parent, ns=(0, skills_parent.stat().st_mtime_ns + 1))
+        with pytest.raises(ValueError, match="stale"):
+            FileSystemSkillRegistry.load_snapshot(snapshot)
+
+    @pytest.mark.parametrize(
+        "new_file", ["scripts/new.sh", "references/deep/new.md", "assets/new.txt"]
+    )
+    def test_stale_after_resource_change(
+        self, full_skill: Path, tmp_path_factory, new_file: str
+    ):
+        (full_skill / "references" / "deep").mkdir()
+        for dirpath, _, _ in os.walk(full_skill):
+            os.utime(dirpath, ns=(0, 1))
+        reg = FileSystemSkillRegistry(cache_resources=True)
+        reg.load_skill(full_skill)
+        path = reg.save_snapshot(tmp_path_factory.mktemp("snap") / "registry.snapshot")
+        assert len(FileSystemSkillRegistry.load_snapshot(path)) == 1
+
+        (full_skill / new_file).write_text("new\n")
+        with pytest.raises(ValueError, match="stale"):
+            FileSystemSkillRegistry.load_snapshot(path, cache_resources=True)
+
+    def test_indexes_resources(self, snapshot: Path, recorder):
+        reg = FileSystemSkillRegistry.load_snapshot(snapshot, index_resources=True)
+        assert recorder.durations("skills.index.duration", skill="full-skill")
+        assert [h.file_path for h in reg.search_resources("template")] == [
+            "template.txt"
+        ]
+
+    def test_reloaded_skill_is_fresh(self, skills_parent: Path, tmp_path_factory):
+        reg = FileSystemSkillRegistry()
+        reg.load_skills_from_directory(skills_parent)
+        skill_md = skills_parent / "my-skill" / "SKILL.md"
+        os.utime(skill_md, ns=(0, skill_md.stat().st_mtime_ns + 1))
+        reg.reload_skill("my-skill")
+        path = reg.save_snapshot(tmp_path_factory.mktemp("snap") / "registry.snapshot")
+        assert len(FileSystemSkillRegistry.load_snapshot(path)) == 2
+
+    def test_rejects_plain_catalog(self, skills_parent: Path, tmp_path: Path):
+        from agent_skills.shared import write_catalog
+
+        reg = FileSystemSkillRegistry()
+        reg.load_skills_from_directory(skills_parent)
+        path = write_catalog(reg, tmp_path / "skills.catalog")
+        with pytest.raises(ValueError, match="snapshot"):
+            FileSystemSkillRegistry.load_snapshot(path)
+        with pytest.raises(FileNotFoundError):
+            FileSystemSkillRegistry.load_snapshot(tmp_path / "missing")
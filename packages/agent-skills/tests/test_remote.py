@@ -0,0 +1,212 @@
+"""Tests for the skill server and RemoteSkillRegistry client."""
+
+import http.client
+import json
+import socket
+from pathlib import Path
+
+import pytest
+
+from agent_skills.registry import FileSystemSkillRegistry, SkillRegistry
+from agent_skills.remote import RemoteSkillRegistry
+from agent_skills.server import MAX_REQUEST_BYTES, SkillServer
+from agent_skills.tools import create_skill_tools
+
+
+@pytest.fixture
+def server(skills_parent: Path):
+    reg = FileSystemSkillRegistry()
+    reg.load_skills_from_directory(skills_parent)
+    with SkillServer(reg) as srv:
+        yield srv
+
+
+@pytest.fixture
+def remote(server: SkillServer):
+    with RemoteSkillRegistry(server.url) as reg:
+        yield reg
+
+
+class TestSkillServer:
+    def _get(self, server: SkillServer, path: str, headers=None):
+        host, port = server.url.removeprefix("http://").split(":")
+        conn = http.client.HTTPConnection(host, int(port))
+        conn.request("GET", path, headers=headers or {})
+        response = conn.getresponse()
+        body = response.read()
+        conn.close()
+        return response, body
+
+    def test_etag_not_modified(self, server: SkillServer):
+        response, _ = self._get(server, "/skills")
+        etag = response.getheader("ETag")
+        assert response.status == 200 and etag
+        response, body = self._get(server, "/skills", {"If-None-Match": etag})
+        assert response.status == 304
+        assert body == b""
+
+    def test_missing_skill_is_404(self, server: SkillServer):
+        response, body = self._get(server, "/skills/nope")
+        assert response.status == 404
+        assert json.loads(body)["error"]["type"] == "KeyError"
+
+    def test_batch_reports_per_item_errors(self, server: SkillServer):
+        results = server.handle_batch(
+            {"requests": [{"op": "skill", "name": "my-skill"}, {"op": "skill", "name": "x"}]}
+        )["results"]
+        assert results[0]["value"]["metadata"]["name"] == "my-skill"
+        assert results[1]["error"]["type"] == "KeyError"
+
+    def test_batch_reports_malformed_items(self, server: SkillServer):
+        results = server.handle_batch(
+            {
+                "requests": [
+                    {"op": "skill"},
+                    {"skill_name": "full-skill", "resource_type": "assets"},
+                    "my-skill",
+                    {"op": "delete", "name": "my-skill"},
+                    {"op": "skill", "name": "my-skill"},
+                ]
+            }
+        )["results"]
+        assert [r["error"]["type"] for r in results[:4]] == ["ValueError"] * 4
+        assert "file_path" in results[1]["error"]["message"]
+        assert results[4]["value"]["metadata"]["name"] == "my-skill"
+
+    def test_malformed_batch_is_400(self, server: SkillServer):
+        host, port = server.url.removeprefix("http://").split(":")
+        conn = http.client.HTTPConnection(host, int(port))
+        for payload in ([1, 2], {"requests": "my-skill"}):
+            conn.request("POST", "/batch", body=json.dumps(payload))
+            response = conn.getresponse()
+            assert response.status == 400
+            assert json.loads(response.read())["error"]["type"] == "ValueError"
+        # The connection is still usable afterwards.
+        conn.request("POST", "/batch", body=json.dumps({"requests": [None]}))
+        response = conn.getresponse()
+        assert response.status == 200
+        results = json.loads(response.read())["results"]
+        assert results[0]["error"]["type"] == "ValueError"
+        conn.close()
+
+    def _post_raw(self, server: SkillServer, headers: str) -> tuple[int, dict, bool]:
+        """Send a POST with raw headers; return status, body and whether closed."""
+        host, port = server.url.removeprefix("http://").split(":")
+        with socket.create_connection((host, int(port)), timeout=5) as sock:
+            sock.sendall(f"POST /batch HTTP/1.1\r\nHost: x\r\n{headers}\r\n".encode())
+            response = http.client.HTTPResponse(sock)
+            response.begin()
+            body = json.loads(response.read())
+            closed = sock.recv(1) == b""
+        return response.status, body, closed
+
+    @pytest.mark.parametrize("length", ["abc", "-1"])
+    def test_invalid_content_length_is_400(self, server: SkillServer, length: str):
+        status, body, closed = self._post_raw(server, f"Content-Length: {length}\r\n")
+        assert status == 400
+        assert "Content-Length" in body["error"]["message"]
+        assert closed
+
+    def test_oversized_body_is_413(self, server: SkillServer):
+        length = MAX_REQUEST_BYTES + 1
+        status, body, closed = self._post_raw(server, f"Content-Length: {length}\r\n")
+        assert status == 413
+        assert body["error"]["type"] == "ValueError"
+        assert closed
+
+
+class TestRemoteSkillRegistry:
+    def test_is_skill_registry(self, remote: RemoteSkillRegistry):
+        assert isinstance(remote, SkillRegistry)
+
+    def test_listing(self, remote: RemoteSkillRegistry):
+        assert len(remote) == 2
+        assert "my-skill" in remote
+        assert sorted(remote.skill_names) == ["full-skill", "my-skill"]
+        assert {m.name for m in remote.list_skills()} == {"full-skill", "my-skill"}
+
+    def test_activate_skill(self, remote: RemoteSkillRegistry):
+        assert "Do the thing step by step." in remote.activate_skill("my-skill")
+        assert remote.get_skill("my-skill").activated is True
+
+    def test_activate_missing_skill(self, remote: RemoteSkillRegistry):
+        with pytest.raises(KeyError, match="not found"):
+            remote.activate_skill("nope")
+        assert remote.get_skill("nope") is None
+
+    def test_read_resource(self, remote: RemoteSkillRegistry):
+        content = remote.read_resource("full-skill", "scripts", "run.sh")
+        assert "echo hello" in content
+
+    def test_read_resource_errors(self, remote: RemoteSkillRegistry):
+        with pytest.raises(FileNotFoundError):
+            remote.read_resource("full-skill", "scripts", "missing.sh")
+        with pytest.raises(ValueError, match="Invalid resource type"):
+            remote.read_resource("full-skill", "bogus", "run.sh")
+        with pytest.raises(KeyError):
+            remote.read_resource("nope", "scripts", "run.sh")
+
+    def test_manifest(self, remote: RemoteSkillRegistry):
+        assert remote.list_resources("full-skill")["references"] == ["REFERENCE.md"]
+
+    def test_revalidation_sees_changes(
+        self, server: SkillServer, remote: RemoteSkillRegistry, full_skill: Path
+    ):
+        assert "echo hello" in remote.read_resource("full-skill", "scripts", "run.sh")
+        (full_skill / "scripts" / "run.sh").write_text("echo changed\n")
+        assert remote.read_resource("full-skill", "scripts", "run.sh") == "echo changed\n"
+
+    def test_cache_ttl_serves_without_request(self, server: SkillServer):
+        with RemoteSkillRegistry(server.url, cache_ttl=60) as remote:
+            remote.activate_skill("my-skill")
+            server.stop()
+            assert "Do the thing" in remote.activate_skill("my-skill")
+
+    def test_prefetch(self, server: SkillServer):
+        with RemoteSkillRegistry(server.url, cache_ttl=60) as remote:
+            remote.prefetch(["my-skill"], [("full-skill", "assets", "template.txt")])
+            server.stop()
+            assert "Do the thing" in remote.activate_skill("my-skill")
+            assert remote.read_resource("full-skill", "assets", "template.txt") == (
+                "Template content.\n"
+            )
+
+    def test_batch(self, remote: RemoteSkillRegistry):
+        results = remote.activate_skills(["my-skill", "nope"])
+        assert results[0].ok and "Do the thing" in results[0].content
+        assert "not found" in results[1].error
+        assert remote.get_skill("my-skill").activated is True
+        results = remote.read_resources(
+            [("full-skill", "scripts", "run.sh"), ("full-skill", "scripts", "x.sh")]
+        )
+        assert "echo hello" in results[0].content
+        assert "not found" in results[1].error
+
+    def test_tools(self, remote: RemoteSkillRegistry):
+        funcs = {t.tool_name: t._tool_func for t in create_skill_tools(remote)}
+        result = funcs["activate_skill"](skill_name="full-skill")
+        assert "Available resources:" in result
+        assert "run.sh" in result
+
+    def test_manifest_is_a_copy(self, remote: RemoteSkillRegistry):
+        remote.list_resources("full-skill")["references"].append("bogus.md")
+        remote.list_resources("full-skill").clear()
+        assert remote.list_resources("full-skill")["references"] == ["REFERENCE.md"]
+
+    def test_cache_is_bounded(self, server: SkillServer, recorder):
+        with RemoteSkillRegistry(server.url, cache_ttl=60, cache_size=2) as remote:
+            remote.activate_skill("my-skill")
+            remote.read_resource("full-skill", "scripts", "run.sh")
+            remote.activate_skill("my-skill")
+            remote.read_resource("full-skill", "assets", "template.txt")
+            assert remote.activate_skill("my-skill")
+            remote.read_resource("full-skill", "scripts", "run.sh")
+        assert recorder.count("skills.cache.hits", cache="remote") == 2
+        assert recorder.count("skills.cache.misses", cache="remote") == 4
+
+    def test_cache_metrics(self, remote: RemoteSkillRegistry, recorder):
+        remote.activate_skill("my-skill")
+        remote.activate_skill("my-skill")
+        assert recorder.count("skills.cache.misses", cache="remote") == 1
+        assert recorder.count("skills.cache.hits", cache="remote") == 1
+        assert recorder.counts_by("skills.activations", "skill") == {"my-skill": 2}
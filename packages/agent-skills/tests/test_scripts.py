@@ -0,0 +1,178 @@
+"""Tests for pooled skill script execution."""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from agent_skills.registry import FileSystemSkillRegistry
+from agent_skills.scripts import ScriptPool
+
+pytestmark = pytest.mark.skipif(
+    sys.platform == "win32", reason="scripts use POSIX process groups"
+)
+
+
+@pytest.fixture(scope="module")
+def pool():
+    with ScriptPool(size=2) as pool:
+        yield pool
+
+
+@pytest.fixture
+def script_skill(full_skill: Path) -> Path:
+    scripts = full_skill / "scripts"
+    (scripts / "echo.py").write_text(
+        "import os, sys\n"
+        "print(' '.join(sys.argv[1:]), os.path.basename(os.getcwd()))\n"
+        "print('warning', file=sys.stderr)\n"
+        "sys.exit(2)\n"
+    )
+    (scripts / "count.py").write_text(
+        "import pathlib\n"
+        "p = pathlib.Path('runs.txt')\n"
+        "p.write_text(p.read_text() + 'x' if p.exists() else 'x')\n"
+        "print(len(p.read_text()))\n"
+    )
+    (scripts / "sleep.py").write_text("import time\ntime.sleep(30)\n")
+    (scripts / "quiet.py").write_text(
+        "import os, time\nos.close(1)\nos.close(2)\ntime.sleep(30)\n"
+    )
+    (scripts / "quiet.sh").write_text("exec >&- 2>&-\nsleep 30\n")
+    (scripts / "loud.py").write_text("print('y' * 10000)\n")
+    (scripts / "fail.py").write_text("raise RuntimeError('boom')\n")
+    return full_skill
+
+
+class TestScriptPool:
+    def test_runs_python_script(self, pool: ScriptPool, script_skill: Path):
+        result = pool.run(script_skill / "scripts" / "echo.py", ["a", "b"])
+        assert result.exit_code == 2
+        assert result.stdout == "a b scripts\n"
+        assert result.stderr == "warning\n"
+        assert not result.ok
+
+    def test_runs_shell_script(self, pool: ScriptPool, script_skill: Path):
+        result = pool.run(script_skill / "scripts" / "run.sh")
+        assert result.ok
+        assert result.stdout == "hello\n"
+
+    def test_timeout_kills_script(self, pool: ScriptPool, script_skill: Path):
+        result = pool.run(script_skill / "scripts" / "sleep.py", timeout=0.2)
+        assert result.timed_out
+        assert result.exit_code is None
+        assert result.duration < 5
+        # The worker is reusable afterwards.
+        assert pool.run(script_skill / "scripts" / "run.sh").ok
+
+    @pytest.mark.parametrize("script", ["quiet.py", "quiet.sh"])
+    def test_timeout_after_closing_output(
+        self, pool: ScriptPool, script_skill: Path, script: str
+    ):
+        result = pool.run(script_skill / "scripts" / script, timeout=0.3)
+        assert result.timed_out
+        assert result.exit_code is None
+        assert result.duration < 5
+        assert pool.run(script_skill / "scripts" / "run.sh").ok
+
+    def test_output_limit(self, pool: ScriptPool, script_skill: Path):
+        result = pool.run(script_skill / "scripts" / "loud.py", max_output=100)
+        assert result.ok
+        assert result.truncated
+        assert result.stdout == "y" * 100
+
+    def test_exception_exits_nonzero(self, pool: ScriptPool, script_skill: Path):
+        result = pool.run(script_skill / "scripts" / "fail.py")
+        assert result.exit_code == 1
+        assert "RuntimeError: boom" in result.stderr
+
+    def test_unrunnable_script_raises(self, pool: ScriptPool, tmp_path: Path):
+        script = tmp_path / "data.txt"
+        script.write_text("not a program")
+        with pytest.raises(OSError):
+            pool.run(script)
+
+    def test_closed_pool_raises(self, script_skill: Path):
+        pool = ScriptPool(size=1)
+        pool.close()
+        with pytest.raises(RuntimeError):
+            pool.run(script_skill / "scripts" / "run.sh")
+
+    def test_close_wakes_waiting_calls(self, script_skill: Path):
+        pool = ScriptPool(size=1)
+        errors: list[Exception] = []
+
+        def run(script: str, timeout: float) -> None:
+            try:
+                pool.run(script_skill / "scripts" / script, timeout=timeout)
+            except RuntimeError as e:
+                errors.append(e)
+
+        busy = threading.Thread(target=run, args=("sleep.py", 1), daemon=True)
+        busy.start()
+        time.sleep(0.2)
+        waiters = [
+            threading.Thread(target=run, args=("echo.py", 5), daemon=True)
+            for _ in range(2)
+        ]
+        for waiter in waiters:
+            waiter.start()
+        time.sleep(0.2)
+        pool.close()
+        for waiter in waiters:
+            waiter.join(timeout=5)
+            assert not waiter.is_alive()
+        busy.join(timeout=5)
+        assert [str(e) for e in errors] == ["ScriptPool is closed"] * 2
+
+
+class TestRunSkillScript:
+    @pytest.fixture
+    def registry(self, pool: ScriptPool, script_skill: Path):
+        reg = FileSystemSkillRegistry(script_pool=pool)
+        reg.load_skill(script_skill)
+        return reg
+
+    def test_runs_in_skill_directory(self, registry: FileSystemSkillRegistry):
+        result = registry.run_skill_script("full-skill", "echo.py", ["x"])
+        assert result.stdout == "x full-skill\n"
+        assert not result.cached
+
+    def test_memoized_by_script_and_args(
+        self, registry: FileSystemSkillRegistry, script_skill: Path
+    ):
+        first = registry.run_skill_script("full-skill", "count.py", memoize=True)
+        again = registry.run_skill_script("full-skill", "count.py", memoize=True)
+        assert first.stdout == again.stdout == "1\n"
+        assert again.cached
+
+        other = registry.run_skill_script(
+            "full-skill", "count.py", ["arg"], memoize=True
+        )
+        assert other.stdout == "2\n"
+
+        (script_skill / "scripts" / "count.py").write_text("print('changed')\n")
+        changed = registry.run_skill_script("full-skill", "count.py", memoize=True)
+        assert changed.stdout == "changed\n"
+
+    def test_not_memoized_by_default(self, registry: FileSystemSkillRegistry):
+        registry.run_skill_script("full-skill", "count.py")
+        result = registry.run_skill_script("full-skill", "count.py")
+        assert result.stdout == "2\n"
+
+    def test_timeouts_not_memoized(self, registry: FileSystemSkillRegistry):
+        kwargs = {"timeout": 0.1, "memoize": True}
+        registry.run_skill_script("full-skill", "sleep.py", **kwargs)
+        result = registry.run_skill_script("full-skill", "sleep.py", **kwargs)
+        assert result.timed_out
+        assert not result.cached
+
+    def test_errors(self, registry: FileSystemSkillRegistry):
+        with pytest.raises(KeyError):
+            registry.run_skill_script("nope", "echo.py")
+        with pytest.raises(ValueError):
+            registry.run_skill_script("full-skill", "../SKILL.md")
+        with pytest.raises(FileNotFoundError):
+            registry.run_skill_script("full-skill", "missing.py")
@@ -0,0 +1,141 @@
+"""Tests for the full-text resource index and search tool."""
+
+from pathlib import Path
+
+import pytest
+
+from agent_skills.registry import FileSystemSkillRegistry
+from agent_skills.search import ResourceIndex, parse_query
+from agent_skills.tools import SkillTools
+
+CLARIFY = (
+    "# Clarify requirements\n"
+    "\n"
+    "Ask at most five clarification questions.\n"
+    "Record every answer in the Clarifications section of the spec.\n"
+)
+CHECKLIST = "Checklist\n\nEvery requirement is testable.\nNo open questions remain.\n"
+
+
+@pytest.fixture
+def registry(tmp_path: Path, make_skill) -> FileSystemSkillRegistry:
+    make_skill(
+        tmp_path,
+        "requirements",
+        references={"speckit.requirements.clarify.md": CLARIFY},
+    )
+    make_skill(tmp_path, "review", references={"checklist.md": CHECKLIST})
+    (tmp_path / "review" / "assets").mkdir()
+    (tmp_path / "review" / "assets" / "logo.png").write_bytes(b"\x89PNG\xff\xfe")
+    registry = FileSystemSkillRegistry()
+    registry.load_skills_from_directory(tmp_path)
+    return registry
+
+
+class TestResourceIndex:
+    def test_parse_query(self):
+        assert parse_query('Clarify "open questions" speckit.requirements') == [
+            ("clarify",),
+            ("open", "questions"),
+            ("speckit", "requirements"),
+        ]
+
+    def test_ranked_line_hits(self):
+        index = ResourceIndex()
+        index.add_skill("a", {("references", "clarify.md"): CLARIFY})
+        index.add_skill("b", {("references", "checklist.md"): CHECKLIST})
+        hits = index.search("clarification questions")
+        assert [h.file_path for h in hits] == ["clarify.md", "checklist.md"]
+        (match,) = hits[0].matches
+        assert match.line == 3
+        assert match.snippet == "Ask at most five clarification questions."
+        assert CLARIFY[match.start : match.end] == "clarification"
+
+    def test_phrase_needs_adjacent_terms(self):
+        index = ResourceIndex()
+        index.add_skill("a", {("references", "clarify.md"): CLARIFY})
+        assert index.search('"clarification questions"')
+        assert not index.search('"questions clarification"')
+
+    def test_incremental_updates(self):
+        index = ResourceIndex()
+        index.add_skill("a", {("references", "x.md"): "alpha beta"})
+        index.add_skill("b", {("references", "y.md"): "alpha"})
+        index.add_skill("a", {("references", "x.md"): "gamma"})
+        assert [h.skill_name for h in index.search("alpha")] == ["b"]
+        index.remove_skill("b")
+        assert index.search("alpha") == []
+        assert len(index) == 1
+        assert "a" in index and "b" not in index
+
+    def test_skill_filter_and_limit(self):
+        index = ResourceIndex()
+        for name in ("a", "b", "c"):
+            index.add_skill(name, {("references", "f.md"): "shared term"})
+        assert len(index.search("shared", limit=2)) == 2
+        assert [h.skill_name for h in index.search("shared", {"c"})] == ["c"]
+
+    def test_long_line_snippet(self):
+        text = "word " * 100 + "needle " + "word " * 100
+        index = ResourceIndex()
+        index.add_skill("a", {("assets", "long.txt"): text})
+        (match,) = index.search("needle")[0].matches
+        assert "needle" in match.snippet
+        assert len(match.snippet) <= 160
+
+
+class TestRegistrySearch:
+    def test_lazy_index(self, registry: FileSystemSkillRegistry):
+        (hit,) = registry.search_resources("speckit.requirements.clarify")
+        assert hit.key == "requirements/references/speckit.requirements.clarify.md"
+        assert hit.matches == []  # matched the words, not the file name
+        assert registry.search_resources("Clarifications")[0].matches[0].line == 4
+        assert len(registry.resource_index()) == 2  # the binary asset is skipped
+
+    def test_skill_name_filter(self, registry: FileSystemSkillRegistry):
+        assert registry.search_resources("questions", "review")[0].skill_name == (
+            "review"
+        )
+        with pytest.raises(KeyError, match="Skill 'nope' not found"):
+            registry.search_resources("questions", "nope")
+
+    def test_reload_reindexes(self, registry: FileSystemSkillRegistry):
+        registry.search_resources("testable")
+        path = registry.get_skill("review").path / "references" / "checklist.md"
+        path.write_text("Every requirement is measurable.\n")
+        registry.reload_skill("review")
+        assert registry.search_resources("testable") == []
+        assert registry.search_resources("measurable")
+
+    def test_index_at_load_skips_usage(self, tmp_path: Path, make_skill, recorder):
+        make_skill(tmp_path, "requirements", references={"clarify.md": CLARIFY})
+        registry = FileSystemSkillRegistry(index_resources=True)
+        registry.load_skills_from_directory(tmp_path)
+        assert "requirements" in registry.resource_index()
+        registry.search_resources("clarification")
+        assert recorder.durations("skills.index.duration", skill="requirements")
+        assert len(recorder.durations("skills.search.duration")) == 1
+
+    def test_scoped_view(self, registry: FileSystemSkillRegistry):
+        view = registry.scoped(["review"])
+        assert [h.skill_name for h in view.search_resources("questions")] == [
+            "review"
+        ]
+        with pytest.raises(KeyError):
+            view.search_resources("questions", "requirements")
+
+
+class TestSearchTool:
+    def test_search_skill_resources(self, registry: FileSystemSkillRegistry):
+        result = SkillTools(registry).search_skill_resources(query="clarification")
+        assert result == (
+            "## requirements/references/speckit.requirements.clarify.md\n\n"
+            "- line 3: Ask at most five clarification questions."
+        )
+
+    def test_no_match_and_error(self, registry: FileSystemSkillRegistry):
+        tools = SkillTools(registry)
+        assert tools.search_skill_resources(query="zebra").startswith("No skill")
+        assert tools.search_skill_resources(query="x", skill_name="nope").startswith(
+            "Error:"
+        )
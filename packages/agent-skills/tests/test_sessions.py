@@ -0,0 +1,225 @@
+"""Tests for resident skill versions and pinned sessions."""
+
+import gc
+import shutil
+import threading
+from pathlib import Path
+
+import pytest
+
+from agent_skills.registry import FileSystemSkillRegistry
+from agent_skills.versions import skill_version
+
+
+@pytest.fixture
+def write_version(make_skill):
+    """Write version ``version`` of the ``rollout`` skill under ``parent``."""
+
+    def write(parent: Path, version: str, body: str, reference: str) -> Path:
+        return make_skill(
+            parent,
+            "rollout",
+            body,
+            metadata={"version": version},
+            references={"guide.md": reference, "shared.md": "Same in every version."},
+        )
+
+    return write
+
+
+@pytest.fixture
+def registry(tmp_path: Path, write_version) -> FileSystemSkillRegistry:
+    registry = FileSystemSkillRegistry(cache_resources=True)
+    registry.load_skill(write_version(tmp_path / "v1", "1", "Body one.", "Guide one."))
+    return registry
+
+
+@pytest.fixture
+def roll_out(tmp_path: Path, write_version):
+    """Load version 2 of ``rollout`` from a new directory into a registry."""
+
+    def roll_out(registry: FileSystemSkillRegistry) -> None:
+        registry.load_skill_version(
+            write_version(tmp_path / "v2", "2", "Body two.", "Guide two.")
+        )
+
+    return roll_out
+
+
+class TestSkillVersion:
+    def test_declared_version(self, registry: FileSystemSkillRegistry):
+        assert skill_version(registry.get_skill("rollout")) == "1"
+
+    def test_content_digest(self, minimal_skill: Path):
+        registry = FileSystemSkillRegistry()
+        version = skill_version(registry.load_skill(minimal_skill))
+        assert version.startswith("sha256:")
+        (minimal_skill / "SKILL.md").write_text(
+            "---\nname: my-skill\ndescription: Changed.\n---\nNew body.\n"
+        )
+        assert skill_version(registry.reload_skill("my-skill")) != version
+
+
+class TestSessions:
+    def test_pinned_session_keeps_old_version(
+        self, registry: FileSystemSkillRegistry, roll_out
+    ):
+        session = registry.session()
+        session.read_resource("rollout", "references", "guide.md")
+        roll_out(registry)
+
+        assert registry.activate_skill("rollout") == "Body two."
+        assert session.activate_skill("rollout") == "Body one."
+        assert session.get_skill("rollout").instructions == "Body one."
+        assert session.version("rollout") == "1"
+        assert session.read_resource("rollout", "references", "guide.md") == (
+            "Guide one."
+        )
+        assert registry.resident_versions("rollout") == ["1", "2"]
+
+        with registry.session() as new_session:
+            assert new_session.activate_skill("rollout") == "Body two."
+            assert new_session.version("rollout") == "2"
+
+    def test_old_version_collected_after_last_session(
+        self, registry: FileSystemSkillRegistry, recorder, roll_out
+    ):
+        first, second = registry.session(), registry.session()
+        roll_out(registry)
+        first.close()
+        assert registry.resident_versions("rollout") == ["1", "2"]
+        second.close()
+        assert registry.resident_versions("rollout") == ["2"]
+        assert recorder.count("skills.versions.retained") == 1
+        assert recorder.count("skills.versions.collected") == 1
+        assert second.activate_skill("rollout") == "Body two."
+
+    def test_unclosed_session_released_on_collection(
+        self, registry: FileSystemSkillRegistry, roll_out
+    ):
+        session = registry.session()
+        roll_out(registry)
+        del session
+        gc.collect()
+        assert registry.resident_versions("rollout") == ["2"]
+
+    def test_not_retained_without_sessions(
+        self, registry: FileSystemSkillRegistry, roll_out
+    ):
+        roll_out(registry)
+        assert registry.resident_versions("rollout") == ["2"]
+
+    def test_versions_share_unchanged_resources(
+        self, registry: FileSystemSkillRegistry, roll_out
+    ):
+        session = registry.session()
+        shared = session.read_resource("rollout", "references", "shared.md")
+        roll_out(registry)
+        blobs = len(registry.blobs)
+        assert registry.read_resource("rollout", "references", "shared.md") is shared
+        assert len(registry.blobs) == blobs
+
+    @pytest.mark.parametrize("cache_resources", [False, True])
+    def test_resources_copied_when_replaced(
+        self, tmp_path: Path, cache_resources: bool, roll_out, write_version
+    ):
+        registry = FileSystemSkillRegistry(cache_resources=cache_resources)
+        old_dir = write_version(tmp_path / "v1", "1", "Body one.", "Guide one.")
+        registry.load_skill(old_dir)
+        with registry.session() as session:
+            roll_out(registry)
+            shutil.rmtree(old_dir)
+            assert session.read_resource("rollout", "references", "guide.md") == (
+                "Guide one."
+            )
+            assert session.read_resource("rollout", "references", "shared.md") == (
+                "Same in every version."
+            )
+            with pytest.raises(FileNotFoundError):
+                session.read_resource("rollout", "references", "missing.md")
+            assert registry.read_resource("rollout", "references", "guide.md") == (
+                "Guide two."
+            )
+        # The copies are released with the version; only cached v2 reads remain.
+        assert len(registry.blobs) == (1 if cache_resources else 0)
+
+    def test_resources_copied_without_version_lock(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, roll_out, write_version
+    ):
+        from agent_skills import registry as registry_module
+
+        registry = FileSystemSkillRegistry()
+        registry.load_skill(write_version(tmp_path / "v1", "1", "Body one.", "G."))
+        read = registry_module._read_resource_file
+        session = registry.session()
+        other_sessions = []
+
+        def read_unlocked(*args):
+            # Starting a session needs the lock; it must not wait for the copy.
+            starter = threading.Thread(
+                target=lambda: other_sessions.append(registry.session()), daemon=True
+            )
+            starter.start()
+            starter.join(timeout=2)
+            return read(*args)
+
+        monkeypatch.setattr(registry_module, "_read_resource_file", read_unlocked)
+        roll_out(registry)
+        monkeypatch.undo()
+        assert len(other_sessions) == 2
+        assert session.read_resource("rollout", "references", "guide.md") == "G."
+        for pinned in [session, *other_sessions]:
+            pinned.close()
+        assert registry.resident_versions("rollout") == ["2"]
+        assert len(registry.blobs) == 0
+
+    def test_sessions_ended_while_copying(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, roll_out, write_version
+    ):
+        from agent_skills import registry as registry_module
+
+        registry = FileSystemSkillRegistry()
+        registry.load_skill(write_version(tmp_path / "v1", "1", "Body one.", "G."))
+        read = registry_module._read_resource_file
+        session = registry.session()
+
+        def read_and_close(*args):
+            closer = threading.Thread(target=session.close, daemon=True)
+            closer.start()
+            closer.join(timeout=2)
+            return read(*args)
+
+        monkeypatch.setattr(registry_module, "_read_resource_file", read_and_close)
+        roll_out(registry)
+        assert registry.resident_versions("rollout") == ["2"]
+        assert len(registry.blobs) == 0
+
+    def test_reload_in_place_moves_sessions(self, tmp_path: Path, write_version):
+        registry = FileSystemSkillRegistry(compresslevel=6)
+        skill_dir = write_version(tmp_path, "1", "Body one.", "Guide one.")
+        registry.load_skill(skill_dir)
+        with registry.session() as session:
+            write_version(tmp_path, "2", "Body two.", "Guide two.")
+            registry.reload_skill("rollout")
+            # The old files are gone, so the session must not mix versions.
+            assert session.version("rollout") == "2"
+            assert session.activate_skill("rollout") == "Body two."
+            assert session.read_resource("rollout", "references", "guide.md") == (
+                "Guide two."
+            )
+            assert registry.resident_versions("rollout") == ["2"]
+        assert len(registry.bodies) == 1
+
+    def test_same_version_rejected(
+        self, registry: FileSystemSkillRegistry, tmp_path: Path, write_version
+    ):
+        with pytest.raises(ValueError, match="Version '1' of skill 'rollout'"):
+            registry.load_skill_version(
+                write_version(tmp_path / "copy", "1", "B.", "G.")
+            )
+
+    def test_session_tools(self, registry: FileSystemSkillRegistry, roll_out):
+        with registry.session() as session:
+            list_skills, activate_skill, *_ = session.get_tools()
+            roll_out(registry)
+            assert activate_skill(skill_name="rollout").startswith("Body one.")
@@ -0,0 +1,154 @@
+"""Tests for shared skill catalogs."""
+
+import shutil
+from pathlib import Path
+
+import pytest
+
+from agent_skills.registry import FileSystemSkillRegistry, SkillRegistry
+from agent_skills.shared import (
+    SharedSkillRegistry,
+    encode_catalog,
+    publish_catalog,
+    write_catalog,
+)
+
+
+@pytest.fixture
+def loaded_registry(skills_parent: Path) -> FileSystemSkillRegistry:
+    reg = FileSystemSkillRegistry()
+    reg.load_skills_from_directory(skills_parent)
+    return reg
+
+
+class TestSharedSkillRegistry:
+    def test_open_catalog_file(self, loaded_registry, tmp_path: Path):
+        path = write_catalog(loaded_registry, tmp_path / "skills.catalog")
+        with SharedSkillRegistry.open(path) as reg:
+            assert isinstance(reg, SkillRegistry)
+            assert len(reg) == 2
+            assert "full-skill" in reg
+            assert sorted(reg.skill_names) == ["full-skill", "my-skill"]
+            assert {m.name for m in reg.list_skills()} == {"full-skill", "my-skill"}
+
+    def test_attach_shared_memory(self, loaded_registry):
+        segment = publish_catalog(loaded_registry)
+        try:
+            with SharedSkillRegistry.attach(segment.name) as reg:
+                assert "Do the thing step by step." in reg.activate_skill("my-skill")
+                assert reg.get_skill("my-skill").activated is True
+        finally:
+            segment.close()
+            segment.unlink()
+
+    def test_skill_matches_loader(self, loaded_registry, tmp_path: Path):
+        path = write_catalog(loaded_registry, tmp_path / "skills.catalog")
+        with SharedSkillRegistry.open(path) as reg:
+            shared = reg.get_skill("full-skill")
+            original = loaded_registry.get_skill("full-skill")
+            assert shared.metadata == original.metadata
+            assert shared.instructions == original.instructions
+            assert shared.resources.scripts_dir == original.resources.scripts_dir
+            assert shared.path == original.path
+            assert reg.get_skill("full-skill") is shared
+
+    def test_manifest_and_resources(self, loaded_registry, tmp_path: Path):
+        path = write_catalog(loaded_registry, tmp_path / "skills.catalog")
+        with SharedSkillRegistry.open(path) as reg:
+            assert reg.list_resources("full-skill") == {
+                "scripts": ["run.sh"],
+                "references": ["REFERENCE.md"],
+                "assets": ["template.txt"],
+            }
+            assert reg.list_resources("my-skill") == {}
+            assert "echo hello" in reg.read_resource("full-skill", "scripts", "run.sh")
+
+    def test_missing_skill(self, loaded_registry, tmp_path: Path):
+        path = write_catalog(loaded_registry, tmp_path / "skills.catalog")
+        with SharedSkillRegistry.open(path) as reg:
+            assert reg.get_skill("nope") is None
+            with pytest.raises(KeyError, match="not found"):
+                reg.activate_skill("nope")
+            with pytest.raises(KeyError):
+                reg.list_resources("nope")
+
+    def test_rejects_non_catalog(self, tmp_path: Path):
+        path = tmp_path / "bogus"
+        path.write_bytes(b"\0" * 64)
+        with pytest.raises(ValueError, match="Not a skill catalog"):
+            SharedSkillRegistry.open(path)
+
+    def test_non_ascii_bodies(self, tmp_path: Path):
+        skill_dir = tmp_path / "unicode-skill"
+        skill_dir.mkdir()
+        (skill_dir / "SKILL.md").write_text(
+            "---\nname: unicode-skill\ndescription: Ünïcödé.\n---\n日本語の説明\n",
+            encoding="utf-8",
+        )
+        reg = FileSystemSkillRegistry()
+        reg.load_skill(skill_dir)
+        data = encode_catalog(reg)
+        path = tmp_path / "skills.catalog"
+        path.write_bytes(data)
+        with SharedSkillRegistry.open(path) as shared:
+            assert shared.activate_skill("unicode-skill") == "日本語の説明"
+
+    def test_embedded_resources_stored_once(self, full_skill: Path, tmp_path: Path):
+        twin = tmp_path / "twin-skill"
+        shutil.copytree(full_skill, twin)
+        skill_md = twin / "SKILL.md"
+        skill_md.write_text(
+            skill_md.read_text().replace("name: full-skill", "name: twin-skill")
+        )
+        reg = FileSystemSkillRegistry()
+        reg.load_skill(full_skill)
+        reg.load_skill(twin)
+
+        assert b"Details here." not in encode_catalog(reg)
+        embedded = encode_catalog(reg, include_resources=True)
+        # Both skills ship identical files and bodies; each is embedded once.
+        assert embedded.count(b"Details here.") == 1
+        assert embedded.count(b"These are detailed instructions.") == 1
+
+        path = tmp_path / "skills.catalog"
+        path.write_bytes(embedded)
+        (twin / "references" / "REFERENCE.md").unlink()
+        with SharedSkillRegistry.open(path) as shared:
+            assert shared.read_resource("twin-skill", "references", "REFERENCE.md") == (
+                "# Reference\n\nDetails here.\n"
+            )
+            assert shared.resource_digests("twin-skill") == reg.resource_digests(
+                "full-skill"
+            )
+            with pytest.raises(FileNotFoundError):
+                shared.read_resource("twin-skill", "references", "missing.md")
+
+    def test_vanished_resource_skipped(self, full_skill: Path, tmp_path: Path):
+        reg = FileSystemSkillRegistry(cache_resources=True)
+        reg.load_skill(full_skill)
+        assert "run.sh" in reg.list_resources("full-skill")["scripts"]
+        (full_skill / "scripts" / "run.sh").unlink()
+        path = tmp_path / "skills.catalog"
+        path.write_bytes(encode_catalog(reg, include_resources=True))
+        with SharedSkillRegistry.open(path) as shared:
+            assert shared.read_resource("full-skill", "assets", "template.txt") == (
+                "Template content.\n"
+            )
+            with pytest.raises(FileNotFoundError):
+                shared.read_resource("full-skill", "scripts", "run.sh")
+
+    def test_binary_asset_not_embedded(self, full_skill: Path, tmp_path: Path):
+        (full_skill / "assets" / "x.bin").write_bytes(b"\x89\xff\xfe")
+        reg = FileSystemSkillRegistry()
+        reg.load_skill(full_skill)
+        path = tmp_path / "skills.catalog"
+        path.write_bytes(encode_catalog(reg, include_resources=True))
+        with SharedSkillRegistry.open(path) as shared:
+            assert shared.read_resource("full-skill", "assets", "template.txt") == (
+                "Template content.\n"
+            )
+            assert shared.resource_digests("full-skill") == reg.resource_digests(
+                "full-skill"
+            )
+            with pytest.raises(ValueError, match="not UTF-8 text"):
+                shared.read_resource("full-skill", "assets", "x.bin")
@@ -2,8 +2,9 @@
 
 from pathlib import Path
 
+from agent_skills.ledger import ContextLedger
 from agent_skills.registry import FileSystemSkillRegistry, SkillRegistry
-from agent_skills.tools import create_skill_tools
+from agent_skills.tools import SkillTools, create_skill_tools
 
 
 class TestSkillTools:
@@ -12,12 +13,19 @@ class TestSkillTools:
         tools = create_skill_tools(registry)
         return {t.tool_name: t._tool_func for t in tools}
 
-    def test_creates_three_tools(self):
+    def test_creates_tools(self):
         reg = FileSystemSkillRegistry()
         tools = create_skill_tools(reg)
-        assert len(tools) == 3
+        assert len(tools) == 6
         names = {t.tool_name for t in tools}
-        assert names == {"list_skills", "activate_skill", "read_skill_resource"}
+        assert names == {
+            "list_skills",
+            "activate_skill",
+            "read_skill_resource",
+            "activate_skills",
+            "read_skill_resources",
+            "search_skill_resources",
+        }
 
     def test_list_skills_empty(self):
         reg = FileSystemSkillRegistry()
@@ -74,3 +82,145 @@ class TestSkillTools:
             file_path="run.sh",
         )
         assert "Error" in result
+
+    def test_activate_skills(self, skills_parent: Path):
+        reg = FileSystemSkillRegistry()
+        reg.load_skills_from_directory(skills_parent)
+        funcs = self._get_tool_funcs(reg)
+        result = funcs["activate_skills"](skill_names=["my-skill", "full-skill", "nope"])
+        assert "## my-skill" in result
+        assert "Do the thing step by step." in result
+        assert "## full-skill" in result
+        assert "Available resources:" in result
+        assert "## nope\n\nError:" in result
+        assert reg.get_skill("full-skill").activated is True
+
+    def test_read_skill_resources(self, full_skill: Path):
+        reg = FileSystemSkillRegistry()
+        reg.load_skill(full_skill)
+        funcs = self._get_tool_funcs(reg)
+        result = funcs["read_skill_resources"](
+            resources=[
+                {"skill_name": "full-skill", "resource_type": "scripts", "file_path": "run.sh"},
+                {"skill_name": "full-skill", "resource_type": "assets", "file_path": "template.txt"},
+                {"skill_name": "full-skill", "resource_type": "assets", "file_path": "nope.txt"},
+                {"skill_name": "full-skill"},
+            ]
+        )
+        assert "## full-skill/scripts/run.sh\n\n#!/bin/bash" in result
+        assert "Template content." in result
+        assert "## full-skill/assets/nope.txt\n\nError:" in result
+        assert result.count("Error:") == 2
+
+
+class TestRunSkillScriptTool:
+    def test_opt_in(self):
+        reg = FileSystemSkillRegistry()
+        assert "run_skill_script" not in {
+            t.tool_name for t in create_skill_tools(reg)
+        }
+        tools = create_skill_tools(reg, run_scripts=True)
+        assert tools[-1].tool_name == "run_skill_script"
+
+    def test_runs_script(self, full_skill: Path):
+        reg = FileSystemSkillRegistry()
+        reg.load_skill(full_skill)
+        tools = {t.tool_name: t._tool_func for t in reg.get_tools(run_scripts=True)}
+        result = tools["run_skill_script"](skill_name="full-skill", file_path="run.sh")
+        assert result.startswith("Exit code: 0")
+        assert "hello" in result
+        error = tools["run_skill_script"](skill_name="nope", file_path="run.sh")
+        assert error.startswith("Error:")
+
+
+class TestContextDeduplication:
+    def _funcs(self, full_skill: Path, ledger: ContextLedger | None) -> dict:
+        reg = FileSystemSkillRegistry()
+        reg.load_skill(full_skill)
+        return {t.tool_name: t._tool_func for t in reg.get_tools(ledger=ledger)}
+
+    def test_repeat_activation_is_a_reference(self, full_skill: Path):
+        funcs = self._funcs(full_skill, ContextLedger())
+        first = funcs["activate_skill"](skill_name="full-skill")
+        assert "detailed instructions" in first
+        again = funcs["activate_skill"](skill_name="full-skill")
+        assert "already provided" in again
+        assert "detailed instructions" not in again
+        batch = funcs["activate_skills"](skill_names=["full-skill"])
+        assert "already provided" in batch
+
+    def test_refresh_resends(self, full_skill: Path):
+        funcs = self._funcs(full_skill, ContextLedger())
+        funcs["activate_skill"](skill_name="full-skill")
+        again = funcs["activate_skill"](skill_name="full-skill", refresh=True)
+        assert "detailed instructions" in again
+
+    def test_changed_resource_is_resent(self, full_skill: Path):
+        funcs = self._funcs(full_skill, ContextLedger())
+        read = funcs["read_skill_resource"]
+        args = {
+            "skill_name": "full-skill",
+            "resource_type": "assets",
+            "file_path": "template.txt",
+        }
+        assert read(**args) == "Template content.\n"
+        assert "already provided" in read(**args)
+        (full_skill / "assets" / "template.txt").write_text("New content.\n")
+        assert read(**args) == "New content.\n"
+
+    def test_batch_reads_share_the_ledger(self, full_skill: Path):
+        funcs = self._funcs(full_skill, ContextLedger())
+        funcs["read_skill_resource"](
+            skill_name="full-skill", resource_type="assets", file_path="template.txt"
+        )
+        result = funcs["read_skill_resources"](
+            resources=[
+                {
+                    "skill_name": "full-skill",
+                    "resource_type": "assets",
+                    "file_path": "template.txt",
+                },
+                {
+                    "skill_name": "full-skill",
+                    "resource_type": "references",
+                    "file_path": "REFERENCE.md",
+                },
+            ]
+        )
+        assert "Resource full-skill/assets/template.txt was already provided" in result
+        assert "Details here." in result
+
+    def test_no_ledger_always_resends(self, full_skill: Path):
+        funcs = self._funcs(full_skill, None)
+        funcs["activate_skill"](skill_name="full-skill")
+        assert "detailed instructions" in funcs["activate_skill"](
+            skill_name="full-skill"
+        )
+
+
+class TestSkillToolsBinding:
+    def test_specs_are_built_once(self, minimal_skill: Path):
+        first = FileSystemSkillRegistry()
+        second = FileSystemSkillRegistry()
+        second.load_skill(minimal_skill)
+        a = {t.tool_name: t for t in first.get_tools()}
+        b = {t.tool_name: t for t in second.get_tools()}
+        for name in SkillTools.TOOL_NAMES:
+            assert a[name].tool_spec is b[name].tool_spec
+            assert a[name].tool_spec is getattr(SkillTools, name).tool_spec
+
+    def test_bound_per_instance(self, minimal_skill: Path):
+        empty = FileSystemSkillRegistry()
+        loaded = FileSystemSkillRegistry()
+        loaded.load_skill(minimal_skill)
+        assert "No skills" in SkillTools(empty).list_skills()
+        assert "my-skill" in SkillTools(loaded).list_skills()
+
+    def test_session_options(self, minimal_skill: Path):
+        reg = FileSystemSkillRegistry()
+        reg.load_skill(minimal_skill)
+        session = SkillTools(reg, ledger=ContextLedger())
+        session.activate_skill(skill_name="my-skill")
+        assert "already provided" in session.activate_skill(skill_name="my-skill")
+        other = SkillTools(reg, ledger=ContextLedger())
+        assert "step by step" in other.activate_skill(skill_name="my-skill")
@@ -0,0 +1,102 @@
+"""Tests for usage profiles, resource caching and warm-up."""
+
+from concurrent.futures import wait
+from pathlib import Path
+
+from agent_skills.registry import FileSystemSkillRegistry
+from agent_skills.usage import UsageProfile
+
+
+class TestUsageProfile:
+    def test_top_skills(self):
+        profile = UsageProfile()
+        for name in ["a", "b", "b", "c", "c", "c"]:
+            profile.record_activation(name)
+        assert profile.top_skills(2) == ["c", "b"]
+
+    def test_follow_up_resources(self):
+        profile = UsageProfile()
+        for _ in range(4):
+            profile.record_activation("a")
+            profile.record_resource_read("a", "references", "usual.md")
+        profile.record_resource_read("a", "assets", "rare.txt")
+        assert profile.follow_up_resources("a") == [("references", "usual.md")]
+        assert len(profile.follow_up_resources("a", min_ratio=0)) == 2
+        assert profile.follow_up_resources("unknown") == []
+
+    def test_save_and_load(self, tmp_path: Path):
+        profile = UsageProfile()
+        profile.record_activation("a")
+        profile.record_resource_read("a", "references", "dir/file.md")
+        profile.save(tmp_path / "usage.json")
+        loaded = UsageProfile.load(tmp_path / "usage.json")
+        assert loaded.activations == profile.activations
+        assert loaded.resource_reads == profile.resource_reads
+
+    def test_load_missing_file(self, tmp_path: Path):
+        assert UsageProfile.load(tmp_path / "missing.json").top_skills(5) == []
+
+
+class TestRegistryUsage:
+    def test_records_usage(self, full_skill: Path):
+        profile = UsageProfile()
+        reg = FileSystemSkillRegistry(usage=profile)
+        reg.load_skill(full_skill)
+        reg.activate_skill("full-skill")
+        reg.read_resource("full-skill", "scripts", "run.sh")
+        assert profile.activations["full-skill"] == 1
+        assert profile.follow_up_resources("full-skill") == [("scripts", "run.sh")]
+
+    def test_resource_cache(self, full_skill: Path, recorder):
+        reg = FileSystemSkillRegistry(cache_resources=True)
+        reg.load_skill(full_skill)
+        assert "echo hello" in reg.read_resource("full-skill", "scripts", "run.sh")
+        (full_skill / "scripts" / "run.sh").write_text("echo changed\n")
+        assert "echo hello" in reg.read_resource("full-skill", "scripts", "run.sh")
+        assert recorder.count("skills.cache.misses", cache="resources") == 1
+        assert recorder.count("skills.cache.hits", cache="resources") == 1
+
+        reg.reload_skill("full-skill")
+        assert reg.read_resource("full-skill", "scripts", "run.sh") == "echo changed\n"
+
+    def test_warm_up(self, full_skill: Path, minimal_skill: Path):
+        profile = UsageProfile()
+        profile.record_activation("full-skill")
+        profile.record_resource_read("full-skill", "references", "REFERENCE.md")
+        profile.record_resource_read("full-skill", "assets", "gone.txt")
+        profile.record_activation("not-loaded")
+
+        reg = FileSystemSkillRegistry(cache_resources=True, usage=profile)
+        reg.load_skill(full_skill)
+        reg.load_skill(minimal_skill)
+        futures = reg.warm_up(top_n=5)
+        wait(futures)
+        reg.close()
+        assert all(f.exception() is None for f in futures)
+
+        (full_skill / "references" / "REFERENCE.md").unlink()
+        assert reg.read_resource("full-skill", "references", "REFERENCE.md").startswith(
+            "# Reference"
+        )
+
+    def test_prefetch_on_activate(self, full_skill: Path):
+        profile = UsageProfile()
+        profile.record_activation("full-skill")
+        profile.record_resource_read("full-skill", "assets", "template.txt")
+
+        reg = FileSystemSkillRegistry(
+            cache_resources=True, usage=profile, prefetch_on_activate=True
+        )
+        reg.load_skill(full_skill)
+        reg.activate_skill("full-skill")
+        reg.close()
+
+        (full_skill / "assets" / "template.txt").unlink()
+        assert reg.read_resource("full-skill", "assets", "template.txt") == (
+            "Template content.\n"
+        )
+
+    def test_warm_up_without_profile(self, minimal_skill: Path):
+        reg = FileSystemSkillRegistry()
+        reg.load_skill(minimal_skill)
+        assert reg.warm_up() == []
@@ -0,0 +1,92 @@
+"""Tests for scoped registry views."""
+
+from pathlib import Path
+
+import pytest
+
+from agent_skills.registry import FileSystemSkillRegistry
+from agent_skills.views import ScopedSkillRegistry
+
+
+@pytest.fixture
+def registry(skills_parent: Path) -> FileSystemSkillRegistry:
+    reg = FileSystemSkillRegistry()
+    reg.load_skills_from_directory(skills_parent)
+    return reg
+
+
+@pytest.fixture
+def view(registry: FileSystemSkillRegistry) -> ScopedSkillRegistry:
+    return registry.scoped(["full-skill", "not-loaded"])
+
+
+class TestScopedSkillRegistry:
+    def test_exposes_only_allowed_skills(self, view: ScopedSkillRegistry):
+        assert view.skill_names == ["full-skill"]
+        assert [m.name for m in view.list_skills()] == ["full-skill"]
+        assert len(view) == 1
+        assert "full-skill" in view
+        assert "my-skill" not in view
+        assert "not-loaded" not in view
+        assert view.get_skill("my-skill") is None
+
+    def test_shares_skills_without_copying(
+        self, registry: FileSystemSkillRegistry, view: ScopedSkillRegistry
+    ):
+        assert view.get_skill("full-skill") is registry.get_skill("full-skill")
+        view.activate_skill("full-skill")
+        assert registry.get_skill("full-skill").activated
+
+    def test_out_of_scope_raises_key_error(self, view: ScopedSkillRegistry):
+        with pytest.raises(KeyError, match="my-skill"):
+            view.activate_skill("my-skill")
+        with pytest.raises(KeyError):
+            view.read_resource("my-skill", "references", "REFERENCE.md")
+        with pytest.raises(KeyError):
+            view.list_resources("my-skill")
+        with pytest.raises(KeyError):
+            view.run_skill_script("my-skill", "run.sh")
+
+    def test_reads_allowed_resources(self, view: ScopedSkillRegistry):
+        content = view.read_resource("full-skill", "references", "REFERENCE.md")
+        assert "Details here." in content
+        assert view.list_resources("full-skill")["assets"] == ["template.txt"]
+
+    def test_batches_mix_allowed_and_denied(self, view: ScopedSkillRegistry):
+        results = view.activate_skills(["my-skill", "full-skill"])
+        assert [r.key for r in results] == ["my-skill", "full-skill"]
+        assert "not found" in results[0].error
+        assert results[1].ok
+
+        reads = view.read_resources(
+            [
+                ("full-skill", "assets", "template.txt"),
+                ("my-skill", "assets", "template.txt"),
+            ]
+        )
+        assert reads[0].content == "Template content.\n"
+        assert reads[1].key == "my-skill/assets/template.txt"
+        assert not reads[1].ok
+
+    def test_prompt_and_tools_are_scoped(self, view: ScopedSkillRegistry):
+        assert "my-skill" not in view.to_system_prompt("Custom")
+        assert "full-skill" in view.to_system_prompt("Custom")
+        tools = {t.tool_name: t._tool_func for t in view.get_tools()}
+        assert "my-skill" not in tools["list_skills"]()
+        assert tools["activate_skill"](skill_name="my-skill").startswith("Error:")
+
+    def test_narrowing_never_widens(self, view: ScopedSkillRegistry):
+        narrower = view.scoped(["full-skill", "my-skill"])
+        assert narrower.skill_names == ["full-skill"]
+
+    def test_change_listeners_are_filtered(
+        self, registry: FileSystemSkillRegistry, view: ScopedSkillRegistry
+    ):
+        changed = []
+        view.add_change_listener(changed.append)
+        registry.reload_skill("my-skill")
+        registry.reload_skill("full-skill")
+        assert changed == ["full-skill"]
+        view.remove_change_listener(changed.append)
+        registry.reload_skill("full-skill")
+        assert changed == ["full-skill"]
@@ -1,3 +1,9 @@
 from .repository import PersonaRepository
+from .storage import JsonPersonaStore, PersonaStore, SqlitePersonaStore
 
-__all__ = ["PersonaRepository"]
+__all__ = [
+    "JsonPersonaStore",
+    "PersonaRepository",
+    "PersonaStore",
+    "SqlitePersonaStore",
+]
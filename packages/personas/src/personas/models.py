@@ -25,3 +25,7 @@ class Persona(BaseModel):
     extra_tools: List[Any] = Field(
         default=[], description="Any extra tools outside of what the skills possess."
     )
+    prompt_cache_boundaries: List[int] = Field(
+        default=[],
+        description="Offsets in sys_prompt where cacheable prefixes end, if known.",
+    )
@@ -1,26 +1,148 @@
-from pathlib import Path
-from typing import Optional
+import threading
+from types import MappingProxyType
+from typing import Dict, FrozenSet, Iterable, List, Mapping, Optional
 
-from agent_skills import SkillRegistry, render_system_prompt
+from agent_skills import (
+    ScopedSkillRegistry,
+    SkillRegistry,
+    render_cacheable_prompt,
+    render_system_prompt,
+)
 
-from personas.models import Persona, PersonaRecords
+from personas.models import Persona, PersonaRecord
+from personas.storage import JsonPersonaStore, PersonaStore
 
 
 class PersonaRepository:
-    def __init__(self, skill_registry: SkillRegistry, data_dir: str = "data"):
-        self.skill_registry = skill_registry
-        self.data_dir = Path(data_dir)
-        self._load_records()
+    """Renders personas from a store and caches them until they change.
+
+    Saves, deletes and skill changes through this repository invalidate the
+    cache. Records written by another store handle or process are picked up
+    the first time a persona is read, but later writes from outside are not
+    seen while the rendered persona stays cached.
 
-    def _load_records(self):
-        with open(self.data_dir / "personas.json", "r") as json_file:
-            json_data = json_file.read()
-            self.records = PersonaRecords.model_validate_json(json_data)
+    The repository listens for changes on its skill registry; call ``close``
+    to stop listening when the repository is no longer used.
+    """
+
+    def __init__(
+        self,
+        skill_registry: SkillRegistry,
+        data_dir: str = "data",
+        store: Optional[PersonaStore] = None,
+        cacheable_prompts: bool = False,
+    ):
+        self.skill_registry = skill_registry
+        self.cacheable_prompts = cacheable_prompts
+        self.store = store if store is not None else JsonPersonaStore(data_dir)
+        self._lock = threading.RLock()
+        self._personas: Dict[str, Persona] = {}
+        self._persona_skills: Dict[str, FrozenSet[str]] = {}
+        self._skill_index: Dict[str, FrozenSet[str]] = {}
+        # Bumped by every write and invalidation, so a render that raced one
+        # is not cached.
+        self._generation = 0
+        for record in self.store.all_records().values():
+            self._index_record(record)
+        self.skill_registry.add_change_listener(self.invalidate_skill)
 
     def get_persona(self, name: str) -> Optional[Persona]:
-        if (record := self.records.root.get(name)) is None:
+        with self._lock:
+            if (persona := self._personas.get(name)) is not None:
+                return persona
+            generation = self._generation
+
+        if (record := self.store.get(name)) is None:
             return None
 
+        persona = self._render(record)
+        with self._lock:
+            if self._generation == generation:
+                # The record may have been written by another store handle or
+                # process since startup; index it so skill changes reach it.
+                self._index_record(record)
+                self._personas[name] = persona
+        return persona
+
+    def get_registry(self, name: str) -> Optional[ScopedSkillRegistry]:
+        """Read-only view of the skill registry limited to a persona's skills.
+
+        Use it for the persona's agent tools (``view.get_tools()``). The view
+        shares the persona's skill-name set and the registry's skills, so it
+        costs no parsing or copying; it keeps the scope it was created with.
+        """
+        with self._lock:
+            skill_names = self._persona_skills.get(name)
+            generation = self._generation
+        if skill_names is None:
+            if (record := self.store.get(name)) is None:
+                return None
+            with self._lock:
+                if self._generation == generation:
+                    self._index_record(record)
+                    skill_names = self._persona_skills[name]
+                else:
+                    skill_names = frozenset(record.skill_names)
+        return ScopedSkillRegistry(self.skill_registry, skill_names)
+
+    def list_personas(self) -> List[str]:
+        return self.store.list_names()
+
+    def save_persona(self, record: PersonaRecord) -> None:
+        self.save_personas([record])
+
+    def save_personas(self, records: Iterable[PersonaRecord]) -> None:
+        records = list(records)
+        self.store.upsert_many(records)
+        with self._lock:
+            self._generation += 1
+            for record in records:
+                self._personas.pop(record.name, None)
+                self._index_record(record)
+
+    def delete_persona(self, name: str) -> bool:
+        deleted = self.store.delete(name)
+        with self._lock:
+            self._generation += 1
+            self._personas.pop(name, None)
+            self._unindex_persona(name)
+        return deleted
+
+    def close(self) -> None:
+        """Stop listening for skill changes. Safe to call more than once."""
+        try:
+            self.skill_registry.remove_change_listener(self.invalidate_skill)
+        except ValueError:
+            pass
+
+    @property
+    def skill_index(self) -> Mapping[str, FrozenSet[str]]:
+        """Read-only reverse index from skill name to the personas using it."""
+        return MappingProxyType(self._skill_index)
+
+    def personas_using_skill(self, skill_name: str) -> List[str]:
+        return sorted(self._skill_index.get(skill_name, frozenset()))
+
+    def invalidate_skill(self, skill_name: str, rerender: bool = False) -> List[str]:
+        """Drop cached personas that reference a skill.
+
+        Registered as a change listener on the skill registry, so edits to a
+        skill only invalidate the personas that actually use it. With
+        ``rerender`` the affected personas are rendered again immediately.
+
+        Returns the names of the affected personas.
+        """
+        affected = self.personas_using_skill(skill_name)
+        with self._lock:
+            self._generation += 1
+            for name in affected:
+                self._personas.pop(name, None)
+        if rerender:
+            for name in affected:
+                self.get_persona(name)
+        return affected
+
+    def _render(self, record: PersonaRecord) -> Persona:
         skills = []
         for skill_name in record.skill_names:
             skill = self.skill_registry.get_skill(skill_name)
@@ -29,5 +151,29 @@ class PersonaRepository:
             skills.append(skill)
 
         skill_metadata = [s.metadata for s in skills]
+        if self.cacheable_prompts:
+            prompt = render_cacheable_prompt(record.sys_prompt, skill_metadata)
+            return Persona(
+                name=record.name,
+                sys_prompt=prompt.text,
+                skills=skills,
+                prompt_cache_boundaries=list(prompt.cache_boundaries),
+            )
         sys_prompt = render_system_prompt(record.sys_prompt, skill_metadata)
-        return Persona(name=name, sys_prompt=sys_prompt, skills=skills)
+        return Persona(name=record.name, sys_prompt=sys_prompt, skills=skills)
+
+    def _index_record(self, record: PersonaRecord) -> None:
+        self._unindex_persona(record.name)
+        skill_names = frozenset(record.skill_names)
+        self._persona_skills[record.name] = skill_names
+        for skill_name in skill_names:
+            users = self._skill_index.get(skill_name, frozenset())
+            self._skill_index[skill_name] = users | {record.name}
+
+    def _unindex_persona(self, name: str) -> None:
+        for skill_name in self._persona_skills.pop(name, frozenset()):
+            users = self._skill_index[skill_name] - {name}
+            if users:
+                self._skill_index[skill_name] = users
+            else:
+                del self._skill_index[skill_name]
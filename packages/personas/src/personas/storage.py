@@ -0,0 +1,229 @@
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from personas.models import PersonaRecord, PersonaRecords
+
+
+class PersonaStore(ABC):
+    """Storage backend interface for persona records."""
+
+    @abstractmethod
+    def get(self, name: str) -> Optional[PersonaRecord]:
+        """Return the record for a persona, or None if it does not exist."""
+
+    @abstractmethod
+    def list_names(self) -> List[str]:
+        """Return the names of all stored personas."""
+
+    @abstractmethod
+    def all_records(self) -> Dict[str, PersonaRecord]:
+        """Return every stored record keyed by persona name."""
+
+    @abstractmethod
+    def upsert_many(self, records: Iterable[PersonaRecord]) -> None:
+        """Insert or replace several records in a single write."""
+
+    @abstractmethod
+    def delete(self, name: str) -> bool:
+        """Delete a persona. Returns True if it existed."""
+
+    @abstractmethod
+    def find_by_skill(self, skill_name: str) -> List[str]:
+        """Return the names of all personas that use the given skill."""
+
+    def upsert(self, record: PersonaRecord) -> None:
+        """Insert or replace a single record."""
+        self.upsert_many([record])
+
+
+class JsonPersonaStore(PersonaStore):
+    """Persona records kept in a single ``personas.json`` file.
+
+    Reads are served from memory. Every write rewrites the whole file,
+    atomically, so this backend suits small, rarely edited data sets.
+    """
+
+    def __init__(self, data_dir: str | Path = "data"):
+        self.path = Path(data_dir) / "personas.json"
+        self._lock = threading.Lock()
+        with open(self.path, "r") as json_file:
+            self._records = PersonaRecords.model_validate_json(json_file.read())
+
+    def get(self, name: str) -> Optional[PersonaRecord]:
+        return self._records.root.get(name)
+
+    def list_names(self) -> List[str]:
+        return list(self._records.root.keys())
+
+    def all_records(self) -> Dict[str, PersonaRecord]:
+        return dict(self._records.root)
+
+    def upsert_many(self, records: Iterable[PersonaRecord]) -> None:
+        with self._lock:
+            updated = dict(self._records.root)
+            for record in records:
+                updated[record.name] = record
+            self._write(PersonaRecords(updated))
+
+    def delete(self, name: str) -> bool:
+        with self._lock:
+            if name not in self._records.root:
+                return False
+            updated = dict(self._records.root)
+            del updated[name]
+            self._write(PersonaRecords(updated))
+            return True
+
+    def find_by_skill(self, skill_name: str) -> List[str]:
+        return [
+            name
+            for name, record in self._records.root.items()
+            if skill_name in record.skill_names
+        ]
+
+    def _write(self, records: PersonaRecords) -> None:
+        fd, tmp_name = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as tmp_file:
+                json.dump(records.model_dump(mode="json"), tmp_file, indent=4)
+            os.replace(tmp_name, self.path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+        self._records = records
+
+
+class SqlitePersonaStore(PersonaStore):
+    """Persona records kept in a local SQLite database.
+
+    Lookups by persona name and by skill name are served from indexes, and
+    single personas can be updated without touching the rest of the data.
+    The database runs in WAL mode so several processes can read while one
+    writes.
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS personas (
+            name TEXT PRIMARY KEY,
+            sys_prompt TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS persona_skills (
+            persona_name TEXT NOT NULL
+                REFERENCES personas(name) ON DELETE CASCADE,
+            position INTEGER NOT NULL,
+            skill_name TEXT NOT NULL,
+            PRIMARY KEY (persona_name, position)
+        );
+        CREATE INDEX IF NOT EXISTS idx_persona_skills_skill
+            ON persona_skills (skill_name);
+    """
+
+    def __init__(self, db_path: str | Path, timeout: float = 30.0):
+        self.db_path = Path(db_path)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self.db_path, timeout=timeout, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA foreign_keys = ON")
+        if str(db_path) != ":memory:":
+            self._conn.execute("PRAGMA journal_mode = WAL")
+        with self._lock, self._conn:
+            self._conn.executescript(self._SCHEMA)
+
+    @classmethod
+    def from_json(
+        cls, data_dir: str | Path, db_path: str | Path
+    ) -> "SqlitePersonaStore":
+        """Create (or update) a database from an existing ``personas.json``."""
+        store = cls(db_path)
+        store.upsert_many(JsonPersonaStore(data_dir).all_records().values())
+        return store
+
+    def get(self, name: str) -> Optional[PersonaRecord]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT sys_prompt FROM personas WHERE name = ?", (name,)
+            ).fetchone()
+            if row is None:
+                return None
+            skill_rows = self._conn.execute(
+                "SELECT skill_name FROM persona_skills "
+                "WHERE persona_name = ? ORDER BY position",
+                (name,),
+            ).fetchall()
+        return PersonaRecord(
+            name=name, sys_prompt=row[0], skill_names=[r[0] for r in skill_rows]
+        )
+
+    def list_names(self) -> List[str]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT name FROM personas ORDER BY name"
+            ).fetchall()
+        return [r[0] for r in rows]
+
+    def all_records(self) -> Dict[str, PersonaRecord]:
+        with self._lock:
+            personas = self._conn.execute(
+                "SELECT name, sys_prompt FROM personas ORDER BY name"
+            ).fetchall()
+            skill_rows = self._conn.execute(
+                "SELECT persona_name, skill_name FROM persona_skills "
+                "ORDER BY persona_name, position"
+            ).fetchall()
+        skills: Dict[str, List[str]] = {}
+        for persona_name, skill_name in skill_rows:
+            skills.setdefault(persona_name, []).append(skill_name)
+        return {
+            name: PersonaRecord(
+                name=name, sys_prompt=sys_prompt, skill_names=skills.get(name, [])
+            )
+            for name, sys_prompt in personas
+        }
+
+    def upsert_many(self, records: Iterable[PersonaRecord]) -> None:
+        # The last record for a name wins, as in JsonPersonaStore.
+        records = list({r.name: r for r in records}.values())
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT INTO personas (name, sys_prompt) VALUES (?, ?) "
+                "ON CONFLICT(name) DO UPDATE SET sys_prompt = excluded.sys_prompt",
+                [(r.name, r.sys_prompt) for r in records],
+            )
+            self._conn.executemany(
+                "DELETE FROM persona_skills WHERE persona_name = ?",
+                [(r.name,) for r in records],
+            )
+            self._conn.executemany(
+                "INSERT INTO persona_skills (persona_name, position, skill_name) "
+                "VALUES (?, ?, ?)",
+                [
+                    (r.name, position, skill_name)
+                    for r in records
+                    for position, skill_name in enumerate(r.skill_names)
+                ],
+            )
+
+    def delete(self, name: str) -> bool:
+        with self._lock, self._conn:
+            cursor = self._conn.execute("DELETE FROM personas WHERE name = ?", (name,))
+        return cursor.rowcount > 0
+
+    def find_by_skill(self, skill_name: str) -> List[str]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT DISTINCT persona_name FROM persona_skills "
+                "WHERE skill_name = ? ORDER BY persona_name",
+                (skill_name,),
+            ).fetchall()
+        return [r[0] for r in rows]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,15 @@
+"""Shared fixtures for persona tests."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture
+def data_dir(tmp_path: Path) -> Path:
+    """Create a data directory with an empty ``personas.json``."""
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    (data_dir / "personas.json").write_text(json.dumps({}))
+    return data_dir
@@ -0,0 +1,189 @@
+"""Tests for PersonaRepository caching and skill invalidation."""
+
+from pathlib import Path
+
+import pytest
+from agent_skills import FileSystemSkillRegistry, Skill, SkillMetadata, SkillRegistry
+
+from personas import JsonPersonaStore, PersonaRepository, SqlitePersonaStore
+from personas.models import PersonaRecord
+
+
+def _write_skill(parent: Path, name: str, body: str = "Body.") -> Path:
+    skill_dir = parent / name
+    skill_dir.mkdir(parents=True, exist_ok=True)
+    (skill_dir / "SKILL.md").write_text(
+        f"---\nname: {name}\ndescription: Skill {name}.\n---\n{body}\n"
+    )
+    return skill_dir
+
+
+def _record(name: str, *skill_names: str) -> PersonaRecord:
+    return PersonaRecord(
+        name=name, sys_prompt=f"You are {name}.", skill_names=list(skill_names)
+    )
+
+
+@pytest.fixture
+def registry(tmp_path: Path) -> FileSystemSkillRegistry:
+    skills_dir = tmp_path / "skills"
+    for name in ("alpha", "beta", "gamma"):
+        _write_skill(skills_dir, name)
+    registry = FileSystemSkillRegistry()
+    registry.load_skills_from_directory(skills_dir)
+    return registry
+
+
+@pytest.fixture
+def repository(registry: FileSystemSkillRegistry, data_dir: Path) -> PersonaRepository:
+    JsonPersonaStore(data_dir).upsert_many(
+        [_record("one", "alpha"), _record("two", "alpha", "beta"), _record("three")]
+    )
+    return PersonaRepository(registry, str(data_dir))
+
+
+class TestSkillIndex:
+    def test_built_from_store(self, repository: PersonaRepository):
+        assert dict(repository.skill_index) == {
+            "alpha": frozenset({"one", "two"}),
+            "beta": frozenset({"two"}),
+        }
+        assert repository.personas_using_skill("alpha") == ["one", "two"]
+        assert repository.personas_using_skill("gamma") == []
+
+    def test_save_and_delete(self, repository: PersonaRepository):
+        repository.save_persona(_record("one", "gamma"))
+        assert repository.personas_using_skill("alpha") == ["two"]
+        assert repository.personas_using_skill("gamma") == ["one"]
+        assert repository.delete_persona("two") is True
+        assert "alpha" not in repository.skill_index
+        assert "beta" not in repository.skill_index
+
+
+class TestInvalidation:
+    def test_reload_invalidates_only_users(
+        self, repository: PersonaRepository, registry: FileSystemSkillRegistry
+    ):
+        before = {name: repository.get_persona(name) for name in ("one", "two")}
+        _write_skill(registry.get_skill("beta").path.parent, "beta", "New body.")
+        registry.reload_skill("beta")
+        assert repository.get_persona("one") is before["one"]
+        after = repository.get_persona("two")
+        assert after is not before["two"]
+        assert after.skills[1].instructions == "New body."
+
+    def test_invalidate_and_rerender(self, repository: PersonaRepository):
+        before = repository.get_persona("two")
+        assert repository.invalidate_skill("beta", rerender=True) == ["two"]
+        assert repository._personas["two"] is not before
+        assert repository.invalidate_skill("gamma") == []
+
+    def test_saving_drops_cached_persona(self, repository: PersonaRepository):
+        before = repository.get_persona("one")
+        repository.save_persona(_record("one", "alpha", "gamma"))
+        assert [s.metadata.name for s in repository.get_persona("one").skills] == [
+            "alpha",
+            "gamma",
+        ]
+        assert repository.get_persona("one") is not before
+
+    def test_listener_removed_with_registry_changes(
+        self, repository: PersonaRepository, registry: FileSystemSkillRegistry
+    ):
+        registry.remove_change_listener(repository.invalidate_skill)
+        before = repository.get_persona("one")
+        registry.reload_skill("alpha")
+        assert repository.get_persona("one") is before
+
+
+    def test_close_removes_listener(
+        self, repository: PersonaRepository, registry: FileSystemSkillRegistry
+    ):
+        repository.close()
+        repository.close()
+        before = repository.get_persona("one")
+        registry.reload_skill("alpha")
+        assert repository.get_persona("one") is before
+
+    def test_render_racing_a_save_is_not_cached(
+        self, repository: PersonaRepository, monkeypatch: pytest.MonkeyPatch
+    ):
+        render = repository._render
+
+        def render_then_save(record: PersonaRecord):
+            persona = render(record)
+            repository.save_persona(_record("one", "beta"))
+            return persona
+
+        monkeypatch.setattr(repository, "_render", render_then_save)
+        stale = repository.get_persona("one")
+        monkeypatch.undo()
+        assert [s.metadata.name for s in stale.skills] == ["alpha"]
+        assert repository.personas_using_skill("beta") == ["one", "two"]
+        assert [s.metadata.name for s in repository.get_persona("one").skills] == [
+            "beta"
+        ]
+
+
+class TestRecordsWrittenElsewhere:
+    def test_rendered_persona_is_indexed(
+        self, registry: FileSystemSkillRegistry, tmp_path: Path
+    ):
+        db_path = tmp_path / "personas.db"
+        repository = PersonaRepository(registry, store=SqlitePersonaStore(db_path))
+        other = SqlitePersonaStore(db_path)
+        other.upsert(_record("late", "beta"))
+        other.close()
+
+        before = repository.get_persona("late")
+        assert repository.personas_using_skill("beta") == ["late"]
+        registry.reload_skill("beta")
+        assert repository.get_persona("late") is not before
+
+    def test_registry_view(self, registry: FileSystemSkillRegistry, tmp_path: Path):
+        db_path = tmp_path / "personas.db"
+        repository = PersonaRepository(registry, store=SqlitePersonaStore(db_path))
+        other = SqlitePersonaStore(db_path)
+        other.upsert(_record("late", "beta", "gamma"))
+        other.close()
+
+        view = repository.get_registry("late")
+        assert view.skill_names == ["beta", "gamma"]
+        assert repository.get_registry("missing") is None
+
+
+class _MinimalRegistry(SkillRegistry):
+    """A backend written against the original interface, without super().__init__()."""
+
+    def __init__(self, skills: list[Skill]) -> None:
+        self._skills = {s.metadata.name: s for s in skills}
+
+    def get_skill(self, name: str) -> Skill | None:
+        return self._skills.get(name)
+
+    def list_skills(self) -> list[SkillMetadata]:
+        return [s.metadata for s in self._skills.values()]
+
+    def activate_skill(self, name: str) -> str:
+        return self._skills[name].instructions
+
+    def read_resource(self, skill_name: str, resource_type: str, file_path: str) -> str:
+        raise FileNotFoundError(file_path)
+
+    @property
+    def skill_names(self) -> list[str]:
+        return list(self._skills)
+
+    def __len__(self) -> int:
+        return len(self._skills)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._skills
+
+
+def test_custom_registry(registry: FileSystemSkillRegistry, data_dir: Path):
+    JsonPersonaStore(data_dir).upsert(_record("one", "alpha"))
+    custom = _MinimalRegistry([registry.get_skill("alpha")])
+    repository = PersonaRepository(custom, str(data_dir))
+    assert repository.get_persona("one").skills[0].metadata.name == "alpha"
+    assert custom.search_resources("anything") == []
@@ -0,0 +1,94 @@
+"""Tests for the persona storage backends."""
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from personas.models import PersonaRecord
+from personas.storage import JsonPersonaStore, PersonaStore, SqlitePersonaStore
+
+
+def _record(name: str, *skill_names: str) -> PersonaRecord:
+    return PersonaRecord(
+        name=name, sys_prompt=f"You are {name}.", skill_names=list(skill_names)
+    )
+
+
+@pytest.fixture(params=["json", "sqlite"])
+def store(request, data_dir: Path, tmp_path: Path) -> Iterator[PersonaStore]:
+    if request.param == "json":
+        yield JsonPersonaStore(data_dir)
+        return
+    store = SqlitePersonaStore(tmp_path / "personas.db")
+    yield store
+    store.close()
+
+
+class TestPersonaStore:
+    def test_round_trip(self, store: PersonaStore):
+        record = _record("analyst", "review", "clarify")
+        store.upsert(record)
+        assert store.get("analyst") == record
+        assert store.get("missing") is None
+        assert store.list_names() == ["analyst"]
+        assert store.all_records() == {"analyst": record}
+
+    def test_upsert_many_replaces_skills(self, store: PersonaStore):
+        store.upsert_many([_record("a", "x", "y"), _record("b", "y")])
+        store.upsert_many([_record("a", "z", "x"), _record("c")])
+        assert store.get("a").skill_names == ["z", "x"]
+        assert store.get("b").skill_names == ["y"]
+        assert store.get("c").skill_names == []
+        assert sorted(store.list_names()) == ["a", "b", "c"]
+
+    def test_upsert_many_last_record_wins(self, store: PersonaStore):
+        store.upsert_many([_record("a", "x", "y"), _record("b"), _record("a", "z")])
+        assert store.get("a") == _record("a", "z")
+        assert store.find_by_skill("x") == []
+        assert sorted(store.list_names()) == ["a", "b"]
+
+    def test_delete_cascades(self, store: PersonaStore):
+        store.upsert_many([_record("a", "x"), _record("b", "x")])
+        assert store.delete("a") is True
+        assert store.delete("a") is False
+        assert store.get("a") is None
+        assert store.find_by_skill("x") == ["b"]
+
+    def test_find_by_skill(self, store: PersonaStore):
+        store.upsert_many(
+            [_record("b", "x", "y"), _record("a", "x"), _record("c", "y")]
+        )
+        assert sorted(store.find_by_skill("x")) == ["a", "b"]
+        assert sorted(store.find_by_skill("y")) == ["b", "c"]
+        assert store.find_by_skill("z") == []
+
+
+class TestJsonPersonaStore:
+    def test_writes_persist(self, data_dir: Path):
+        JsonPersonaStore(data_dir).upsert(_record("a", "x"))
+        assert JsonPersonaStore(data_dir).get("a") == _record("a", "x")
+        assert [p.name for p in data_dir.iterdir()] == ["personas.json"]
+
+
+class TestSqlitePersonaStore:
+    def test_reopen(self, tmp_path: Path):
+        db_path = tmp_path / "personas.db"
+        store = SqlitePersonaStore(db_path)
+        store.upsert_many([_record("a", "x", "y"), _record("b")])
+        store.close()
+
+        reopened = SqlitePersonaStore(db_path)
+        assert reopened.all_records() == {
+            "a": _record("a", "x", "y"),
+            "b": _record("b"),
+        }
+        assert reopened.find_by_skill("y") == ["a"]
+        reopened.close()
+
+    def test_from_json(self, data_dir: Path, tmp_path: Path):
+        JsonPersonaStore(data_dir).upsert_many([_record("a", "x"), _record("b")])
+        store = SqlitePersonaStore.from_json(data_dir, tmp_path / "personas.db")
+        assert store.list_names() == ["a", "b"]
+        assert store.get("a") == _record("a", "x")
+        store.close()